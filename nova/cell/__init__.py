@@ -10,12 +10,22 @@ from nova.cell.controllers import (
 )
 from nova.cell.motion_group import MotionGroup
 from nova.cell.motion_group_models import MotionGroupModel
+from nova.cell.plan_cache import (
+    DirectoryPlanCacheBackend,
+    InMemoryPlanCacheBackend,
+    PlanCache,
+    PlanCacheBackend,
+)
 
 __all__ = [
     "Cell",
     "Controller",
     "MotionGroup",
     "MotionGroupModel",
+    "PlanCache",
+    "PlanCacheBackend",
+    "InMemoryPlanCacheBackend",
+    "DirectoryPlanCacheBackend",
     "yaskawa_controller",
     "fanuc_controller",
     "universal_robots_controller",
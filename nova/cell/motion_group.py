@@ -1,8 +1,9 @@
 import asyncio
 import logging
+import time
 from contextlib import aclosing
 from functools import partial
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterator, Awaitable, Callable, Literal, Sequence, TypeVar
 
 import numpy as np
 
@@ -10,17 +11,29 @@ from nova import api
 from nova.actions import Action, CombinedActions, MovementController, MovementControllerContext
 from nova.actions.io import WriteAction
 from nova.actions.mock import WaitAction
-from nova.actions.motions import CartesianPTP, Circular, CollisionFreeMotion, Linear
-from nova.config import ENABLE_TRAJECTORY_TUNING
+from nova.actions.motions import (
+    CartesianPTP,
+    Circular,
+    CollisionFreeMotion,
+    JointPTP,
+    Linear,
+    Motion,
+)
+from nova.config import (
+    ENABLE_TRAJECTORY_TUNING,
+    MOTION_GROUP_DESCRIPTION_CACHE_TTL,
+    TRAJECTORY_ID_CACHE_SIZE,
+)
 from nova.core.gateway import ApiGateway
 from nova.exceptions import LoadPlanFailed, NoInverseKinematicsSolutionFound, PlanTrajectoryFailed
-from nova.types import Pose, RobotState
-from nova.types.state import MotionState, motion_group_state_to_motion_state
+from nova.types import Pose, RobotState, TrajectoryArray
+from nova.types.state import MotionStateView, motion_group_state_to_motion_state_view
 from nova.utils.collision_setup import (
     get_safety_collision_setup_from_motion_group_description,
     validate_collision_setups,
 )
 from nova.utils.joint_trajectory import combine_trajectories
+from nova.utils.kinematics import DHKinematics
 from nova.utils.motion_group_setup import (
     clamp_limit_set_to_max,
     get_joint_position_limits_from_motion_group_setup,
@@ -29,11 +42,27 @@ from nova.utils.motion_group_setup import (
 )
 
 from .movement_controller import move_forward
+from .plan_cache import PlanCache, plan_cache_key
 from .robot_cell import AbstractRobot
+from .state_stream_hub import motion_group_state_hub
+from .trajectory_id_cache import (
+    TrajectoryIdCache,
+    controller_trajectory_id_cache,
+    trajectory_id_cache_key,
+)
 from .tuner import TrajectoryTuner
 
 MAX_JOINT_VELOCITY_PREPARE_MOVE = 0.2
 START_LOCATION_OF_MOTION = 0.0
+# Number of poses/joint configurations sent per kinematics request by the *_many methods
+KINEMATICS_CHUNK_SIZE = 1000
+# Number of kinematics requests the *_many methods keep in flight at the same time
+KINEMATICS_MAX_CONCURRENCY = 4
+
+_ZERO_VECTOR = (0.0, 0.0, 0.0)
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 logger = logging.getLogger(__name__)
@@ -63,6 +92,74 @@ def split_actions_into_batches(actions: list[Action]) -> list[list[Action]]:
     return batches
 
 
+def _known_end_joints(
+    batch: list[Action], start_joint_position: tuple[float, ...] | None
+) -> tuple[float, ...] | None:
+    """Return the joint position a batch ends in if it is known before planning, else None.
+
+    This is the case when the batch ends in a joint-space target (a joint PTP or a collision free
+    motion with a joint target) or does not move the robot at all (waits, IO writes).
+    """
+    if isinstance(batch[0], CollisionFreeMotion):
+        return batch[0].target if isinstance(batch[0].target, tuple) else None
+
+    motions = [action for action in batch if isinstance(action, Motion)]
+    if not motions:
+        return start_joint_position
+    last_motion = motions[-1]
+    if isinstance(last_motion, JointPTP) and isinstance(last_motion.target, tuple):
+        return last_motion.target
+    return None
+
+
+def _group_batches_by_known_start(
+    batches: list[list[Action]], start_joint_position: tuple[float, ...]
+) -> list[tuple[tuple[float, ...], list[list[Action]]]]:
+    """Group consecutive batches into chains that can be planned independently of each other.
+
+    A new chain starts at every batch whose start joint position is known before planning,
+    see :func:`_known_end_joints`. Batches within a chain depend on the planned end of their
+    predecessor and have to be planned sequentially.
+    """
+    groups: list[tuple[tuple[float, ...], list[list[Action]]]] = []
+    known_start: tuple[float, ...] | None = start_joint_position
+    for batch in batches:
+        if known_start is not None:
+            groups.append((known_start, [batch]))
+        else:
+            groups[-1][1].append(batch)
+        known_start = _known_end_joints(batch, known_start)
+    return groups
+
+
+async def _map_chunked(
+    items: Sequence[T],
+    chunk_size: int,
+    max_concurrency: int,
+    fn: Callable[[Sequence[T]], Awaitable[list[R]]],
+) -> list[R]:
+    """Apply ``fn`` to consecutive chunks of ``items`` concurrently and concatenate the results.
+
+    At most ``max_concurrency`` calls of ``fn`` run at the same time. The order of the results
+    matches the order of ``items``.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(chunk: Sequence[T]) -> list[R]:
+        async with semaphore:
+            return await fn(chunk)
+
+    chunk_results = await asyncio.gather(
+        *(run(items[i : i + chunk_size]) for i in range(0, len(items), chunk_size))
+    )
+    return [result for chunk_result in chunk_results for result in chunk_result]
+
+
 def _move_close_to_reference(
     joint_position: np.ndarray,
     reference_position: np.ndarray,
@@ -125,22 +222,37 @@ def _with_collision_setup(
 ) -> api.models.MotionGroupSetup:
     """Return a copy of the setup with ``collision_setup`` registered under ``key``.
 
-    The input setup is deep-copied so the caller's instance is not mutated. The copy is
-    intentionally a deep copy even though collision scenes can be large, because we must not
-    create a side effect on the provided motion group setup.
+    Collision scenes can be large, so this is a copy-on-write: only the setup and its mapping of
+    collision setups are copied, the collision setups themselves (colliders, meshes, convex
+    hulls) are shared with the caller's setup. Neither is mutated.
     """
-    motion_group_setup = motion_group_setup.model_copy(deep=True)
-    if motion_group_setup.collision_setups is None:
-        motion_group_setup.collision_setups = api.models.CollisionSetups({})
+    collision_setups = (
+        dict(motion_group_setup.collision_setups.root)
+        if motion_group_setup.collision_setups is not None
+        else {}
+    )
     if collision_setup is not None:
-        motion_group_setup.collision_setups.root[key] = collision_setup
-    return motion_group_setup
+        collision_setups[key] = collision_setup
+    return motion_group_setup.model_copy(
+        update={"collision_setups": api.models.CollisionSetups(collision_setups)}
+    )
 
 
 class MotionGroup(AbstractRobot):
     """Manages motion planning and execution within a specified motion group."""
 
-    def __init__(self, api_client: ApiGateway, cell: str, controller_id: str, motion_group_id: str):
+    def __init__(
+        self,
+        api_client: ApiGateway,
+        cell: str,
+        controller_id: str,
+        motion_group_id: str,
+        description_cache_ttl: float = MOTION_GROUP_DESCRIPTION_CACHE_TTL,
+        plan_cache: PlanCache | None = None,
+        collision_free_candidate_concurrency: int = 1,
+        collision_free_candidate_selection: Literal["best_ranked", "shortest"] = "best_ranked",
+        trajectory_id_cache_size: int = TRAJECTORY_ID_CACHE_SIZE,
+    ):
         """
         Initializes a new MotionGroup instance.
 
@@ -148,12 +260,42 @@ class MotionGroup(AbstractRobot):
             api_client (ApiGateway): The API gateway through which motion commands are sent.
             cell (str): The name or identifier of the robotic cell.
             motion_group_id (str): The identifier of the motion group.
+            description_cache_ttl (float): Seconds a fetched motion group description is reused
+                before it is requested again. 0 disables caching.
+            plan_cache (PlanCache | None): Cache for planned trajectories. Planning results are
+                not cached if None.
+            collision_free_candidate_concurrency (int): How many inverse kinematics solutions a
+                collision free motion with a pose target plans towards at the same time. 1 tries
+                one solution after another.
+            collision_free_candidate_selection (Literal["best_ranked", "shortest"]): Which
+                trajectory to use when several solutions are planned concurrently:
+                ``"best_ranked"`` takes the reachable solution closest to the start joints,
+                ``"shortest"`` the trajectory with the shortest duration.
+            trajectory_id_cache_size (int): Number of uploaded trajectories remembered per
+                controller. Executing an identical trajectory with the same TCP again reuses the
+                uploaded one as long as the controller still has it. 0 uploads every time.
         """
+        if collision_free_candidate_concurrency < 1:
+            raise ValueError("collision_free_candidate_concurrency must be at least 1")
         self._api_client = api_client
         self._cell = cell
         self._controller_id = controller_id
         self._motion_group_id = motion_group_id
         self._current_motion: str | None = None
+        self._description_cache_ttl = description_cache_ttl
+        self._description: api.models.MotionGroupDescription | None = None
+        self._description_fetched_at = 0.0
+        self._description_lock = asyncio.Lock()
+        self._plan_cache = plan_cache
+        self._collision_free_candidate_concurrency = collision_free_candidate_concurrency
+        self._collision_free_candidate_selection = collision_free_candidate_selection
+        self._trajectory_id_cache: TrajectoryIdCache | None = (
+            controller_trajectory_id_cache(
+                api_client, cell, controller_id, max_entries=trajectory_id_cache_size
+            )
+            if trajectory_id_cache_size > 0
+            else None
+        )
         super().__init__(id=motion_group_id)
 
     @property
@@ -169,6 +311,21 @@ class MotionGroup(AbstractRobot):
     def current_motion(self) -> str | None:
         return self._current_motion
 
+    @property
+    def plan_cache(self) -> PlanCache | None:
+        """The cache for planned trajectories, None if planning results are not cached.
+
+        Identical planning requests (same actions, TCP, start joint position and motion group
+        setup) are answered from the cache without calling the planner. The key includes the
+        start joint position, so pass ``start_joint_position`` explicitly for cycles that are
+        replayed from the same position.
+        """
+        return self._plan_cache
+
+    @plan_cache.setter
+    def plan_cache(self, plan_cache: PlanCache | None) -> None:
+        self._plan_cache = plan_cache
+
     def _supports_direct_non_motion_actions(self, actions: list[Action]) -> bool:
         return len(actions) > 0 and all(
             isinstance(action, (WaitAction, WriteAction)) for action in actions
@@ -194,11 +351,39 @@ class MotionGroup(AbstractRobot):
                     io_value=[action.to_api_model()],  # ty: ignore[invalid-argument-type]
                 )
 
-    # TODO: does this needs to be cached?
+    def _cached_description(self) -> api.models.MotionGroupDescription | None:
+        if self._description is None:
+            return None
+        if time.monotonic() - self._description_fetched_at >= self._description_cache_ttl:
+            return None
+        return self._description
+
     async def _fetch_motion_group_description(self) -> api.models.MotionGroupDescription:
-        return await self._api_client.motion_group_api.get_motion_group_description(
-            cell=self._cell, controller=self._controller_id, motion_group=self.id
-        )
+        if (description := self._cached_description()) is not None:
+            return description
+
+        # Concurrent callers wait for the fetch in flight instead of issuing their own request
+        async with self._description_lock:
+            if (description := self._cached_description()) is not None:
+                return description
+
+            description = await self._api_client.motion_group_api.get_motion_group_description(
+                cell=self._cell, controller=self._controller_id, motion_group=self.id
+            )
+            if self._description_cache_ttl > 0:
+                self._description = description
+                self._description_fetched_at = time.monotonic()
+            return description
+
+    def invalidate(self) -> None:
+        """Drop the cached motion group description.
+
+        The next call that needs the description (e.g. :meth:`get_setup`, :meth:`tcps`,
+        :meth:`get_mounting`) fetches it again from the API. Call this after changing the
+        motion group configuration (TCPs, payloads, mounting) outside of this instance.
+        """
+        self._description = None
+        self._description_fetched_at = 0.0
 
     async def get_description(self) -> api.models.MotionGroupDescription:
         """Get the motion group description.
@@ -208,6 +393,18 @@ class MotionGroup(AbstractRobot):
         """
         return await self._fetch_motion_group_description()
 
+    async def _joint_count(self, motion_group_setup: api.models.MotionGroupSetup) -> int:
+        """Return the number of joints from the limits of the setup or the description."""
+        if motion_group_setup.global_limits is not None and motion_group_setup.global_limits.joints:
+            return len(motion_group_setup.global_limits.joints)
+        description = await self._fetch_motion_group_description()
+        if description.dh_parameters:
+            return len(description.dh_parameters)
+        auto_limits = description.operation_limits.auto_limits
+        if auto_limits is not None and auto_limits.joints:
+            return len(auto_limits.joints)
+        raise ValueError(f"The number of joints of motion group '{self.id}' is unknown")
+
     async def get_model(self) -> str:
         """Get the motion group model.
 
@@ -295,6 +492,9 @@ class MotionGroup(AbstractRobot):
             return payload_override
         if isinstance(payload_override, str):
             self._log_payload_override(payload_override)
+            if payload_override not in payloads:
+                # The payload may have been registered after the description was cached
+                payloads = await self._refetch_payloads(motion_group_description)
             return payloads[payload_override]
 
         # Rule 2: TCP-name convention
@@ -308,6 +508,9 @@ class MotionGroup(AbstractRobot):
             logger.debug(f"Could not fetch motion group state for payload resolution: {e}")
             state = None
         active_id = state.payload if state is not None else None
+        if active_id is not None and active_id not in payloads:
+            # The controller selected a payload the cached description does not know yet
+            payloads = await self._refetch_payloads(motion_group_description)
         if active_id is not None and active_id in payloads:
             return payloads[active_id]
 
@@ -318,6 +521,16 @@ class MotionGroup(AbstractRobot):
         # Rule 5: nothing
         return None
 
+    async def _refetch_payloads(
+        self, motion_group_description: api.models.MotionGroupDescription
+    ) -> dict[str, api.models.Payload]:
+        """Invalidate a stale cached description and return the freshly fetched payloads."""
+        if motion_group_description is not self._description:
+            # The description was not served from the cache, refetching would not help
+            return motion_group_description.payloads or {}
+        self.invalidate()
+        return (await self._fetch_motion_group_description()).payloads or {}
+
     async def payloads(self) -> dict[str, api.models.Payload]:
         """Return the payloads registered on the controller for this motion group.
 
@@ -426,7 +639,7 @@ class MotionGroup(AbstractRobot):
         return response.joints  # ty: ignore[invalid-return-type]
 
     async def forward_kinematics(
-        self, joints: list[tuple[float, ...]], tcp: str | None
+        self, joints: list[tuple[float, ...]], tcp: str | None, local: bool = False
     ) -> list[Pose]:
         """Get the forward kinematics of the motion group.
 
@@ -434,6 +647,9 @@ class MotionGroup(AbstractRobot):
             joints: The joint configurations to compute poses for.
             tcp: The TCP to apply. If None, no TCP offset is applied and the returned
                 poses are the flange poses.
+            local: Compute the poses locally from the DH parameters of the motion group
+                description instead of calling the kinematics API. See
+                :class:`nova.utils.kinematics.DHKinematics` to compute poses as arrays.
 
         Returns:
             list[Pose]: The forward kinematics of the motion group. Empty list if not available.
@@ -441,6 +657,11 @@ class MotionGroup(AbstractRobot):
         if len(joints) == 0:
             raise ValueError("Provide at least one joint configuration")
 
+        if local:
+            kinematics = await self.get_kinematics()
+            tcp_offset_pose = await self.tcp_offset(tcp) if tcp is not None else None
+            return [Pose(tuple(pose)) for pose in kinematics.tcp_poses(joints, tcp_offset_pose)]
+
         joint_positions = [api.models.DoubleArray(list(joint_config)) for joint_config in joints]
 
         tcp_offset = (await self.tcp_offset(tcp)).to_api_model() if tcp is not None else None
@@ -462,6 +683,153 @@ class MotionGroup(AbstractRobot):
 
         return [Pose(tcp_pose) for tcp_pose in response.tcp_poses]
 
+    async def get_kinematics(self) -> DHKinematics:
+        """Get the local forward kinematics model of the motion group.
+
+        The model is built from the DH parameters, mounting and offsets of the motion group
+        description and computes flange and TCP poses for many joint configurations at once
+        without calling the API.
+
+        Returns:
+            DHKinematics: The kinematics of the motion group.
+
+        Raises:
+            ValueError: If the motion group description has no DH parameters.
+        """
+        return DHKinematics.from_motion_group_description(
+            await self._fetch_motion_group_description()
+        )
+
+    async def inverse_kinematics_many(
+        self,
+        poses: Sequence[Pose] | np.ndarray,
+        tcp: str,
+        motion_group_setup: api.models.MotionGroupSetup | None = None,
+        chunk_size: int = KINEMATICS_CHUNK_SIZE,
+        max_concurrency: int = KINEMATICS_MAX_CONCURRENCY,
+    ) -> list[np.ndarray]:
+        """Do inverse kinematics for a large number of poses.
+
+        The motion group setup, model, mounting and TCP offset are resolved once. The poses are
+        split into requests of ``chunk_size`` poses which are sent concurrently.
+
+        Args:
+            poses: The target poses, either as a sequence of :class:`Pose` or as an (N, 6) array
+                of position and rotation vector.
+            tcp: The TCP to use for the calculations.
+            motion_group_setup: The motion group setup (joint limits, collision setups) to use.
+                Fetched for ``tcp`` if None.
+            chunk_size: The maximum number of poses per request.
+            max_concurrency: The maximum number of requests in flight at the same time.
+
+        Returns:
+            list[np.ndarray]: One (S, J) array per pose with all S found joint solutions. S is
+                0 when no solution was found for the pose. Empty if no poses were given.
+        """
+        api_poses = [
+            pose.to_api_model() if isinstance(pose, Pose) else Pose(tuple(pose)).to_api_model()
+            for pose in poses
+        ]
+        if len(api_poses) == 0:
+            return []
+
+        motion_group_setup = motion_group_setup or await self.get_setup(tcp)
+        tcp_offset = await self.tcp_offset(tcp)
+        motion_group_model = await self.get_model()
+        mounting = await self.get_mounting()
+        request = api.models.InverseKinematicsRequest(
+            motion_group_model=api.models.MotionGroupModel(motion_group_model),
+            tcp_poses=[],
+            tcp_offset=tcp_offset.to_api_model(),
+            mounting=mounting.to_api_model() if mounting is not None else None,
+            joint_position_limits=get_joint_position_limits_from_motion_group_setup(
+                motion_group_setup
+            ),
+            collision_setups=motion_group_setup.collision_setups,
+        )
+
+        joint_count: int | None = None
+
+        async def no_solutions() -> np.ndarray:
+            nonlocal joint_count
+            if joint_count is None:
+                joint_count = await self._joint_count(motion_group_setup)
+            return np.empty((0, joint_count))
+
+        async def solve(chunk: Sequence[api.models.Pose]) -> list[np.ndarray]:
+            response = await self._api_client.kinematics_api.inverse_kinematics(
+                cell=self._cell,
+                inverse_kinematics_request=request.model_copy(update={"tcp_poses": list(chunk)}),
+            )
+            return [
+                np.asarray(solutions, dtype=float).reshape(len(solutions), -1)
+                if len(solutions) > 0
+                else await no_solutions()
+                for solutions in response.joints
+            ]
+
+        return await _map_chunked(api_poses, chunk_size, max_concurrency, solve)
+
+    async def forward_kinematics_many(
+        self,
+        joints: Sequence[Sequence[float]] | np.ndarray,
+        tcp: str | None,
+        chunk_size: int = KINEMATICS_CHUNK_SIZE,
+        max_concurrency: int = KINEMATICS_MAX_CONCURRENCY,
+    ) -> np.ndarray:
+        """Get the forward kinematics for a large number of joint configurations.
+
+        The model, mounting and TCP offset are resolved once. The joint configurations are split
+        into requests of ``chunk_size`` configurations which are sent concurrently.
+
+        Args:
+            joints: The joint configurations, either as a sequence or as an (N, J) array.
+            tcp: The TCP to apply. If None, the flange poses are returned.
+            chunk_size: The maximum number of joint configurations per request.
+            max_concurrency: The maximum number of requests in flight at the same time.
+
+        Returns:
+            np.ndarray: An (N, 6) array with the position and rotation vector of each pose.
+                Of shape (0, 6) if no joint configurations were given.
+        """
+        joint_positions = [
+            api.models.DoubleArray([float(joint) for joint in joint_config])
+            for joint_config in joints
+        ]
+        if len(joint_positions) == 0:
+            return np.empty((0, 6))
+
+        tcp_offset = (await self.tcp_offset(tcp)).to_api_model() if tcp is not None else None
+        motion_group_model = await self.get_model()
+        mounting = await self.get_mounting()
+        request = api.models.ForwardKinematicsRequest(
+            motion_group_model=api.models.MotionGroupModel(motion_group_model),
+            joint_positions=[],
+            tcp_offset=tcp_offset,
+            mounting=mounting.to_api_model() if mounting is not None else None,
+        )
+
+        async def solve(chunk: Sequence[api.models.DoubleArray]) -> list[list[float]]:
+            response = await self._api_client.kinematics_api.forward_kinematics(
+                cell=self._cell,
+                forward_kinematics_request=request.model_copy(
+                    update={"joint_positions": list(chunk)}
+                ),
+            )
+            if len(response.tcp_poses) != len(chunk):
+                raise ValueError(
+                    f"Forward kinematics returned {len(response.tcp_poses)} poses for "
+                    f"{len(chunk)} joint configurations"
+                )
+            # skip building Pose models, the rows go straight into an array
+            return [
+                [*(tcp_pose.position or _ZERO_VECTOR), *(tcp_pose.orientation or _ZERO_VECTOR)]
+                for tcp_pose in response.tcp_poses
+            ]
+
+        poses = await _map_chunked(joint_positions, chunk_size, max_concurrency, solve)
+        return np.asarray(poses, dtype=float)
+
     async def open(self):
         # TODO if there is no explicit motion group activation, what should we do here?
         # maybe we set the mode to control mode? But this is not needed (implicitly done by the trajectory execution)
@@ -518,21 +886,36 @@ class MotionGroup(AbstractRobot):
 
         This method provides a real-time stream of robot state information including
         joint positions and TCP pose data for the motion group.
+
+        All consumers of the same motion group share a single upstream subscription (see
+        :class:`~nova.cell.state_stream_hub.StateStreamHub`), which is closed once the last
+        consumer stops iterating.
+
         Args:
             response_rate_msecs (int | None): The rate at which state updates are streamed
                                              in milliseconds. Defaults to None for maximum rate.
         """
-        response_stream = self._api_client.motion_group_api.stream_motion_group_state(
-            cell=self._cell,
-            controller=self._controller_id,
-            motion_group=self.id,
-            response_rate=response_rate_msecs,
-        )
+        hub = motion_group_state_hub(self._api_client, self._cell, self._controller_id, self.id)
+        min_interval = response_rate_msecs / 1000 if response_rate_msecs else None
+        response_stream = hub.subscribe(self._open_state_stream, min_interval=min_interval)
 
         async with aclosing(response_stream) as response_stream:
             async for response in response_stream:
                 yield response
 
+    def _open_state_stream(
+        self, interval: float | None
+    ) -> AsyncIterator[api.models.MotionGroupState]:
+        """Open the upstream state stream at the fastest rate of its consumers.
+
+        Without an interval the rate is not passed, so the API streams at its default rate.
+        Each consumer downsamples the stream to its own rate.
+        """
+        rate = {"response_rate": max(1, round(interval * 1000))} if interval is not None else {}
+        return self._api_client.motion_group_api.stream_motion_group_state(
+            cell=self._cell, controller=self._controller_id, motion_group=self.id, **rate
+        )
+
     async def joints(self) -> tuple[float, ...]:
         """Returns the current joint positions of the motion group."""
         return (await self.get_state()).joints
@@ -637,6 +1020,8 @@ class MotionGroup(AbstractRobot):
         # TODO: this is a workaround to wait for the TCP to be created (restart of the virtual controller?)
         t = timeout
         while t > 0:
+            # the cached description does not contain the new TCP yet
+            self.invalidate()
             try:
                 tcps = self._tcps_as_dict(await self.tcps())
                 return tcps[tcp.id]
@@ -653,6 +1038,35 @@ class MotionGroup(AbstractRobot):
 
     async def _load_planned_motion(
         self, joint_trajectory: api.models.JointTrajectory, tcp: str | None
+    ) -> str:
+        if self._trajectory_id_cache is None:
+            return await self._add_trajectory(joint_trajectory, tcp)
+
+        key = trajectory_id_cache_key(self.id, joint_trajectory, tcp)
+        trajectory_id = self._trajectory_id_cache.get(key)
+        if trajectory_id is not None:
+            if await self._is_trajectory_loaded(trajectory_id):
+                logger.debug(f"Reusing uploaded trajectory {trajectory_id}")
+                return trajectory_id
+            # the controller dropped the trajectory (e.g. after a restart), upload it again
+            self._trajectory_id_cache.discard(key)
+
+        trajectory_id = await self._add_trajectory(joint_trajectory, tcp)
+        self._trajectory_id_cache.put(key, trajectory_id)
+        return trajectory_id
+
+    async def _is_trajectory_loaded(self, trajectory_id: str) -> bool:
+        try:
+            response = await self._api_client.trajectory_caching_api.list_trajectories(
+                cell=self._cell, controller=self._controller_id
+            )
+        except Exception as e:
+            logger.debug(f"Failed to list uploaded trajectories, uploading again: {e}")
+            return False
+        return trajectory_id in (response.trajectories or [])
+
+    async def _add_trajectory(
+        self, joint_trajectory: api.models.JointTrajectory, tcp: str | None
     ) -> str:
         load_plan_response = await self._api_client.trajectory_caching_api.add_trajectory(
             cell=self._cell,
@@ -818,29 +1232,91 @@ class MotionGroup(AbstractRobot):
                     motion_group_setup.global_limits, controller_max_limits
                 )
 
-        for best_joint_solution in best_joint_solutions:
-            try:
-                # try to plan the trajectory for the current joint solution
-                response = await self._api_client.trajectory_planning_api.plan_collision_free(
-                    cell=self._cell,
-                    plan_collision_free_request=api.models.PlanCollisionFreeRequest(
-                        motion_group_setup=motion_group_setup,
-                        start_joint_position=api.models.DoubleArray(list(start_joint_position)),
-                        target=api.models.DoubleArray(list(best_joint_solution)),
-                        algorithm=action.algorithm,
-                    ),
-                )
+        async def plan_to(target_joints: tuple[float, ...]) -> api.models.JointTrajectory:
+            response = await self._api_client.trajectory_planning_api.plan_collision_free(
+                cell=self._cell,
+                plan_collision_free_request=api.models.PlanCollisionFreeRequest(
+                    motion_group_setup=motion_group_setup,
+                    start_joint_position=api.models.DoubleArray(list(start_joint_position)),
+                    target=api.models.DoubleArray(list(target_joints)),
+                    algorithm=action.algorithm,
+                ),
+            )
 
-                if isinstance(response.response, api.models.PlanCollisionFreeFailedResponse):
-                    raise PlanTrajectoryFailed(error=response.response, motion_group_id=self.id)
+            if isinstance(response.response, api.models.PlanCollisionFreeFailedResponse):
+                raise PlanTrajectoryFailed(error=response.response, motion_group_id=self.id)
 
-                if isinstance(response.response, api.models.JointTrajectory):
-                    return response.response
-            except Exception as e:
-                logger.warning(
-                    f"Failed to plan collision free trajectory for joint solution {best_joint_solution}: {e}"
-                )
-                continue
+            if not isinstance(response.response, api.models.JointTrajectory):
+                raise ValueError(f"Unexpected response type {type(response.response).__name__}")
+            return response.response
+
+        if self._collision_free_candidate_concurrency <= 1:
+            for best_joint_solution in best_joint_solutions:
+                try:
+                    # try to plan the trajectory for the current joint solution
+                    return await plan_to(best_joint_solution)
+                except Exception as e:
+                    self._log_collision_free_candidate_failure(best_joint_solution, e)
+
+            raise ValueError("No collision free trajectory found")
+
+        return await self._plan_collision_free_candidates_concurrently(
+            best_joint_solutions, plan_to
+        )
+
+    @staticmethod
+    def _log_collision_free_candidate_failure(
+        joint_solution: tuple[float, ...], error: BaseException
+    ) -> None:
+        logger.warning(
+            f"Failed to plan collision free trajectory for joint solution {joint_solution}: {error}"
+        )
+
+    async def _plan_collision_free_candidates_concurrently(
+        self,
+        candidates: list[tuple[float, ...]],
+        plan_to: Callable[[tuple[float, ...]], Awaitable[api.models.JointTrajectory]],
+    ) -> api.models.JointTrajectory:
+        """Plan towards several joint solution candidates at once.
+
+        At most ``collision_free_candidate_concurrency`` candidates are planned at the same time,
+        in the order given by ``candidates`` (closest to the start joints first).
+
+        With the ``"best_ranked"`` selection the result for the best-ranked candidate that can be
+        reached is returned, the same result the sequential search returns. Planning of the
+        remaining candidates is cancelled as soon as that result is known. With the
+        ``"shortest"`` selection all candidates are planned and the trajectory with the shortest
+        duration is returned.
+        """
+        semaphore = asyncio.Semaphore(self._collision_free_candidate_concurrency)
+
+        async def attempt(candidate: tuple[float, ...]) -> api.models.JointTrajectory:
+            async with semaphore:
+                return await plan_to(candidate)
+
+        tasks = [asyncio.create_task(attempt(candidate)) for candidate in candidates]
+        try:
+            if self._collision_free_candidate_selection == "shortest":
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+                trajectories = []
+                for candidate, result in zip(candidates, results):
+                    if isinstance(result, BaseException):
+                        self._log_collision_free_candidate_failure(candidate, result)
+                    else:
+                        trajectories.append(result)
+                if trajectories:
+                    return min(trajectories, key=lambda trajectory: trajectory.times[-1])
+            else:
+                for candidate, task in zip(candidates, tasks):
+                    try:
+                        return await task
+                    except Exception as e:
+                        self._log_collision_free_candidate_failure(candidate, e)
+        finally:
+            for task in tasks:
+                task.cancel()
+            # don't leave the cancelled planner requests running in the background
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         raise ValueError("No collision free trajectory found")
 
@@ -874,43 +1350,99 @@ class MotionGroup(AbstractRobot):
             tcp=tcp, motion_group_setup=motion_group_setup, payload_override=payload_override
         )
 
-        # TODO: can be done in parallel, would be a big performance boost
-        all_trajectories = []
-        for batch in split_actions_into_batches(actions):
-            if len(batch) == 0:
-                raise ValueError("Empty batch of actions")
+        plan = partial(
+            self._plan_with_setup,
+            actions=actions,
+            tcp=tcp,
+            start_joint_position=current_joints,
+            motion_group_setup=motion_group_setup,
+        )
+        if self._plan_cache is None:
+            return await plan()
+
+        key = plan_cache_key(
+            actions=actions,
+            tcp=tcp,
+            start_joint_position=current_joints,
+            motion_group_setup=motion_group_setup,
+        )
+        return await self._plan_cache.get_or_plan(key, plan)
 
+    async def _plan_with_setup(
+        self,
+        actions: list[Action],
+        tcp: str | None,
+        start_joint_position: tuple[float, ...],
+        motion_group_setup: api.models.MotionGroupSetup,
+    ) -> api.models.JointTrajectory:
+        """Plan the actions from the given start joints with an already resolved setup."""
+        batches = split_actions_into_batches(actions)
+        if any(len(batch) == 0 for batch in batches):
+            raise ValueError("Empty batch of actions")
+
+        # Batches whose start joints are known upfront don't depend on the planning result of
+        # their predecessor, so these chains are planned concurrently and stitched afterwards.
+        groups = _group_batches_by_known_start(batches, start_joint_position)
+        tasks = [
+            asyncio.create_task(
+                self._plan_batches(
+                    batches=group_batches,
+                    tcp=tcp,
+                    start_joint_position=group_start,
+                    motion_group_setup=motion_group_setup,
+                )
+            )
+            for group_start, group_batches in groups
+        ]
+        try:
+            group_trajectories = await asyncio.gather(*tasks)
+        finally:
+            # when one group fails, stop planning the others before raising
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        all_trajectories = [
+            trajectory for trajectories in group_trajectories for trajectory in trajectories
+        ]
+        return combine_trajectories(all_trajectories)
+
+    async def _plan_batches(
+        self,
+        batches: list[list[Action]],
+        tcp: str | None,
+        start_joint_position: tuple[float, ...],
+        motion_group_setup: api.models.MotionGroupSetup,
+    ) -> list[TrajectoryArray]:
+        """Plan the batches one after another, each starting where the previous one ended."""
+        current_joints = start_joint_position
+        all_trajectories = []
+        for batch in batches:
             if isinstance(batch[0], CollisionFreeMotion):
                 motion: CollisionFreeMotion = batch[0]
-                trajectory = await self._plan_collision_free(
+                planned = await self._plan_collision_free(
                     action=motion,
                     tcp=tcp,
                     start_joint_position=current_joints,
                     motion_group_setup=motion_group_setup,
                 )
-                all_trajectories.append(trajectory)
-                # the last joint position of this trajectory is the starting point for the next one
-
-                current_joints = tuple(trajectory.joint_positions[-1].root)
+                trajectory = TrajectoryArray.from_api_model(planned)
             elif isinstance(batch[0], WaitAction):
                 trajectory = self._build_wait_trajectory(
                     current_joints, batch[0].wait_for_in_seconds
                 )
-                all_trajectories.append(trajectory)
-                # the last joint position of this trajectory is the starting point for the next one
-                current_joints = tuple(trajectory.joint_positions[-1])
             else:
-                trajectory = await self._plan_with_collision_check(
+                planned = await self._plan_with_collision_check(
                     actions=batch,
                     tcp=tcp,
                     start_joint_position=current_joints,
                     motion_group_setup=motion_group_setup,
                 )
-                all_trajectories.append(trajectory)
-                # the last joint position of this trajectory is the starting point for the next one
-                current_joints = tuple(trajectory.joint_positions[-1])
-
-        return combine_trajectories(all_trajectories)
+                trajectory = TrajectoryArray.from_api_model(planned)
+            all_trajectories.append(trajectory)
+            # the last joint position of this trajectory is the starting point for the next one
+            current_joints = trajectory.end_joints
+        return all_trajectories
 
     async def _resolve_setup_for_plan(
         self,
@@ -926,40 +1458,28 @@ class MotionGroup(AbstractRobot):
             return motion_group_setup
 
         # Caller supplied both an explicit setup and a payload override;
-        # the explicit payload wins. Do not mutate the caller's setup.
-        motion_group_setup = motion_group_setup.model_copy(deep=True)
+        # the explicit payload wins. Do not mutate the caller's setup, the copy shares
+        # everything but the payload with it.
         if isinstance(payload_override, api.models.Payload):
             # Already a concrete Payload — no need to fetch the description.
             self._log_payload_override(payload_override.name)
-            motion_group_setup.payload = payload_override
+            payload = payload_override
         else:
             description = await self._fetch_motion_group_description()
-            motion_group_setup.payload = await self._resolve_payload(
+            payload = await self._resolve_payload(
                 payload_override=payload_override,
                 tcp_name=tcp,
                 motion_group_description=description,
             )
-        return motion_group_setup
+        return motion_group_setup.model_copy(update={"payload": payload})
 
     @staticmethod
     def _build_wait_trajectory(
         current_joints: tuple[float, ...], wait_time: float
-    ) -> api.models.JointTrajectory:
+    ) -> TrajectoryArray:
         """Build a trajectory that holds ``current_joints`` for ``wait_time`` seconds."""
-        # Waits generate a trajectory with the same joint position at each timestep.
-        # Use 50ms timesteps from 0 to wait_time.
-        timestep = 0.050  # 50ms timestep
-        num_steps = max(2, int(wait_time / timestep) + 1)  # Ensure at least 2 points
-
-        joint_positions = [api.models.Joints(list(current_joints)) for _ in range(num_steps)]
-        times = [i * timestep for i in range(num_steps)]
-        # Ensure the last timestep is exactly the wait duration
-        times[-1] = wait_time
-        return api.models.JointTrajectory(
-            joint_positions=joint_positions,
-            times=times,
-            locations=[api.models.Location(0.0) for _ in range(num_steps)],
-        )
+        # Waits generate a trajectory with the same joint position at each 50ms timestep
+        return TrajectoryArray.hold(current_joints, duration=wait_time, timestep=0.050)
 
     # TODO: refactor and simplify code, tests are already there
     async def _execute(
@@ -970,7 +1490,7 @@ class MotionGroup(AbstractRobot):
         movement_controller: MovementController | None,
         start_on_io: api.models.StartOnIO | None = None,
         pause_on_io: api.models.PauseOnIO | None = None,
-    ) -> AsyncGenerator[MotionState, None]:
+    ) -> AsyncGenerator[MotionStateView, None]:
         # This is the entrypoint for the trajectory tuning mode
         if ENABLE_TRAJECTORY_TUNING:
             logger.info("Entering trajectory tuning mode...")
@@ -978,7 +1498,7 @@ class MotionGroup(AbstractRobot):
                 async for motion_group_state in self._tune_trajectory(
                     joint_trajectory, tcp, actions
                 ):
-                    yield motion_group_state_to_motion_state(motion_group_state)
+                    yield motion_group_state_to_motion_state_view(motion_group_state)
             except (Exception, BaseException) as e:
                 logger.error(f"Trajectory tuning failed: {e}")
                 raise e
@@ -1028,7 +1548,7 @@ class MotionGroup(AbstractRobot):
 
             while (motion_group_state_ := await states.get()) is not SENTINEL:
                 assert isinstance(motion_group_state_, api.models.MotionGroupState)
-                yield motion_group_state_to_motion_state(motion_group_state_)
+                yield motion_group_state_to_motion_state_view(motion_group_state_)
 
             # when the execution task finished
             # task group will still wait for the monitoring task
@@ -60,6 +60,7 @@ from nova.actions.container import CombinedActions
 from nova.cell.movement_controller.trajectory_state_machine import TrajectoryExecutionMachine
 from nova.exceptions import InitMovementFailed
 from nova.types import ExecuteTrajectoryRequestStream, ExecuteTrajectoryResponseStream
+from nova.types.trajectory import TrajectoryArray
 from nova.utils import SourceLocation
 
 logger = logging.getLogger(__name__)
@@ -77,6 +78,7 @@ class OperationType(Enum):
         BACKWARD_TO: Move backward to a specific location.
         FORWARD_TO_NEXT_ACTION: Move forward to the start of the next action.
         BACKWARD_TO_PREVIOUS_ACTION: Move backward to the start of the previous action.
+        SEEK_TIME: Move to the location at a specific trajectory time.
         PAUSE: Pause the current movement.
     """
 
@@ -86,6 +88,7 @@ class OperationType(Enum):
     BACKWARD_TO = auto()
     FORWARD_TO_NEXT_ACTION = auto()
     BACKWARD_TO_PREVIOUS_ACTION = auto()
+    SEEK_TIME = auto()
     PAUSE = auto()
 
 
@@ -513,6 +516,8 @@ class TrajectoryCursor:
         """
         self.motion_id = motion_id
         self.joint_trajectory = joint_trajectory
+        # sorted arrays of the samples for binary search lookups between time, location and joints
+        self._trajectory_array = TrajectoryArray.from_api_model(joint_trajectory)
 
         # The planner only assigns trajectory location units to motion actions
         # (see nova.actions.container.CombinedActions.to_motion_command), so the
@@ -572,6 +577,36 @@ class TrajectoryCursor:
         assert getattr(self, "joint_trajectory", None) is not None
         return self.joint_trajectory.locations[-1].root
 
+    @property
+    def current_time(self) -> float:
+        """Trajectory time in seconds at the current location."""
+        return self.time_at_location(self._current_location)
+
+    @property
+    def time_remaining(self) -> float:
+        """Time in seconds from the current location to the end at full playback speed."""
+        return max(0.0, float(self._trajectory_array.times[-1]) - self.current_time)
+
+    def time_at_location(self, location: float) -> float:
+        """Trajectory time in seconds at which ``location`` is reached."""
+        return self._trajectory_array.time_at_location(location)
+
+    def location_at_time(self, time: float) -> float:
+        """Trajectory location at ``time`` seconds."""
+        return self._trajectory_array.location_at_time(time)
+
+    def sample_index_at_location(self, location: float) -> int:
+        """Index of the last trajectory sample at or before ``location``."""
+        return self._trajectory_array.index_at_location(location)
+
+    def joints_at_location(self, location: float) -> tuple[float, ...]:
+        """Joint position at ``location``, interpolated between the trajectory samples."""
+        return self._trajectory_array.joints_at_location(location)
+
+    def action_at_time(self, time: float) -> Action | None:
+        """The action executed at ``time`` seconds, or None if no actions."""
+        return self._action_at_location(self.location_at_time(time))
+
     @property
     def current_action_start(self) -> float:
         """Location where the current action begins (floor of current location)."""
@@ -914,6 +949,45 @@ class TrajectoryCursor:
             )
             return future
 
+    def seek_time(
+        self,
+        time: float,
+        playback_speed_in_percent: int | None = None,
+        start_on_io: api.models.StartOnIO | None = None,
+        pause_on_io: api.models.PauseOnIO | None = None,
+    ) -> asyncio.Future[OperationResult]:
+        """Move forward or backward to the location at trajectory time ``time``.
+
+        Times before the start or after the end of the trajectory move to the start or end.
+        If the robot is already at that location, returns immediately with the current location.
+
+        Args:
+            time: Target trajectory time in seconds.
+            playback_speed_in_percent: Optional speed override (1-100).
+            start_on_io: Optional IO condition to wait for before movement starts.
+            pause_on_io: Optional IO condition that pauses movement while it is
+                in progress.
+
+        Returns:
+            Future that resolves with OperationResult when the location is reached.
+        """
+        target_location = self.location_at_time(time)
+        if target_location == self._current_location:
+            future: asyncio.Future[OperationResult] = asyncio.Future()
+            future.set_result(
+                OperationResult(
+                    final_location=self._current_location, operation_type=OperationType.SEEK_TIME
+                )
+            )
+            return future
+        move_to = self.forward_to if target_location > self._current_location else self.backward_to
+        return move_to(
+            target_location,
+            playback_speed_in_percent=playback_speed_in_percent,
+            start_on_io=start_on_io,
+            pause_on_io=pause_on_io,
+        )
+
     def pause(self) -> asyncio.Future[OperationResult] | None:
         """Pause the current movement operation.
 
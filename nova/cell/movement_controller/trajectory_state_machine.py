@@ -69,7 +69,7 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateUpdate:
     """Result of processing a single :class:`~nova.api.models.MotionGroupState`.
 
@@ -96,6 +96,14 @@ class StateUpdate:
         return not self.has_execute and not self.state_changed
 
 
+# Trajectory states that make the machine leave ``executing``
+_EDGE_TRAJECTORY_STATES = (
+    api.models.TrajectoryEnded,
+    api.models.TrajectoryPausedOnIO,
+    api.models.TrajectoryPausedByUser,
+)
+
+
 # ---------------------------------------------------------------------------
 # State machine
 # ---------------------------------------------------------------------------
@@ -123,6 +131,12 @@ class TrajectoryExecutionMachine(StateMachine):
 
     All trajectory-state transitions are triggered internally by
     :meth:`process_motion_state`.
+
+    **Counters**
+
+    * ``states_processed`` — states passed to :meth:`process_motion_state`.
+    * ``states_skipped`` — states among them that did not need a transition:
+      states without execute info and states that keep the machine executing.
     """
 
     # -- States ---------------------------------------------------------------
@@ -167,6 +181,10 @@ class TrajectoryExecutionMachine(StateMachine):
 
     def __init__(self) -> None:
         self.location: float | None = None
+        self.states_processed = 0
+        self.states_skipped = 0
+        # results for states without execute info, by state id, they carry no location
+        self._skipped_updates: dict[str, StateUpdate] = {}
         super().__init__()
 
     def _active_configuration_id(self) -> str:
@@ -188,6 +206,9 @@ class TrajectoryExecutionMachine(StateMachine):
         transition and returns a :class:`StateUpdate` describing what
         happened.
 
+        Most states arrive while the robot is moving and change nothing but the
+        location. Those only update :attr:`location` and don't fire a transition.
+
         Args:
             state: The latest motion-group state from the API stream.
 
@@ -195,21 +216,41 @@ class TrajectoryExecutionMachine(StateMachine):
             A :class:`StateUpdate` with location, execute presence and
             transition information.
         """
-        previous_state_id: str = self._active_configuration_id()
-        has_execute = state.execute is not None
-        location: float | None = None
+        self.states_processed += 1
+        execute = state.execute
 
-        if not has_execute:
+        if execute is None:
             # No execute info — skip.  The API guarantees that once execute is
             # set it will remain present in subsequent states, so a bare
             # standstill (without execute) is not a reliable completion signal.
+            self.states_skipped += 1
+            state_id = self._active_configuration_id()
+            update = self._skipped_updates.get(state_id)
+            if update is None:
+                update = StateUpdate(previous_state_id=state_id, current_state_id=state_id)
+                self._skipped_updates[state_id] = update
+            return update
+
+        details = execute.details
+        if (
+            self.current_state_value == self.executing.value
+            and not state.standstill
+            and isinstance(details, api.models.TrajectoryDetails)
+            and not isinstance(details.state, _EDGE_TRAJECTORY_STATES)
+        ):
+            # Still executing, the transition would be a no-op
+            self.states_skipped += 1
+            self.location = details.location.root
             return StateUpdate(
-                has_execute=False,
-                state_changed=False,
-                previous_state_id=previous_state_id,
-                current_state_id=previous_state_id,
+                location=self.location,
+                has_execute=True,
+                previous_state_id=self.executing.id,
+                current_state_id=self.executing.id,
             )
 
+        previous_state_id: str = self._active_configuration_id()
+        location: float | None = None
+
         # Execute *is* present ------------------------------------------------
         assert state.execute is not None  # mypy
         if isinstance(state.execute.details, api.models.TrajectoryDetails):
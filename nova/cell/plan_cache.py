@@ -0,0 +1,302 @@
+"""Content-addressed cache for planned trajectories.
+
+Planning the same actions from the same start joints with the same motion group setup always
+returns the same trajectory. Programs that replay identical pick/place cycles can therefore skip
+the planner round trips by attaching a :class:`PlanCache` to a motion group:
+
+```python
+cache = PlanCache(InMemoryPlanCacheBackend(max_entries=256))
+motion_group = controller[0]
+motion_group.plan_cache = cache
+```
+
+The cache is keyed by :func:`plan_cache_key`, a stable hash over everything that influences the
+planning result. Backends are pluggable, see :class:`PlanCacheBackend`.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from pydantic_core import to_jsonable_python
+
+from nova import api
+from nova.actions import Action
+from nova.utils.collision_setup import collision_setup_fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+def _action_fingerprint(action: Action, memo: dict[int, str]) -> dict:
+    # metas only carry user data (e.g. source line numbers) and don't influence the planner
+    fingerprint = {}
+    for name in type(action).model_fields:
+        if name == "metas":
+            continue
+        value = getattr(action, name)
+        if isinstance(value, api.models.CollisionSetup):
+            # collision scenes can be large and are usually shared by many actions
+            fingerprint[name] = collision_setup_fingerprint(value, memo)
+        else:
+            fingerprint[name] = to_jsonable_python(value)
+    return fingerprint
+
+
+def plan_cache_key(
+    actions: list[Action],
+    tcp: str | None,
+    start_joint_position: tuple[float, ...],
+    motion_group_setup: api.models.MotionGroupSetup,
+) -> str:
+    """Return a stable hash over all planning inputs.
+
+    The key covers the actions (including their motion settings and collision setups), the TCP,
+    the start joint position and the resolved motion group setup (including payload, limits and
+    collision setups). Action metas are ignored.
+
+    Args:
+        actions: The actions to plan.
+        tcp: The TCP to plan with.
+        start_joint_position: The joint position the plan starts from.
+        motion_group_setup: The resolved motion group setup the plan is computed with.
+
+    Returns:
+        str: A hex digest that identifies the planning request.
+    """
+    # collision setups are hashed once per object, but only within this key since they may be
+    # modified in place afterwards
+    memo: dict[int, str] = {}
+    payload = {
+        "actions": [_action_fingerprint(action, memo) for action in actions],
+        "tcp": tcp,
+        "start_joint_position": [float(joint) for joint in start_joint_position],
+        "motion_group_setup": motion_group_setup.model_dump(
+            mode="json", exclude_none=True, exclude={"collision_setups"}
+        ),
+        "collision_setups": {
+            name: collision_setup_fingerprint(setup, memo)
+            for name, setup in (
+                motion_group_setup.collision_setups.root
+                if motion_group_setup.collision_setups is not None
+                else {}
+            ).items()
+        },
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class PlanCacheBackend(ABC):
+    """Storage for planned trajectories addressed by :func:`plan_cache_key`."""
+
+    @abstractmethod
+    async def get(self, key: str) -> api.models.JointTrajectory | None:
+        """Return the trajectory stored under ``key`` or None if there is none."""
+
+    @abstractmethod
+    async def put(self, key: str, trajectory: api.models.JointTrajectory) -> None:
+        """Store ``trajectory`` under ``key``, evicting entries if the backend is full."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all entries."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+
+
+class InMemoryPlanCacheBackend(PlanCacheBackend):
+    """Keeps planned trajectories in memory and evicts the least recently used one when full."""
+
+    def __init__(self, max_entries: int = 128):
+        """
+        Args:
+            max_entries (int): Maximum number of trajectories to keep.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, api.models.JointTrajectory] = OrderedDict()
+
+    async def get(self, key: str) -> api.models.JointTrajectory | None:
+        trajectory = self._entries.get(key)
+        if trajectory is None:
+            return None
+        self._entries.move_to_end(key)
+        # callers are free to modify the returned trajectory
+        return trajectory.model_copy(deep=True)
+
+    async def put(self, key: str, trajectory: api.models.JointTrajectory) -> None:
+        self._entries[key] = trajectory.model_copy(deep=True)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DirectoryPlanCacheBackend(PlanCacheBackend):
+    """Persists planned trajectories as JSON files in a directory.
+
+    The directory is bounded by ``max_size_bytes``. When it grows beyond that, the least
+    recently used files are removed. Entries survive process restarts, so a cache directory can
+    be shared between runs of the same program.
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_size_bytes: int = 512 * 1024 * 1024):
+        """
+        Args:
+            directory (str | os.PathLike): The directory to store the trajectories in. It is
+                created if it does not exist.
+            max_size_bytes (int): Maximum accumulated size of all stored trajectories.
+        """
+        if max_size_bytes < 1:
+            raise ValueError("max_size_bytes must be at least 1")
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_size_bytes = max_size_bytes
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}.json"
+
+    def _entry_paths(self) -> list[Path]:
+        return list(self._directory.glob("*.json"))
+
+    def _get(self, key: str) -> api.models.JointTrajectory | None:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        # the modification time tracks the last use for LRU eviction
+        os.utime(path)
+        try:
+            return api.models.JointTrajectory.model_validate_json(data)
+        except ValueError as e:
+            logger.warning(f"Dropping unreadable plan cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def _put(self, key: str, trajectory: api.models.JointTrajectory) -> None:
+        data = trajectory.model_dump_json().encode()
+        # write to a temporary file first so readers never see a partially written entry
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self._path(key))
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._entry_paths():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total_size <= self._max_size_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def _clear(self) -> None:
+        for path in self._entry_paths():
+            path.unlink(missing_ok=True)
+
+    async def get(self, key: str) -> api.models.JointTrajectory | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def put(self, key: str, trajectory: api.models.JointTrajectory) -> None:
+        await asyncio.to_thread(self._put, key, trajectory)
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._clear)
+
+    def __len__(self) -> int:
+        return len(self._entry_paths())
+
+
+@dataclass(frozen=True)
+class PlanCacheStats:
+    """Snapshot of the plan cache counters."""
+
+    hits: int
+    misses: int
+    entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+
+class PlanCache:
+    """Looks up planned trajectories before planning and stores new planning results.
+
+    A single cache can be shared by several motion groups, the motion group setup that is part
+    of the key keeps their entries apart.
+    """
+
+    def __init__(self, backend: PlanCacheBackend | None = None):
+        """
+        Args:
+            backend (PlanCacheBackend | None): Where to store the trajectories. Defaults to an
+                :class:`InMemoryPlanCacheBackend`.
+        """
+        self._backend = backend if backend is not None else InMemoryPlanCacheBackend()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def backend(self) -> PlanCacheBackend:
+        return self._backend
+
+    async def get_or_plan(
+        self, key: str, plan: Callable[[], Awaitable[api.models.JointTrajectory]]
+    ) -> api.models.JointTrajectory:
+        """Return the trajectory cached under ``key`` or plan and cache it.
+
+        Args:
+            key: The key computed with :func:`plan_cache_key`.
+            plan: Called on a cache miss to compute the trajectory.
+
+        Returns:
+            api.models.JointTrajectory: The cached or newly planned trajectory.
+        """
+        trajectory = await self._backend.get(key)
+        if trajectory is not None:
+            self._hits += 1
+            logger.debug(f"Plan cache hit for {key}")
+            return trajectory
+
+        self._misses += 1
+        trajectory = await plan()
+        await self._backend.put(key, trajectory)
+        return trajectory
+
+    def stats(self) -> PlanCacheStats:
+        """Return the current hit/miss counters and number of stored entries."""
+        return PlanCacheStats(hits=self._hits, misses=self._misses, entries=len(self._backend))
+
+    async def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        await self._backend.clear()
+        self._hits = 0
+        self._misses = 0
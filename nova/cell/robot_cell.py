@@ -17,6 +17,7 @@ from typing import (
     TypeVar,
     Union,
     final,
+    overload,
     get_origin,
     get_type_hints,
     runtime_checkable,
@@ -29,7 +30,9 @@ from aiostream import stream
 
 from nova import api
 from nova.actions import Action, MovementController
-from nova.types import MotionState, Pose, RobotState
+from nova.actions.mock import WaitAction
+from nova.actions.motions import CollisionFreeMotion, Motion
+from nova.types import MotionStateLike, MotionStateView, Pose, RobotState
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +51,70 @@ def _normalize_actions(actions: ActionsLike) -> list[Action]:
     return list(actions)
 
 
+# Set this key in the metas of an action to allow a plan-ahead segment to end after it
+PLAN_AHEAD_BOUNDARY = "plan_ahead_boundary"
+
+# Number of planned segments that may wait for execution while planning ahead
+_PLAN_AHEAD_QUEUE_SIZE = 2
+
+
+def _is_segment_boundary(action: Action, next_action: Action) -> bool:
+    """Return whether the robot may stop between ``action`` and ``next_action``."""
+    if isinstance(action, (CollisionFreeMotion, WaitAction)) or isinstance(
+        next_action, (CollisionFreeMotion, WaitAction)
+    ):
+        return True
+    if action.metas.get(PLAN_AHEAD_BOUNDARY):
+        return True
+    # the robot comes to a standstill after a motion that is not blended into the next one
+    return isinstance(action, Motion) and not (
+        action.settings is not None and action.settings.has_blending_settings()
+    )
+
+
+def split_actions_into_segments(actions: list[Action], min_motions: int) -> list[list[Action]]:
+    """Split actions into segments that can be planned and executed one after another.
+
+    A segment ends at the first safe boundary after it contains at least ``min_motions``
+    motions. Safe boundaries are collision free motions, waits, motions without blending and
+    actions whose metas contain :data:`PLAN_AHEAD_BOUNDARY`. Trailing actions without motions
+    are appended to the last segment.
+
+    Args:
+        actions (list[Action]): The actions to split.
+        min_motions (int): The minimal number of motions in a segment.
+
+    Returns:
+        list[list[Action]]: The segments, concatenated they are ``actions``.
+    """
+    if min_motions < 1:
+        raise ValueError("min_motions must be at least 1")
+
+    segments: list[list[Action]] = []
+    current: list[Action] = []
+    motion_count = 0
+    for index, action in enumerate(actions):
+        current.append(action)
+        if isinstance(action, Motion):
+            motion_count += 1
+        is_last = index == len(actions) - 1
+        if (
+            not is_last
+            and motion_count >= min_motions
+            and _is_segment_boundary(action, actions[index + 1])
+        ):
+            segments.append(current)
+            current = []
+            motion_count = 0
+
+    if current:
+        if segments and motion_count == 0:
+            segments[-1].extend(current)
+        else:
+            segments.append(current)
+    return segments
+
+
 class RobotCellError(Exception):
     """Base exception for all robot cell specific error"""
 
@@ -352,7 +419,7 @@ class AbstractRobot(Device):
         movement_controller: MovementController | None,
         start_on_io: api.models.StartOnIO | None = None,
         pause_on_io: api.models.PauseOnIO | None = None,
-    ) -> AsyncGenerator[MotionState, None]:
+    ) -> AsyncGenerator[MotionStateLike, None]:
         """Execute a planned motion
 
         Args:
@@ -364,6 +431,31 @@ class AbstractRobot(Device):
             pause_on_io (PauseOnIO | None): The pause on IO. If none, does not pause on IO. Defaults to None.
         """
 
+    @overload
+    def stream_execute(
+        self,
+        joint_trajectory: api.models.JointTrajectory,
+        tcp: str | None,
+        actions: ActionsLike,
+        movement_controller: MovementController | None = None,
+        start_on_io: api.models.StartOnIO | None = None,
+        pause_on_io: api.models.PauseOnIO | None = None,
+        raw: Literal[False] = False,
+    ) -> AsyncGenerator[MotionStateLike, None]: ...
+
+    @overload
+    def stream_execute(
+        self,
+        joint_trajectory: api.models.JointTrajectory,
+        tcp: str | None,
+        actions: ActionsLike,
+        movement_controller: MovementController | None = None,
+        start_on_io: api.models.StartOnIO | None = None,
+        pause_on_io: api.models.PauseOnIO | None = None,
+        *,
+        raw: Literal[True],
+    ) -> AsyncGenerator[api.models.MotionGroupState, None]: ...
+
     async def stream_execute(
         self,
         joint_trajectory: api.models.JointTrajectory,
@@ -372,12 +464,16 @@ class AbstractRobot(Device):
         movement_controller: MovementController | None = None,
         start_on_io: api.models.StartOnIO | None = None,
         pause_on_io: api.models.PauseOnIO | None = None,
-    ) -> AsyncGenerator[MotionState, None]:
+        raw: bool = False,
+    ) -> AsyncGenerator[MotionStateLike | api.models.MotionGroupState, None]:
         """Execute a planned motion
 
         Note that if an error happens during the consuming of states from the returned async generator,
         it is not guaranteed that the last state reported to you is the final state of the robot.
 
+        The yielded states have the attributes of :class:`MotionState`. Motion groups yield a
+        :class:`MotionStateView`, which only converts the pose and joints when they are accessed.
+
         Args:
             joint_trajectory (api.models.JointTrajectory): The planned joint trajectory
             tcp (str | None): The id of the tool center point (TCP). Can be None for joint-space-only motions.
@@ -385,6 +481,8 @@ class AbstractRobot(Device):
             movement_controller (MovementController): The movement controller to be used. Defaults to move_forward
             start_on_io (StartOnIO | None): The start on IO. If none, does not wait for IO. Defaults to None.
             pause_on_io (PauseOnIO | None): The pause on IO. If none, does not pause on IO. Defaults to None.
+            raw (bool): Yield the motion group states received from the API without any
+                conversion. Only supported by robots that execute through the API. Defaults to False.
         """
         actions_list = _normalize_actions(actions)
 
@@ -399,7 +497,14 @@ class AbstractRobot(Device):
 
         async with aclosing(motion_state_stream) as motion_state_stream:
             async for motion_state in motion_state_stream:
-                yield motion_state
+                if not raw:
+                    yield motion_state
+                elif isinstance(motion_state, MotionStateView):
+                    yield motion_state.motion_group_state
+                else:
+                    raise NotImplementedError(
+                        f"{type(self).__name__} does not provide raw motion group states"
+                    )
 
     async def execute(
         self,
@@ -442,7 +547,8 @@ class AbstractRobot(Device):
         start_on_io: api.models.StartOnIO | None = None,
         pause_on_io: api.models.PauseOnIO | None = None,
         payload_override: str | api.models.Payload | None = None,
-    ) -> AsyncIterable[MotionState]:
+        plan_ahead_segment_size: int | None = None,
+    ) -> AsyncIterable[MotionStateLike]:
         """Plan and execute a trajectory for the given actions.
 
         Args:
@@ -454,6 +560,12 @@ class AbstractRobot(Device):
             pause_on_io (PauseOnIO | None): The pause on IO. If none, does not pause on IO. Defaults to None.
             payload_override (str | api.models.Payload | None): Override for the dynamics payload
                 used by the planner. See :meth:`plan` for resolution rules and caveats.
+            plan_ahead_segment_size (int | None): If set, the actions are split into segments of
+                at least this many motions at safe boundaries (see
+                :func:`split_actions_into_segments`). The first segment starts executing as soon
+                as it is planned while the following segments are planned in the background and
+                executed back to back. The path parameters of the yielded states continue across
+                segments. Defaults to None, which plans all actions before executing them.
         """
         actions_list = _normalize_actions(actions)
 
@@ -461,6 +573,23 @@ class AbstractRobot(Device):
             await self._execute_direct_non_motion_actions(actions_list)
             return
 
+        if plan_ahead_segment_size is not None:
+            segments = split_actions_into_segments(actions_list, plan_ahead_segment_size)
+            if len(segments) > 1:
+                pipelined_stream = self._stream_plan_ahead_and_execute(
+                    segments,
+                    tcp,
+                    start_joint_position=start_joint_position,
+                    movement_controller=movement_controller,
+                    start_on_io=start_on_io,
+                    pause_on_io=pause_on_io,
+                    payload_override=payload_override,
+                )
+                async with aclosing(pipelined_stream) as pipelined_stream:
+                    async for motion_state in pipelined_stream:
+                        yield motion_state
+                return
+
         joint_trajectory = await self.plan(
             actions_list,
             tcp,
@@ -479,6 +608,72 @@ class AbstractRobot(Device):
             async for motion_state in motion_state_stream:
                 yield motion_state
 
+    async def _stream_plan_ahead_and_execute(
+        self,
+        segments: list[list[Action]],
+        tcp: str | None,
+        start_joint_position: tuple[float, ...] | None,
+        movement_controller: MovementController | None,
+        start_on_io: api.models.StartOnIO | None,
+        pause_on_io: api.models.PauseOnIO | None,
+        payload_override: str | api.models.Payload | None,
+    ) -> AsyncGenerator[MotionStateLike, None]:
+        """Execute the segments one after another while the next ones are planned."""
+        planned: asyncio.Queue[api.models.JointTrajectory | BaseException] = asyncio.Queue(
+            maxsize=_PLAN_AHEAD_QUEUE_SIZE
+        )
+
+        async def plan_segments():
+            current_joints = start_joint_position
+            try:
+                for segment in segments:
+                    trajectory = await self.plan(
+                        segment,
+                        tcp,
+                        start_joint_position=current_joints,
+                        payload_override=payload_override,
+                    )
+                    await planned.put(trajectory)
+                    # each segment starts where the previous one ends
+                    current_joints = tuple(trajectory.joint_positions[-1])
+            except Exception as e:
+                await planned.put(e)
+
+        planner = asyncio.create_task(plan_segments())
+        try:
+            path_parameter_offset = 0.0
+            for index, segment in enumerate(segments):
+                trajectory = await planned.get()
+                if isinstance(trajectory, BaseException):
+                    raise trajectory
+                logger.debug(f"Executing plan-ahead segment {index + 1}/{len(segments)}")
+
+                motion_state_stream = self.stream_execute(
+                    trajectory,
+                    tcp,
+                    segment,
+                    movement_controller=movement_controller,
+                    start_on_io=start_on_io if index == 0 else None,
+                    pause_on_io=pause_on_io,
+                )
+                async with aclosing(motion_state_stream) as motion_state_stream:
+                    async for motion_state in motion_state_stream:
+                        if path_parameter_offset:
+                            if isinstance(motion_state, MotionStateView):
+                                motion_state = motion_state.to_motion_state()
+                            motion_state = motion_state.model_copy(
+                                update={
+                                    "path_parameter": motion_state.path_parameter
+                                    + path_parameter_offset
+                                }
+                            )
+                        yield motion_state
+                path_parameter_offset += sum(isinstance(action, Motion) for action in segment)
+        finally:
+            planner.cancel()
+            # wait until the planner stopped, e.g. when the consumer stops early
+            await asyncio.gather(planner, return_exceptions=True)
+
     async def plan_and_execute(
         self,
         actions: ActionsLike,
@@ -488,6 +683,7 @@ class AbstractRobot(Device):
         start_on_io: api.models.StartOnIO | None = None,
         pause_on_io: api.models.PauseOnIO | None = None,
         payload_override: str | api.models.Payload | None = None,
+        plan_ahead_segment_size: int | None = None,
     ) -> None:
         """Plan and execute a trajectory for the given actions.
 
@@ -500,6 +696,8 @@ class AbstractRobot(Device):
             pause_on_io (PauseOnIO | None): The pause on IO. If none, does not pause on IO. Defaults to None.
             payload_override (str | api.models.Payload | None): Override for the dynamics payload
                 used by the planner. See :meth:`plan` for resolution rules and caveats.
+            plan_ahead_segment_size (int | None): Execute the first segment while the following
+                ones are planned. See :meth:`stream_plan_and_execute`.
 
         Raises:
             NoInverseKinematicsSolutionFound: When inverse kinematics cannot find a solution for a target
@@ -511,6 +709,22 @@ class AbstractRobot(Device):
             await self._execute_direct_non_motion_actions(actions_list)
             return
 
+        if plan_ahead_segment_size is not None:
+            motion_state_stream = self.stream_plan_and_execute(
+                actions_list,
+                tcp,
+                start_joint_position=start_joint_position,
+                movement_controller=movement_controller,
+                start_on_io=start_on_io,
+                pause_on_io=pause_on_io,
+                payload_override=payload_override,
+                plan_ahead_segment_size=plan_ahead_segment_size,
+            )
+            async with aclosing(motion_state_stream) as motion_state_stream:
+                async for _ in motion_state_stream:
+                    pass
+            return
+
         joint_trajectory = await self.plan(
             actions_list,
             tcp,
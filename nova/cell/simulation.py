@@ -1,4 +1,6 @@
 import asyncio
+import heapq
+import itertools
 import math
 import time
 from collections import defaultdict
@@ -8,6 +10,7 @@ import numpy as np
 
 from nova import api
 from nova.actions import Action, MovementController
+from nova.actions.mock import WaitAction
 from nova.actions.motions import CartesianPTP, Circular, JointPTP, Linear
 from nova.cell.io import ValueType
 from nova.cell.robot_cell import (
@@ -21,6 +24,8 @@ from nova.cell.robot_cell import (
     Timer,
 )
 from nova.types import MotionState, Pose, RobotState
+from nova.types.trajectory import TrajectoryArray
+from nova.utils.kinematics import DHKinematics
 
 
 def default_value():
@@ -32,6 +37,78 @@ def default_value():
     return "default_value"
 
 
+# time between two samples of trajectories planned with the kinematics of a motion group
+_KINEMATIC_SAMPLE_TIME = 0.05
+
+# event loop iterations a virtual clock waits for other tasks before it advances the time
+_VIRTUAL_CLOCK_SETTLE_ITERATIONS = 5
+
+
+class VirtualClock:
+    """The time source of a simulated robot cell.
+
+    With a ``speed_factor`` the clock runs that many times faster than real time, 1 is real
+    time. Without one the clock is virtual: sleeping returns as soon as every other task is
+    waiting and the clock jumps to the earliest wake-up time. Simulated devices sharing a
+    clock stay in sync, so a long program is simulated in a fraction of its duration.
+
+    Example:
+    >>> async def example():
+    ...     clock = VirtualClock()
+    ...     await asyncio.gather(clock.sleep(600), clock.sleep(60))
+    ...     return clock.time()
+    >>> asyncio.run(example())
+    600.0
+    """
+
+    def __init__(self, speed_factor: float | None = None):
+        if speed_factor is not None and speed_factor <= 0:
+            raise ValueError(f"The speed factor must be positive, got {speed_factor}")
+        self.speed_factor = speed_factor
+        self._now = 0.0
+        self._real_start = time.monotonic()
+        self._sleepers: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._order = itertools.count()
+        self._advancer: asyncio.Task | None = None
+
+    def time(self) -> float:
+        """The seconds passed on the clock since it was created."""
+        if self.speed_factor is None:
+            return self._now
+        return (time.monotonic() - self._real_start) * self.speed_factor
+
+    async def sleep(self, seconds: float) -> None:
+        """Wait for ``seconds`` on the clock."""
+        await self.sleep_until(self.time() + seconds)
+
+    async def sleep_until(self, deadline: float) -> None:
+        """Wait until the clock shows ``deadline``."""
+        if self.speed_factor is not None:
+            await asyncio.sleep(max(0.0, deadline - self.time()) / self.speed_factor)
+            return
+        if deadline <= self._now:
+            await asyncio.sleep(0)
+            return
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        heapq.heappush(self._sleepers, (deadline, next(self._order), future))
+        if self._advancer is None or self._advancer.done():
+            self._advancer = loop.create_task(self._advance())
+        await future
+
+    async def _advance(self) -> None:
+        while self._sleepers:
+            # let the other tasks run until they wait as well
+            for _ in range(_VIRTUAL_CLOCK_SETTLE_ITERATIONS):
+                await asyncio.sleep(0)
+            deadline, _, future = heapq.heappop(self._sleepers)
+            if future.done():
+                # cancelled sleeps don't advance the clock
+                continue
+            self._now = max(self._now, deadline)
+            future.set_result(None)
+
+
 class UnknownPose(ValueError):
     """A pose is requested from an SimulatedRobot without initial pose which have not moved so far"""
 
@@ -65,6 +142,63 @@ def naive_joints_to_pose(joints: tuple[float, ...]) -> Pose:
     return Pose((x, y, z, rx, ry, rz))
 
 
+def get_ur5e_motion_group_description() -> api.models.MotionGroupDescription:
+    """Return a motion group description of a UR5e with nominal joint limits.
+
+    It serves as the kinematics of a :class:`SimulatedRobot` when no description was recorded
+    from a NOVA instance.
+    """
+    dh_parameters = [
+        api.models.DHParameter(a=0.0, d=162.5, alpha=np.pi / 2),
+        api.models.DHParameter(a=-425.0, d=0.0, alpha=0.0),
+        api.models.DHParameter(a=-392.2, d=0.0, alpha=0.0),
+        api.models.DHParameter(a=0.0, d=133.3, alpha=np.pi / 2),
+        api.models.DHParameter(a=0.0, d=99.7, alpha=-np.pi / 2),
+        api.models.DHParameter(a=0.0, d=99.6, alpha=0.0),
+    ]
+    joint_limits = api.models.JointLimits(
+        position=api.models.LimitRange(lower_limit=-2 * np.pi, upper_limit=2 * np.pi),
+        velocity=np.pi,
+        acceleration=2 * np.pi,
+    )
+    return api.models.MotionGroupDescription(
+        motion_group_model=api.models.MotionGroupModel("UniversalRobots_UR5e"),
+        operation_limits=api.models.OperationLimits(
+            auto_limits=api.models.LimitSet(joints=[joint_limits] * len(dh_parameters))
+        ),
+        dh_parameters=dh_parameters,
+        cycle_time=8,
+    )
+
+
+def _trapezoidal_progress(
+    times: np.ndarray, velocity: float, acceleration: float
+) -> tuple[float, np.ndarray]:
+    """Return the duration and the progress from 0 to 1 of a trapezoidal velocity profile.
+
+    Example:
+    >>> duration, progress = _trapezoidal_progress(np.array([0.0, 1.0, 1.5, 2.0]), 1.0, 1.0)
+    >>> duration, progress.tolist()
+    (2.0, [0.0, 0.5, 0.875, 1.0])
+    """
+    if velocity**2 / acceleration > 1:
+        # the top speed is not reached, the profile is triangular
+        velocity = math.sqrt(acceleration)
+    ramp = velocity / acceleration
+    duration = 1 / velocity + ramp
+    times = np.clip(times, 0.0, duration)
+    progress = np.where(
+        times < ramp,
+        0.5 * acceleration * times**2,
+        np.where(
+            times < duration - ramp,
+            0.5 * acceleration * ramp**2 + velocity * (times - ramp),
+            1 - 0.5 * acceleration * (duration - times) ** 2,
+        ),
+    )
+    return duration, progress
+
+
 class SimulatedRobot(ConfigurablePeriphery, AbstractRobot):
     """A simulated robot cell without a camera"""
 
@@ -75,6 +209,11 @@ class SimulatedRobot(ConfigurablePeriphery, AbstractRobot):
             initial_pose: The start pose of the robot, None means it is unknown
             step_size: the distance of the steps between MotionStates. The default value 0 means infinite steps (i.e.
                 just start and end)
+            motion_group_description: The description of a real motion group, e.g. recorded from a NOVA instance
+                or :func:`get_ur5e_motion_group_description`. With one, motions are planned with its DH
+                parameters and timed by its joint velocity and acceleration limits, and the robot starts at
+                the zero position instead of the initial pose. Without one, the robot moves along a made-up
+                kinematics at a fixed pace.
         """
 
         type: Literal["simulated_robot"] = "simulated_robot"
@@ -82,6 +221,7 @@ class SimulatedRobot(ConfigurablePeriphery, AbstractRobot):
         initial_pose: Pose = Pose((0, 0, 0, 0, 0, 0))
         tools: dict[str, Pose] | None = None
         step_size: float = 0
+        motion_group_description: api.models.MotionGroupDescription | None = None
 
     def __init__(self, configuration: Configuration = Configuration()):
         if not configuration.tools:
@@ -89,24 +229,63 @@ class SimulatedRobot(ConfigurablePeriphery, AbstractRobot):
                 update={"tools": {"Flange": Pose((0, 0, 0, 0, 0, 0))}}
             )
         super().__init__(id=configuration.id, configuration=configuration)
+        description = configuration.motion_group_description
+        self._kinematics: DHKinematics | None = None
+        if description is not None:
+            self._kinematics = DHKinematics.from_motion_group_description(description)
+            self._init_joint_limits(description)
         self._step_size = configuration.step_size if configuration.step_size else math.inf
         self._param = 1
+        initial_joints: tuple[float, ...] = (0, 0, 0, 0, 0, 0)
+        initial_pose = configuration.initial_pose
+        if self._kinematics is not None and initial_pose is not None:
+            # the robot starts at the zero position of its kinematics
+            initial_joints = (0.0,) * self._kinematics.joint_count
+            initial_pose = Pose.from_trusted_tuple(
+                self._kinematics.flange_poses(initial_joints)[0].tolist()
+            )
         self._trajectory: list[MotionState] = (
             []
-            if configuration.initial_pose is None
+            if initial_pose is None
             else [
                 MotionState(
                     motion_group_id=self.configuration.id,
                     path_parameter=0,
-                    state=RobotState(
-                        pose=configuration.initial_pose, tcp="Flange", joints=(0, 0, 0, 0, 0, 0)
-                    ),
+                    state=RobotState(pose=initial_pose, tcp="Flange", joints=initial_joints),
                 )
             ]
         )
         # Added and used for tests of Wandelscript. In every planned_motion_iter() a motion trajectory is appended to
         # this list. Every motion trajectory corresponds to blocs of wandelscript code between sync commands.
         self.record_of_commands: list[list[Action]] = []
+        # number of motion states yielded by all executions so far
+        self.states_streamed = 0
+        self._clock = VirtualClock(speed_factor=1.0)
+
+    def use_clock(self, clock: VirtualClock) -> None:
+        """Execute trajectories on ``clock`` instead of in real time."""
+        self._clock = clock
+
+    def _init_joint_limits(self, description: api.models.MotionGroupDescription) -> None:
+        limits = description.operation_limits.auto_limits
+        joint_limits = limits.joints if limits is not None and limits.joints else []
+        if len(joint_limits) < self._kinematics.joint_count or any(
+            limit.velocity is None or limit.acceleration is None for limit in joint_limits
+        ):
+            raise ValueError(
+                f"The motion group description of '{self.configuration.id}' needs velocity and "
+                "acceleration limits of all joints"
+            )
+        joint_limits = joint_limits[: self._kinematics.joint_count]
+        self._velocity_limits = np.array([limit.velocity for limit in joint_limits])
+        self._acceleration_limits = np.array([limit.acceleration for limit in joint_limits])
+        positions = [limit.position or api.models.LimitRange() for limit in joint_limits]
+        self._lower_limits = np.array(
+            [-np.inf if p.lower_limit is None else p.lower_limit for p in positions]
+        )
+        self._upper_limits = np.array(
+            [np.inf if p.upper_limit is None else p.upper_limit for p in positions]
+        )
 
     async def get_motion_group_setup(self, tcp_name: str) -> api.models.MotionGroupSetup:
         tcp_pose = self.configuration.tools[tcp_name]
@@ -130,6 +309,16 @@ class SimulatedRobot(ConfigurablePeriphery, AbstractRobot):
             orientation=api.models.RotationVector([0, 0, 0]),
         )
         payload = api.models.Payload(name="example", payload=0.0)
+        description = self.configuration.motion_group_description
+        if description is not None:
+            return api.models.MotionGroupSetup(
+                motion_group_model=description.motion_group_model,
+                mounting=description.mounting or mounting,
+                tcp_offset=tcp,
+                global_limits=description.operation_limits.auto_limits,
+                cycle_time=description.cycle_time or 8,
+                payload=payload,
+            )
         return api.models.MotionGroupSetup(
             motion_group_model=api.models.MotionGroupModel("FANUC_CRX25iA"),
             mounting=mounting,
@@ -155,12 +344,16 @@ class SimulatedRobot(ConfigurablePeriphery, AbstractRobot):
     ) -> api.models.JointTrajectory:
         """
         A simple example planner that:
+          0. Plans with the kinematics of the motion group description instead, if there is one.
           1. Starts from [0, 0, 0, 0, 0, 0].
           2. For each action, determines the final joint configuration (very naive).
           3. Interpolates in joint space from the current to the final configuration.
           4. Accumulates the samples in JointTrajectory.joint_positions, times, locations.
         """
 
+        if self._kinematics is not None:
+            return self._plan_with_kinematics(actions, tcp, start_joint_position).to_api_model()
+
         # We assume 6-DOF for this example
         current_joints = (
             np.zeros(6, dtype=float)
@@ -207,7 +400,20 @@ class SimulatedRobot(ConfigurablePeriphery, AbstractRobot):
         # ---------------------------------------------------------------------
         # Loop through actions and build the trajectory
         # ---------------------------------------------------------------------
-        for i, action in enumerate(actions):
+        motion_index = 0
+        for action in actions:
+            if isinstance(action, WaitAction):
+                # hold the joints, the location stays at the end of the previous motion
+                wait_steps = max(1, math.ceil(action.wait_for_in_seconds / dt))
+                for _ in range(wait_steps):
+                    joint_positions.append(tuple(current_joints.tolist()))
+                    times.append(current_time)
+                    locations.append(float(motion_index))
+                    current_time += dt
+                continue
+
+            i = motion_index
+            motion_index += 1
             if isinstance(action, JointPTP):
                 # Directly use the target as the final joints
                 final_joints = np.array(action.target, dtype=float)
@@ -249,6 +455,75 @@ class SimulatedRobot(ConfigurablePeriphery, AbstractRobot):
             locations=list(api.models.Location(float(location)) for location in locations),
         )
 
+    def _plan_with_kinematics(
+        self, actions: list[Action], tcp: str | None, start_joint_position: tuple[float, ...] | None
+    ) -> TrajectoryArray:
+        """Plan point-to-point motions in joint space, as fast as the joint limits allow.
+
+        Cartesian targets are converted by the inverse kinematics closest to the previous
+        joints. All joints of a motion follow the same trapezoidal velocity profile, timed by
+        the slowest joint, so they start and arrive together. Locations run from i to i + 1
+        for the i-th motion.
+        """
+        kinematics = self._kinematics
+        tcp_offset = self.configuration.tools.get(tcp) if tcp is not None else None
+        current_joints = (
+            np.zeros(kinematics.joint_count)
+            if start_joint_position is None
+            else np.asarray(start_joint_position, dtype=float)
+        )
+        segments: list[TrajectoryArray] = []
+        for action in actions:
+            if isinstance(action, WaitAction):
+                if action.wait_for_in_seconds > 0:
+                    segments.append(
+                        TrajectoryArray.hold(
+                            current_joints, action.wait_for_in_seconds, _KINEMATIC_SAMPLE_TIME
+                        )
+                    )
+                continue
+            if isinstance(action, JointPTP):
+                target_joints = np.asarray(action.target, dtype=float)
+            elif isinstance(action, (Linear, CartesianPTP, Circular)):
+                if not isinstance(action.target, Pose):
+                    raise ValueError(f"Expected Pose as target, got {type(action.target)}")
+                target_joints = kinematics.inverse_kinematics(
+                    action.target, seed=current_joints, tcp_offset=tcp_offset
+                )
+            else:
+                raise ValueError(f"Unsupported action type {type(action)}")
+            if np.any(target_joints < self._lower_limits) or np.any(
+                target_joints > self._upper_limits
+            ):
+                raise ValueError(
+                    f"Target joints {target_joints.tolist()} of {action} exceed the joint limits"
+                )
+            segments.append(self._joint_motion(current_joints, target_joints))
+            current_joints = target_joints
+
+        if not segments:
+            return TrajectoryArray.hold(current_joints, _KINEMATIC_SAMPLE_TIME)
+        return TrajectoryArray.concatenate(segments)
+
+    def _joint_motion(self, start: np.ndarray, end: np.ndarray) -> TrajectoryArray:
+        distance = np.abs(end - start)
+        moving = distance > 0
+        if not np.any(moving):
+            return TrajectoryArray(
+                times=[0.0, _KINEMATIC_SAMPLE_TIME], locations=[0.0, 1.0], joints=[start, end]
+            )
+        # limits of the progress from 0 to 1 so that no joint exceeds its own limits
+        velocity = float(np.min(self._velocity_limits[moving] / distance[moving]))
+        acceleration = float(np.min(self._acceleration_limits[moving] / distance[moving]))
+        duration, _ = _trapezoidal_progress(np.zeros(0), velocity, acceleration)
+        count = max(2, math.ceil(duration / _KINEMATIC_SAMPLE_TIME) + 1)
+        times = np.arange(count) * _KINEMATIC_SAMPLE_TIME
+        times[-1] = duration
+        _, progress = _trapezoidal_progress(times, velocity, acceleration)
+        return TrajectoryArray(
+            times=times, locations=progress, joints=start + progress[:, None] * (end - start)
+        )
+
     async def _execute(
         self,
         joint_trajectory: api.models.JointTrajectory,
@@ -280,17 +555,22 @@ class SimulatedRobot(ConfigurablePeriphery, AbstractRobot):
         self.record_of_commands.append(actions)
 
         # Start time for optional synchronization
-        start_time = time.time()
+        start_time = self._clock.time()
+        if self._kinematics is not None:
+            # forward kinematics of the whole trajectory at once
+            tcp_poses = self._kinematics.tcp_poses(
+                [joints.root for joints in joint_trajectory.joint_positions],
+                self.configuration.tools.get(tcp) if tcp is not None else None,
+            ).tolist()
 
         # Iterate over each interpolation step in the planned trajectory
-        for joints, planned_time, location in zip(
-            joint_trajectory.joint_positions, joint_trajectory.times, joint_trajectory.locations
+        for index, (joints, planned_time, location) in enumerate(
+            zip(
+                joint_trajectory.joint_positions, joint_trajectory.times, joint_trajectory.locations
+            )
         ):
             # Wait until the correct planned_time from the start (if needed)
-            now = time.time()
-            wait_secs = (start_time + float(planned_time)) - now
-            if wait_secs > 0:
-                await asyncio.sleep(wait_secs)
+            await self._clock.sleep_until(start_time + float(planned_time))
 
             # Send joint command to hardware or simulator (if a controller is provided)
             if movement_controller is not None:
@@ -298,7 +578,10 @@ class SimulatedRobot(ConfigurablePeriphery, AbstractRobot):
                 pass
 
             # Compute the current Pose from these joint values
-            current_pose = naive_joints_to_pose(tuple(joints))
+            if self._kinematics is not None:
+                current_pose = Pose.from_trusted_tuple(tcp_poses[index])
+            else:
+                current_pose = naive_joints_to_pose(tuple(joints))
             motion_state = MotionState(
                 motion_group_id=self.id,
                 path_parameter=float(location.root),
@@ -307,6 +590,7 @@ class SimulatedRobot(ConfigurablePeriphery, AbstractRobot):
 
             # Append this Pose to self._trajectory while moving
             self._trajectory.append(motion_state)
+            self.states_streamed += 1
 
             yield motion_state
 
@@ -388,6 +672,11 @@ class SimulatedIO(ConfigurablePeriphery, Device, IODevice):
         super().__init__(configuration=configuration)
         self._silent = silent
         self._io: dict[str, Any] = defaultdict(default_value)
+        self._clock = VirtualClock(speed_factor=1.0)
+
+    def use_clock(self, clock: VirtualClock) -> None:
+        """Poll inputs on ``clock`` instead of in real time."""
+        self._clock = clock
 
     async def read(self, key: str) -> ValueType:
         if not self._silent:
@@ -401,7 +690,7 @@ class SimulatedIO(ConfigurablePeriphery, Device, IODevice):
 
     async def wait_for_bool_io(self, key: str, value: bool) -> None:
         while await self.read(key) != value:
-            await asyncio.sleep(0.1)
+            await self._clock.sleep(0.1)
 
 
 class SimulatedController(ConfigurablePeriphery, AbstractController):
@@ -424,6 +713,13 @@ class SimulatedController(ConfigurablePeriphery, AbstractController):
         }
         self._simulated_io = SimulatedIO()
 
+    def use_clock(self, clock: VirtualClock) -> None:
+        """Run the robots and the IOs of the controller on ``clock``."""
+        for robot in self._robots.values():
+            if isinstance(robot, SimulatedRobot):
+                robot.use_clock(clock)
+        self._simulated_io.use_clock(clock)
+
     def get_motion_groups(self) -> dict[str, AbstractRobot]:
         return self._robots
 
@@ -445,7 +741,7 @@ class SimulatedController(ConfigurablePeriphery, AbstractController):
 
 
 class SimulatedTimer(Timer):
-    """A simulated timer (doing logging only)"""
+    """A simulated timer (doing logging only, unless it runs on a clock)"""
 
     class Configuration(Timer.Configuration):
         type: Literal["simulated_timer"] = "simulated_timer"
@@ -453,9 +749,16 @@ class SimulatedTimer(Timer):
 
     def __init__(self, configuration: Configuration = Configuration()):
         super().__init__(configuration=configuration)
+        self._clock: VirtualClock | None = None
+
+    def use_clock(self, clock: VirtualClock) -> None:
+        """Wait on ``clock`` instead of returning immediately."""
+        self._clock = clock
 
     async def __call__(self, duration: float):
         print(f"Wait for {duration} ms")
+        if self._clock is not None:
+            await self._clock.sleep(duration / 1000)
 
 
 class SimulatedAsyncCallable(ConfigurablePeriphery, AsyncCallableDevice):
@@ -484,9 +787,15 @@ class SimulatedAsyncCallable(ConfigurablePeriphery, AsyncCallableDevice):
 
 
 class SimulatedRobotCell(RobotCell):
-    """A robot cell fully simulated (on default)"""
+    """A robot cell fully simulated (on default)
+
+    Args:
+        clock: A clock shared by all simulated devices of the cell. Robots execute, the timer
+            waits and IOs are polled on it. By default robots run in real time and the timer
+            returns immediately.
+    """
 
-    def __init__(self, **kwargs):
+    def __init__(self, clock: VirtualClock | None = None, **kwargs):
         defaults = {
             "timer": SimulatedTimer(),
             "controller": SimulatedController(),
@@ -497,14 +806,25 @@ class SimulatedRobotCell(RobotCell):
                 kwargs[key] = value
 
         super().__init__(**kwargs)
+        self.clock = clock
+        if clock is not None:
+            for device in self._devices.values():
+                if isinstance(
+                    device, (SimulatedRobot, SimulatedController, SimulatedIO, SimulatedTimer)
+                ):
+                    device.use_clock(clock)
 
 
 def get_simulated_robot_configs(
-    controller_id: str = "controller", num_robots: SupportsIndex = 2
+    controller_id: str = "controller",
+    num_robots: SupportsIndex = 2,
+    motion_group_description: api.models.MotionGroupDescription | None = None,
 ) -> list[SimulatedRobot.Configuration]:
     return [
         SimulatedRobot.Configuration(
-            id=f"{i}@{controller_id}", tools={"Flange": Pose((0, 0, 0, 0, 0, 0))}
+            id=f"{i}@{controller_id}",
+            tools={"Flange": Pose((0, 0, 0, 0, 0, 0))},
+            motion_group_description=motion_group_description,
         )
         for i in range(num_robots)
     ]
@@ -523,6 +843,6 @@ def get_robot_controller(
     )
 
 
-def get_simulated_robot_cell() -> SimulatedRobotCell:
+def get_simulated_robot_cell(clock: VirtualClock | None = None) -> SimulatedRobotCell:
     """Get a simulated robot cell"""
-    return SimulatedRobotCell(controller=get_robot_controller())
+    return SimulatedRobotCell(clock=clock, controller=get_robot_controller())
@@ -0,0 +1,226 @@
+"""Share one upstream state stream between any number of consumers.
+
+Every consumer of :meth:`MotionGroup.stream_state` (trajectory execution, movement controllers,
+viewers, jogging sessions, ...) used to open its own websocket to the controller. A
+:class:`StateStreamHub` keeps a single upstream subscription per motion group instead and fans
+the states out to all consumers. The upstream is opened by the first consumer and closed when
+the last one leaves. Each consumer can downsample the shared stream to its own rate.
+
+The upstream is opened at the fastest rate any consumer asked for. A consumer that asks for a
+faster rate than the open upstream provides reopens it at that rate, the other consumers keep
+receiving states from the new upstream. The upstream is not slowed down again when fast
+consumers leave, only once all consumers left, which avoids reconnecting on every change.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Generic, TypeVar
+
+from nova import api
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Number of states buffered per consumer before the oldest ones are dropped
+DEFAULT_MAX_PENDING_STATES = 1000
+
+
+class _End:
+    pass
+
+
+_END = _End()
+
+
+@dataclass(eq=False)
+class _Subscriber(Generic[T]):
+    queue: asyncio.Queue
+    min_interval: float | None
+    last_delivery: float | None = None
+    dropped: int = field(default=0)
+
+    def offer(self, item: T | _End | BaseException, now: float) -> None:
+        if isinstance(item, (_End, BaseException)):
+            self._put(item)
+            return
+        if (
+            self.min_interval is not None
+            and self.last_delivery is not None
+            and now - self.last_delivery < self.min_interval
+        ):
+            return
+        self.last_delivery = now
+        self._put(item)
+
+    def _put(self, item: T | _End | BaseException) -> None:
+        if self.queue.full():
+            # slow consumers get the most recent states rather than blocking all others
+            self.queue.get_nowait()
+            self.dropped += 1
+            if self.dropped == 1:
+                logger.warning("State stream consumer is too slow, dropping the oldest states")
+        self.queue.put_nowait(item)
+
+
+class StateStreamHub(Generic[T]):
+    """Fans out a single upstream stream to any number of async consumers.
+
+    Example:
+    >>> import asyncio
+    >>> async def upstream(interval):
+    ...     for i in range(3):
+    ...         yield i
+    >>> async def consume():
+    ...     hub = StateStreamHub()
+    ...     return [state async for state in hub.subscribe(upstream)]
+    >>> asyncio.run(consume())
+    [0, 1, 2]
+    """
+
+    def __init__(
+        self,
+        max_pending: int = DEFAULT_MAX_PENDING_STATES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_pending (int): Number of states buffered per consumer. If a consumer falls
+                further behind, its oldest states are dropped.
+            clock (Callable[[], float]): Time source in seconds used for downsampling.
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self._max_pending = max_pending
+        self._clock = clock
+        self._subscribers: set[_Subscriber[T]] = set()
+        self._upstream: asyncio.Task | None = None
+        self._upstream_interval: float | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        """The number of active consumers."""
+        return len(self._subscribers)
+
+    @property
+    def is_streaming(self) -> bool:
+        """Whether the upstream subscription is open."""
+        return self._upstream is not None and not self._upstream.done()
+
+    @property
+    def upstream_interval(self) -> float | None:
+        """The interval in seconds the open upstream was requested with, None for full rate."""
+        return self._upstream_interval
+
+    async def subscribe(
+        self,
+        open_stream: Callable[[float | None], AsyncIterator[T]],
+        min_interval: float | None = None,
+    ) -> AsyncGenerator[T, None]:
+        """Yield the states of the shared upstream stream.
+
+        Args:
+            open_stream: Opens the upstream stream with the interval in seconds between two
+                states, None for the full rate. Only called if no upstream is open yet or if it
+                is too slow for this consumer.
+            min_interval: Minimal time in seconds between two states delivered to this
+                consumer. Defaults to None, which delivers every state.
+
+        Raises:
+            Exception: Any error of the upstream stream is raised in all consumers. The next
+                consumer opens a new upstream.
+        """
+        subscriber: _Subscriber[T] = _Subscriber(
+            queue=asyncio.Queue(maxsize=self._max_pending), min_interval=min_interval
+        )
+        self._subscribers.add(subscriber)
+        self._ensure_upstream(open_stream, min_interval)
+        try:
+            while True:
+                item = await subscriber.queue.get()
+                if isinstance(item, _End):
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            self._subscribers.discard(subscriber)
+            if not self._subscribers and self._upstream is not None:
+                # the last consumer left, close the upstream subscription
+                self._upstream.cancel()
+                self._upstream = None
+
+    def _ensure_upstream(
+        self, open_stream: Callable[[float | None], AsyncIterator[T]], interval: float | None
+    ) -> None:
+        if (
+            self._upstream is not None
+            and not self._upstream.done()
+            and self._upstream.get_loop() is asyncio.get_running_loop()
+        ):
+            if not _is_faster(interval, self._upstream_interval):
+                return
+            # reopen the upstream at the faster rate, the subscribers stay registered
+            self._upstream.cancel()
+        self._upstream_interval = interval
+        self._upstream = asyncio.create_task(
+            self._pump(open_stream, interval), name="state-stream-hub"
+        )
+
+    async def _pump(
+        self, open_stream: Callable[[float | None], AsyncIterator[T]], interval: float | None
+    ) -> None:
+        end: _End | BaseException = _END
+        try:
+            stream = open_stream(interval)
+            async with aclosing(stream) as stream:  # ty: ignore[invalid-argument-type]
+                async for item in stream:
+                    now = self._clock()
+                    for subscriber in list(self._subscribers):
+                        subscriber.offer(item, now)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Upstream state stream failed: {type(e).__name__}: {e}")
+            end = e
+
+        # the upstream ended, consumers that subscribe afterwards open a new one
+        subscribers = list(self._subscribers)
+        self._subscribers.clear()
+        if self._upstream is asyncio.current_task():
+            self._upstream = None
+        for subscriber in subscribers:
+            subscriber.offer(end, self._clock())
+
+
+def _is_faster(interval: float | None, current: float | None) -> bool:
+    """Return whether ``interval`` asks for more states than ``current``, None is full rate."""
+    if current is None:
+        return False
+    return interval is None or interval < current
+
+
+# (cell, controller, motion group) -> hub, per API client
+_motion_group_state_hubs: weakref.WeakKeyDictionary[
+    Any, dict[tuple[str, str, str], StateStreamHub[api.models.MotionGroupState]]
+] = weakref.WeakKeyDictionary()
+
+
+def motion_group_state_hub(
+    api_client: Any, cell: str, controller_id: str, motion_group_id: str
+) -> StateStreamHub[api.models.MotionGroupState]:
+    """Return the hub shared by all consumers of a motion group state stream.
+
+    Hubs are kept per API client, so all :class:`MotionGroup` instances of the same motion
+    group that talk to the same API share one upstream subscription.
+    """
+    hubs = _motion_group_state_hubs.setdefault(api_client, {})
+    key = (cell, controller_id, motion_group_id)
+    hub = hubs.get(key)
+    if hub is None:
+        hub = hubs[key] = StateStreamHub()
+    return hub
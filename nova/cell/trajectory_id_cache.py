@@ -0,0 +1,115 @@
+"""Reuse trajectories that were already uploaded to the controller.
+
+Before a trajectory is executed it is added to the trajectory cache of the controller, which
+answers with an ID the execution refers to. Repetitive programs upload the identical trajectory
+every cycle. A :class:`TrajectoryIdCache` remembers the IDs by trajectory content and TCP, so
+the upload is skipped as long as the controller still knows the trajectory.
+"""
+
+import hashlib
+import weakref
+from collections import OrderedDict
+from typing import Any
+
+from nova import api
+
+
+def trajectory_id_cache_key(
+    motion_group_id: str, joint_trajectory: api.models.JointTrajectory, tcp: str | None
+) -> str:
+    """Return a hash over the motion group, the trajectory content and the TCP.
+
+    Example:
+    >>> trajectory = api.models.JointTrajectory(
+    ...     joint_positions=[api.models.Joints([0.0])],
+    ...     times=[0.0],
+    ...     locations=[api.models.Location(0.0)],
+    ... )
+    >>> key = trajectory_id_cache_key("0@ur", trajectory, "flange")
+    >>> key == trajectory_id_cache_key("0@ur", trajectory, None)
+    False
+    """
+    digest = hashlib.sha256()
+    digest.update(motion_group_id.encode())
+    digest.update(b"\0")
+    digest.update((tcp or "").encode())
+    digest.update(b"\0")
+    digest.update(joint_trajectory.model_dump_json().encode())
+    return digest.hexdigest()
+
+
+class TrajectoryIdCache:
+    """Maps trajectory cache keys to controller trajectory IDs, evicting the least recently used.
+
+    Evicted trajectories are only forgotten locally, they stay in the trajectory cache of the
+    controller.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        """
+        Args:
+            max_entries (int): Maximum number of trajectory IDs to keep.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    @property
+    def max_entries(self) -> int:
+        """Maximum number of trajectory IDs to keep."""
+        return self._max_entries
+
+    def grow(self, max_entries: int) -> None:
+        """Raise the capacity to ``max_entries``, a smaller value keeps the current capacity."""
+        self._max_entries = max(self._max_entries, max_entries)
+
+    def get(self, key: str) -> str | None:
+        """Return the trajectory ID stored under ``key`` or None if there is none."""
+        trajectory_id = self._entries.get(key)
+        if trajectory_id is not None:
+            self._entries.move_to_end(key)
+        return trajectory_id
+
+    def put(self, key: str, trajectory_id: str) -> None:
+        """Store ``trajectory_id`` under ``key``, evicting the least recently used entry if full."""
+        self._entries[key] = trajectory_id
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        """Remove the entry stored under ``key`` if there is one."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# (cell, controller) -> cache, per API client
+_trajectory_id_caches: weakref.WeakKeyDictionary[Any, dict[tuple[str, str], TrajectoryIdCache]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def controller_trajectory_id_cache(
+    api_client: Any, cell: str, controller_id: str, max_entries: int
+) -> TrajectoryIdCache:
+    """Return the trajectory ID cache shared by all motion groups of a controller.
+
+    Caches are kept per API client, so short lived :class:`MotionGroup` instances reuse the
+    uploads of their predecessors. Motion groups asking for different sizes share the cache,
+    which grows to the largest requested ``max_entries``.
+    """
+    caches = _trajectory_id_caches.setdefault(api_client, {})
+    key = (cell, controller_id)
+    cache = caches.get(key)
+    if cache is None:
+        cache = caches[key] = TrajectoryIdCache(max_entries=max_entries)
+    else:
+        cache.grow(max_entries)
+    return cache
@@ -1,7 +1,9 @@
+from pathlib import Path
+from typing import Literal
 from urllib.parse import urlparse
 
 from decouple import config
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 # Configuration for accessing the Nova platform
 INTERNAL_CLUSTER_NOVA_API = "http://api-gateway.wandelbots.svc.cluster.local:8080"
@@ -22,6 +24,102 @@ LOG_DATETIME_FORMAT: str = config("LOG_DATETIME_FORMAT", default="%Y-%m-%d %H:%M
 # Feature flags
 ENABLE_TRAJECTORY_TUNING = config("ENABLE_TRAJECTORY_TUNING", cast=bool, default=False)
 
+# Caching
+# Seconds a fetched motion group description is reused before it is requested again (0 disables)
+MOTION_GROUP_DESCRIPTION_CACHE_TTL: float = config(
+    "MOTION_GROUP_DESCRIPTION_CACHE_TTL", cast=float, default=5.0
+)
+# Number of uploaded trajectory IDs remembered per controller for reuse (0 disables)
+TRAJECTORY_ID_CACHE_SIZE: int = config("TRAJECTORY_ID_CACHE_SIZE", cast=int, default=64)
+
+# HTTP transport shared by all API gateways of the same NOVA instance
+# Maximum number of open connections (0 means unlimited)
+HTTP_CONNECTION_POOL_SIZE: int = config("HTTP_CONNECTION_POOL_SIZE", cast=int, default=100)
+# Maximum number of open connections to the same host (0 means unlimited)
+HTTP_CONNECTION_POOL_SIZE_PER_HOST: int = config(
+    "HTTP_CONNECTION_POOL_SIZE_PER_HOST", cast=int, default=0
+)
+# Seconds an idle connection is kept open for reuse
+HTTP_KEEPALIVE_TIMEOUT: float = config("HTTP_KEEPALIVE_TIMEOUT", cast=float, default=30.0)
+# Seconds resolved host names are cached (0 disables the DNS cache)
+HTTP_DNS_CACHE_TTL: int = config("HTTP_DNS_CACHE_TTL", cast=int, default=300)
+# Default timeouts in seconds for requests that don't specify their own
+HTTP_REQUEST_TIMEOUT: float = config("HTTP_REQUEST_TIMEOUT", cast=float, default=300.0)
+HTTP_CONNECT_TIMEOUT: float = config("HTTP_CONNECT_TIMEOUT", cast=float, default=10.0)
+# Merge identical concurrent read calls (get_*/list_*) of an API gateway into one request
+COALESCE_READ_REQUESTS = config("COALESCE_READ_REQUESTS", cast=bool, default=False)
+
+# Observability
+# Record latency histograms, error counters and in-flight gauges per API endpoint
+API_METRICS = config("API_METRICS", cast=bool, default=False)
+# Wrap every API call in an OpenTelemetry span (requires opentelemetry to be installed)
+API_TRACING = config("API_TRACING", cast=bool, default=False)
+
+# Offline runs
+# Record all API calls to this file, or replay them from it instead of calling NOVA
+API_RECORDING_PATH = config("API_RECORDING_PATH", default=None)
+# "record" or "replay"
+API_RECORDING_MODE = config("API_RECORDING_MODE", default="replay")
+
+# Planning
+# Minimal number of motions per segment when wandelscript plans ahead while executing (0 disables)
+PLAN_AHEAD_SEGMENT_SIZE: int = config("PLAN_AHEAD_SEGMENT_SIZE", cast=int, default=0)
+
+
+class HttpTransportConfig(BaseModel):
+    """
+    Connection pool and timeout settings of the HTTP transport used for the Nova API.
+
+    All API gateways with the same host, SSL verification and transport settings share one
+    connection pool.
+
+    Args:
+        pool_size (int): Maximum number of open connections, 0 means unlimited.
+        pool_size_per_host (int): Maximum number of open connections to the same host, 0 means
+            unlimited.
+        keepalive_timeout (float): Seconds an idle connection is kept open for reuse.
+        dns_cache_ttl (int): Seconds resolved host names are cached, 0 disables the DNS cache.
+        request_timeout (float): Total timeout in seconds of requests that don't specify their own.
+        connect_timeout (float): Timeout in seconds for establishing a connection.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    pool_size: int = Field(default=HTTP_CONNECTION_POOL_SIZE, ge=0)
+    pool_size_per_host: int = Field(default=HTTP_CONNECTION_POOL_SIZE_PER_HOST, ge=0)
+    keepalive_timeout: float = Field(default=HTTP_KEEPALIVE_TIMEOUT, ge=0)
+    dns_cache_ttl: int = Field(default=HTTP_DNS_CACHE_TTL, ge=0)
+    request_timeout: float = Field(default=HTTP_REQUEST_TIMEOUT, gt=0)
+    connect_timeout: float = Field(default=HTTP_CONNECT_TIMEOUT, gt=0)
+
+
+class ApiRecordingConfig(BaseModel):
+    """
+    Record the calls to the Nova API to a file or replay them from it, see nova.core.recording.
+
+    Args:
+        path (Path): The JSON lines file the calls are recorded to or replayed from.
+        mode (Literal["record", "replay"]): Whether to record the calls to a live Nova instance
+            or to answer them from the recording without network access.
+        latency (float | None): Seconds every replayed call takes. Defaults to None, which
+            replays the recorded durations.
+        time_scale (float): Factor applied to the recorded durations and stream timings on
+            replay. 0 replays as fast as possible.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    path: Path
+    mode: Literal["record", "replay"] = "replay"
+    latency: float | None = Field(default=None, ge=0)
+    time_scale: float = Field(default=1.0, ge=0)
+
+
+def _default_recording() -> ApiRecordingConfig | None:
+    if not API_RECORDING_PATH:
+        return None
+    return ApiRecordingConfig(path=API_RECORDING_PATH, mode=API_RECORDING_MODE)
+
 
 class NovaConfig(BaseModel):
     """
@@ -33,6 +131,14 @@ class NovaConfig(BaseModel):
         version (str): The API version to use (default: "v1").
         verify_ssl (bool): Whether or not to verify SSL certificates (default: True).
         nats_client_config (dict | None): Configuration dictionary for NATS client.
+        transport (HttpTransportConfig): Connection pool and timeout settings.
+        coalesce_read_requests (bool): Merge identical concurrent read calls (``get_*`` and
+            ``list_*``) into one request whose response is shared by all callers.
+        api_metrics (bool): Record per endpoint latency, error and in-flight metrics of the API
+            calls, see :meth:`Nova.metrics`.
+        api_tracing (bool): Wrap every API call in an OpenTelemetry span.
+        recording (ApiRecordingConfig | None): Record the API calls to a file or replay them
+            from it.
     """
 
     host: str = Field(..., description="Nova API host.")
@@ -42,6 +148,11 @@ class NovaConfig(BaseModel):
         default=None,
         description="Client configuration to pass to the nats library. See: https://nats-io.github.io/nats.py/modules.html#nats.aio.client.Client.connect",
     )
+    transport: HttpTransportConfig = Field(default_factory=HttpTransportConfig)
+    coalesce_read_requests: bool = Field(default=COALESCE_READ_REQUESTS)
+    api_metrics: bool = Field(default=API_METRICS)
+    api_tracing: bool = Field(default=API_TRACING)
+    recording: ApiRecordingConfig | None = Field(default_factory=_default_recording)
 
     @model_validator(mode="after")
     def _normalize_host_prefix(self) -> "NovaConfig":
@@ -1,13 +1,16 @@
 import asyncio
 import functools
+import importlib
 import logging
-import time
 from abc import ABC
-from typing import TypeVar
+from typing import Any, Awaitable, Callable, Hashable, TypeVar, overload
 
 from nova import api
 from nova.cell.robot_cell import ConfigurablePeriphery, Device
 from nova.config import NovaConfig
+from nova.core.metrics import ApiCallObserver, api_metrics
+from nova.core.recording import ApiRecording
+from nova.core.transport import SharedRESTClient
 from nova.version import version as pkg_version
 
 logger = logging.getLogger(__name__)
@@ -17,10 +20,55 @@ _API_VERSION = "v2"
 T = TypeVar("T")
 
 
+# Prefixes of API methods that only read and can therefore be merged while in flight
+_READ_METHOD_PREFIXES = ("get_", "list_")
+
+
+class _SingleFlight:
+    """Merges identical concurrent calls into one call whose result is shared.
+
+    The call runs in its own task, so a caller that is cancelled does not cancel the call for
+    the other callers.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    async def call(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._in_flight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._done, key))
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # all callers may have been cancelled, don't warn about an unretrieved exception
+            task.exception()
+
+
+def _single_flight_key(instance: object, name: str, args: tuple, kwargs: dict) -> Hashable | None:
+    key = (id(instance), name, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        # e.g. request bodies, such calls are not merged
+        return None
+    return key
+
+
 class _Interceptor:
-    def __init__(self, instance: T, gateway: "ApiGateway"):
+    def __init__(self, instance: T, gateway: "ApiGateway", api_name: str | None = None):
         self._instance = instance
         self._gateway = gateway
+        self._api_name = api_name or type(instance).__name__
 
     def __getattr__(self, name):
         original_attr = getattr(self._instance, name)
@@ -28,35 +76,47 @@ class _Interceptor:
             return original_attr
 
         if asyncio.iscoroutinefunction(original_attr):
+            endpoint = f"{self._api_name}.{name}"
+            observer = self._gateway._call_observer
 
-            @functools.wraps(original_attr)
-            async def async_wrapper(*args, **kwargs):
-                start = time.time()
+            async def call(*args, **kwargs):
+                observation = observer.start(endpoint) if observer is not None else None
+                error: BaseException | None = None
                 try:
                     return await original_attr(*args, **kwargs)
                 except Exception as e:
-                    logger.error(f"API CALL: {name} failed with error: {e}")
-                    logger.debug(f"API CALL FAILED: {name} with args={args}, kwargs={kwargs}")
+                    error = e
+                    logger.error("API CALL: %s failed with error: %s", name, e)
+                    logger.debug("API CALL FAILED: %s with args=%s, kwargs=%s", name, args, kwargs)
                     raise e
                 finally:
-                    duration = time.time() - start
-                    logger.debug(f"API CALL: {name} took {duration:.2f} seconds")
-                    logger.debug(f"API CALL: {name} with args={args}, kwargs={kwargs}")
+                    if observation is not None:
+                        observer.finish(observation, error)
+                    logger.debug("API CALL: %s with args=%s, kwargs=%s", name, args, kwargs)
+
+            single_flight = self._gateway._single_flight
+            if single_flight is None or not name.startswith(_READ_METHOD_PREFIXES):
+                return functools.wraps(original_attr)(call)
+
+            @functools.wraps(original_attr)
+            async def async_wrapper(*args, **kwargs):
+                key = _single_flight_key(self._instance, name, args, kwargs)
+                if key is None:
+                    return await call(*args, **kwargs)
+                # identical calls that start while this one is in flight share its response
+                return await single_flight.call(key, lambda: call(*args, **kwargs))
 
             return async_wrapper
 
         @functools.wraps(original_attr)
         def sync_wrapper(*args, **kwargs):
-            start = time.time()
             try:
                 return original_attr(*args, **kwargs)
             except Exception as e:
-                logger.error(f"API CALL: {name} failed with error: {e}")
+                logger.error("API CALL: %s failed with error: %s", name, e)
                 raise e
             finally:
-                duration = time.time() - start
-                logger.debug(f"API CALL: {name} took {duration:.2f} seconds")
-                logger.debug(f"API CALL: {name} with args={args}, kwargs={kwargs}")
+                logger.debug("API CALL: %s with args=%s, kwargs=%s", name, args, kwargs)
 
         return sync_wrapper
 
@@ -66,16 +126,101 @@ class _Interceptor:
 
 
 def _intercept(api_instance: T, gateway: "ApiGateway") -> T:
+    api_name = type(api_instance).__name__
+    if gateway._recording is not None:
+        api_instance = gateway._recording.wrap(api_instance)
     # we ignore the type error here because
     # we want the return type to be the same as the original api instance to not break typing support
-    return _Interceptor(api_instance, gateway)  # ty: ignore[invalid-return-type]
+    return _Interceptor(api_instance, gateway, api_name)  # ty: ignore[invalid-return-type]
+
+
+# package of the generated API modules, one module per API class
+_API_PACKAGE = "wandelbots_api_client.v2_pydantic.api"
+
+
+class _LazyApi:
+    """A generated API of the gateway, created and intercepted on first access.
+
+    Most programs only use a few of the APIs, so they are not created for every gateway. The
+    API class is imported from its own module of the generated client on first access. The
+    created API is cached in the gateway's ``__dict__``, so later lookups don't reach the
+    descriptor.
+    """
+
+    def __init__(self, module: str, class_name: str):
+        self._module = module
+        self._class_name = class_name
+        self._name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    @overload
+    def __get__(self, gateway: None, owner: type | None = None) -> "_LazyApi": ...
+
+    @overload
+    def __get__(self, gateway: "ApiGateway", owner: type | None = None) -> Any: ...
+
+    def __get__(self, gateway, owner=None):
+        if gateway is None:
+            return self
+        module = importlib.import_module(f"{_API_PACKAGE}.{self._module}")
+        api_class = getattr(module, self._class_name)
+        api_instance = _intercept(api_class(api_client=gateway._api_client), gateway)
+        gateway.__dict__[self._name] = api_instance
+        return api_instance
 
 
 class ApiGateway:
+    system_api = _LazyApi("system_api", "SystemApi")
+    controller_api = _LazyApi("controller_api", "ControllerApi")
+    controller_ios_api = _LazyApi("controller_inputs_outputs_api", "ControllerInputsOutputsApi")
+    virtual_controller_api = _LazyApi("virtual_controller_api", "VirtualControllerApi")
+    virtual_controller_behavior_api = _LazyApi(
+        "virtual_controller_behavior_api", "VirtualControllerBehaviorApi"
+    )
+    motion_group_api = _LazyApi("motion_group_api", "MotionGroupApi")
+    motion_group_jogging_api = _LazyApi("jogging_api", "JoggingApi")
+    store_collision_components_api = _LazyApi(
+        "store_collision_components_api", "StoreCollisionComponentsApi"
+    )
+    motion_group_models_api = _LazyApi("motion_group_models_api", "MotionGroupModelsApi")
+    store_collision_setups_api = _LazyApi("store_collision_setups_api", "StoreCollisionSetupsApi")
+    trajectory_planning_api = _LazyApi("trajectory_planning_api", "TrajectoryPlanningApi")
+    trajectory_execution_api = _LazyApi("trajectory_execution_api", "TrajectoryExecutionApi")
+    trajectory_caching_api = _LazyApi("trajectory_caching_api", "TrajectoryCachingApi")
+    controller_inputs_outputs_api = _LazyApi(
+        "controller_inputs_outputs_api", "ControllerInputsOutputsApi"
+    )
+    jogging_api = _LazyApi("jogging_api", "JoggingApi")
+    store_object_api = _LazyApi("store_object_api", "StoreObjectApi")
+    kinematics_api = _LazyApi("kinematics_api", "KinematicsApi")
+    cell_api = _LazyApi("cell_api", "CellApi")
+    bus_ios_api = _LazyApi("bus_inputs_outputs_api", "BUSInputsOutputsApi")
+
     def __init__(self, config: NovaConfig):
         self.config = config
+        # merges identical concurrent read calls if enabled, see NovaConfig.coalesce_read_requests
+        self._single_flight = _SingleFlight() if config.coalesce_read_requests else None
+        # records the calls to a file or replays them from it, see nova.core.recording
+        self._recording = (
+            ApiRecording.shared(config.recording) if config.recording is not None else None
+        )
+        # records latency, errors and in-flight calls if enabled, see nova.core.metrics
+        self._call_observer = (
+            ApiCallObserver(
+                metrics=api_metrics if config.api_metrics else None, tracing=config.api_tracing
+            )
+            if config.api_metrics or config.api_tracing
+            else None
+        )
         self._init_api_client()
 
+    # TODO migrate stuff in rerun bridge and then remove this
+    @property
+    def virtual_robot_setup_api(self) -> api.api.VirtualControllerApi:
+        return self.virtual_controller_api
+
     def _init_api_client(self):
         """Initialize or reinitialize the API client with current credentials"""
         api_client_config = api.Configuration(
@@ -83,58 +228,14 @@ class ApiGateway:
         )
         api_client_config.verify_ssl = self.config.verify_ssl
         self._api_client = api.ApiClient(configuration=api_client_config)
+        # all gateways of the same NOVA instance share one connection pool
+        self._api_client.rest_client = SharedRESTClient(api_client_config, self.config.transport)
         self._api_client.user_agent = f"Wandelbots-Nova-Python-SDK/{pkg_version}"
 
-        # Use the intercept function to wrap each API client
-        self.system_api = _intercept(api.api.SystemApi(api_client=self._api_client), self)
-        self.controller_api = _intercept(api.api.ControllerApi(api_client=self._api_client), self)
-        self.controller_ios_api = _intercept(
-            api.api.ControllerInputsOutputsApi(api_client=self._api_client), self
-        )
-        self.virtual_controller_api = _intercept(
-            api.api.VirtualControllerApi(api_client=self._api_client), self
-        )
-        self.virtual_controller_behavior_api = _intercept(
-            api.api.VirtualControllerBehaviorApi(api_client=self._api_client), self
-        )
-        # TODO migrate stuff in rerun bridge and then remove this
-        self.virtual_robot_setup_api = self.virtual_controller_api
-        self.motion_group_api = _intercept(
-            api.api.MotionGroupApi(api_client=self._api_client), self
-        )
-        self.motion_group_jogging_api = _intercept(
-            api.api.JoggingApi(api_client=self._api_client), self
-        )
-        self.store_collision_components_api = _intercept(
-            api.api.StoreCollisionComponentsApi(api_client=self._api_client), self
-        )
-        self.motion_group_models_api: api.api.MotionGroupModelsApi = _intercept(
-            api.api.MotionGroupModelsApi(api_client=self._api_client), self
-        )
-        self.store_collision_setups_api = _intercept(
-            api.api.StoreCollisionSetupsApi(api_client=self._api_client), self
-        )
-        self.trajectory_planning_api: api.api.TrajectoryPlanningApi = _intercept(
-            api.api.TrajectoryPlanningApi(api_client=self._api_client), self
-        )
-        self.trajectory_execution_api: api.api.TrajectoryExecutionApi = _intercept(
-            api.api.TrajectoryExecutionApi(api_client=self._api_client), self
-        )
-        self.trajectory_caching_api: api.api.TrajectoryCachingApi = _intercept(
-            api.api.TrajectoryCachingApi(api_client=self._api_client), self
-        )
-        self.controller_inputs_outputs_api = _intercept(
-            api.api.ControllerInputsOutputsApi(api_client=self._api_client), self
-        )
-        self.jogging_api = _intercept(api.api.JoggingApi(api_client=self._api_client), self)
-        self.store_object_api = _intercept(
-            api.api.StoreObjectApi(api_client=self._api_client), self
-        )
-        self.kinematics_api = _intercept(api.api.KinematicsApi(api_client=self._api_client), self)
-        self.cell_api = _intercept(api.api.CellApi(api_client=self._api_client), self)
-        self.bus_ios_api = _intercept(
-            api.api.BUSInputsOutputsApi(api_client=self._api_client), self
-        )
+        # APIs created with the previous client are created again on next access
+        for name, attr in vars(ApiGateway).items():
+            if isinstance(attr, _LazyApi):
+                self.__dict__.pop(name, None)
 
         logger.debug(f"NOVA API client initialized with user agent {self._api_client.user_agent}")
 
@@ -0,0 +1,204 @@
+"""Latency, error and in-flight metrics of the calls to the NOVA API.
+
+Every API call of an :class:`ApiGateway` goes through an interceptor. If metrics are enabled
+(``NovaConfig.api_metrics``), the interceptor reports each call to the process wide
+:data:`api_metrics`, which keeps a latency histogram, an error counter and an in-flight gauge
+per endpoint. :meth:`Nova.metrics` returns a snapshot of it. If tracing is enabled
+(``NovaConfig.api_tracing``) and OpenTelemetry is installed, every call is additionally wrapped
+in a span.
+
+Disabled metrics and tracing cost nothing: the interceptor skips the observer entirely.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds of the latency histogram buckets, a last bucket collects the rest
+LATENCY_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass(frozen=True)
+class EndpointMetrics:
+    """Snapshot of the calls to one API endpoint.
+
+    Attributes:
+        calls (int): Number of finished calls.
+        errors (int): Number of finished calls that raised an exception.
+        in_flight (int): Number of calls that are currently running.
+        total_seconds (float): Accumulated duration of all finished calls.
+        max_seconds (float): Duration of the slowest finished call.
+        buckets (tuple[int, ...]): Number of finished calls per latency bucket, see
+            :data:`LATENCY_BUCKETS`. The last entry counts calls slower than the last bound.
+    """
+
+    calls: int
+    errors: int
+    in_flight: int
+    total_seconds: float
+    max_seconds: float
+    buckets: tuple[int, ...]
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls > 0 else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Return the upper bound of the bucket that contains the ``q`` quantile of the latency.
+
+        Calls slower than the last bucket bound are reported with ``max_seconds``.
+
+        Example:
+        >>> metrics = EndpointMetrics(4, 0, 0, 0.1, 0.07, (1, 2, 0, 1) + (0,) * 8)
+        >>> metrics.quantile(0.5), metrics.quantile(1.0)
+        (0.01, 0.05)
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be between 0 and 1")
+        if self.calls == 0:
+            return 0.0
+        rank = q * self.calls
+        count = 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS, self.buckets):
+            count += bucket_count
+            if count >= rank:
+                return bound
+        return self.max_seconds
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Snapshot of the metrics of all API endpoints, keyed by ``"<Api>.<method>"``."""
+
+    endpoints: dict[str, EndpointMetrics]
+
+    def slowest(self, count: int = 10) -> list[tuple[str, EndpointMetrics]]:
+        """Return the ``count`` endpoints with the highest mean latency."""
+        return sorted(self.endpoints.items(), key=lambda item: item[1].mean_seconds, reverse=True)[
+            :count
+        ]
+
+
+class _EndpointCounters:
+    __slots__ = ("calls", "errors", "in_flight", "total_seconds", "max_seconds", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+
+class ApiMetrics:
+    """Collects per endpoint latency histograms, error counters and in-flight gauges."""
+
+    def __init__(self):
+        self._endpoints: dict[str, _EndpointCounters] = {}
+
+    def _counters(self, endpoint: str) -> _EndpointCounters:
+        counters = self._endpoints.get(endpoint)
+        if counters is None:
+            counters = self._endpoints[endpoint] = _EndpointCounters()
+        return counters
+
+    def call_started(self, endpoint: str) -> None:
+        self._counters(endpoint).in_flight += 1
+
+    def call_finished(self, endpoint: str, duration: float, error: bool) -> None:
+        counters = self._counters(endpoint)
+        counters.in_flight -= 1
+        counters.calls += 1
+        if error:
+            counters.errors += 1
+        counters.total_seconds += duration
+        counters.max_seconds = max(counters.max_seconds, duration)
+        counters.buckets[bisect.bisect_left(LATENCY_BUCKETS, duration)] += 1
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Return the current state of all endpoints."""
+        return MetricsSnapshot(
+            endpoints={
+                endpoint: EndpointMetrics(
+                    calls=counters.calls,
+                    errors=counters.errors,
+                    in_flight=counters.in_flight,
+                    total_seconds=counters.total_seconds,
+                    max_seconds=counters.max_seconds,
+                    buckets=tuple(counters.buckets),
+                )
+                for endpoint, counters in self._endpoints.items()
+            }
+        )
+
+    def reset(self) -> None:
+        """Forget all finished calls, calls in flight are still counted."""
+        for endpoint, counters in list(self._endpoints.items()):
+            in_flight = counters.in_flight
+            if in_flight == 0:
+                del self._endpoints[endpoint]
+                continue
+            counters.__init__()
+            counters.in_flight = in_flight
+
+
+# Shared by all API gateways of the process, so the metrics of all controllers end up in one place
+api_metrics = ApiMetrics()
+
+
+def _opentelemetry_tracer() -> Any | None:
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        logger.warning("API tracing is enabled but opentelemetry is not installed")
+        return None
+    return trace.get_tracer("nova.api")
+
+
+class _Observation:
+    __slots__ = ("endpoint", "start", "span")
+
+    def __init__(self, endpoint: str, start: float, span: Any | None):
+        self.endpoint = endpoint
+        self.start = start
+        self.span = span
+
+
+class ApiCallObserver:
+    """Reports API calls to :class:`ApiMetrics` and, optionally, to OpenTelemetry spans."""
+
+    def __init__(self, metrics: ApiMetrics | None = None, tracing: bool = False):
+        """
+        Args:
+            metrics (ApiMetrics | None): Where to record the calls. Calls are not recorded if
+                None.
+            tracing (bool): Whether to wrap every call in an OpenTelemetry span.
+        """
+        self._metrics = metrics
+        self._tracer = _opentelemetry_tracer() if tracing else None
+
+    def start(self, endpoint: str) -> _Observation:
+        if self._metrics is not None:
+            self._metrics.call_started(endpoint)
+        span = self._tracer.start_span(f"nova.api.{endpoint}") if self._tracer is not None else None
+        return _Observation(endpoint, time.perf_counter(), span)
+
+    def finish(self, observation: _Observation, error: BaseException | None = None) -> None:
+        duration = time.perf_counter() - observation.start
+        if self._metrics is not None:
+            self._metrics.call_finished(observation.endpoint, duration, error is not None)
+        span = observation.span
+        if span is not None:
+            if error is not None:
+                from opentelemetry.trace import Status, StatusCode
+
+                span.record_exception(error)
+                span.set_status(Status(StatusCode.ERROR, str(error)))
+            span.end()
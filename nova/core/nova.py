@@ -7,6 +7,7 @@ from nova.config import CELL_NAME, NovaConfig, default_config
 from nova.logging import logger
 
 from .gateway import ApiGateway
+from .metrics import MetricsSnapshot, api_metrics
 
 
 class Nova:
@@ -36,6 +37,15 @@ class Nova:
     def api(self) -> ApiGateway:
         return self._api_client
 
+    def metrics(self) -> MetricsSnapshot:
+        """Returns a snapshot of the latency, error and in-flight metrics per API endpoint.
+
+        Metrics are only recorded if ``api_metrics`` is enabled in the :class:`NovaConfig` (or
+        ``API_METRICS`` in the environment). They are shared by all NOVA instances and
+        controllers of the process.
+        """
+        return api_metrics.snapshot()
+
     def cell(self, cell_id: str = CELL_NAME) -> Cell:
         """Returns the cell object with the given ID."""
         return Cell(self._api_client, cell_id, nats_client=self.nats)
@@ -61,6 +71,9 @@ class Nova:
             pass
 
         # ApiGateway doesn't need an explicit connect call, it's initialized in constructor
+        if self._config.recording is not None and self._config.recording.mode == "replay":
+            logger.info("Replaying recorded API calls, not connecting to NATS")
+            return
         await self.nats.connect(**(self._config.nats_client_config or {}))
 
     async def connect(self):
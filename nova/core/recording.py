@@ -0,0 +1,401 @@
+"""Record the calls to the NOVA API and replay them without a NOVA instance.
+
+Run a program once against a live instance with recording enabled::
+
+    config = NovaConfig(host=..., recording=ApiRecordingConfig(path="calls.jsonl", mode="record"))
+
+Every API call is written to ``calls.jsonl`` with its arguments, response and duration. State
+streams and the bidirectional execution and jogging endpoints are recorded with the timing of
+every message. Replaying the file answers the same calls without network access::
+
+    config = NovaConfig(
+        host="", recording=ApiRecordingConfig(path="calls.jsonl", mode="replay", time_scale=0)
+    )
+
+The recording works below the gateway interceptor, so metrics and request coalescing behave the
+same on replay. Calls are matched by endpoint and arguments. Identical calls are answered with
+the recorded responses in order, the last one is repeated once they run out. Calls that were not
+recorded raise :class:`ApiRecordingMissing`. Recording and replay can also be enabled with the
+``API_RECORDING_PATH`` and ``API_RECORDING_MODE`` environment variables.
+
+State streams replay independently of the execution endpoint. With ``time_scale=0`` states may
+therefore arrive earlier relative to the execution than they did live.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, AsyncGenerator, Awaitable, Callable
+
+from pydantic import BaseModel
+
+from nova import api
+from nova.config import ApiRecordingConfig
+from nova.exceptions import ApiRecordingMissing
+
+logger = logging.getLogger(__name__)
+
+_CALL = "call"
+_STREAM = "stream"
+_BIDIRECTIONAL = "bidirectional"
+# parameter of the websocket endpoints that produces the requests sent to the server
+_REQUEST_GENERATOR = "client_request_generator"
+
+
+def _encode(value: Any) -> Any:
+    """Encode a request argument or response as JSON, keeping the model types."""
+    if isinstance(value, BaseModel):
+        return {
+            "model": type(value).__name__,
+            "value": value.model_dump(mode="json", by_alias=True),
+        }
+    if isinstance(value, (list, tuple)):
+        return {"list": [_encode(item) for item in value]}
+    if isinstance(value, dict):
+        return {"dict": {str(key): _encode(item) for key, item in value.items()}}
+    return {"json": value}
+
+
+def _decode(data: Any) -> Any:
+    if "model" in data:
+        return getattr(api.models, data["model"]).model_validate(data["value"])
+    if "list" in data:
+        return [_decode(item) for item in data["list"]]
+    if "dict" in data:
+        return {key: _decode(item) for key, item in data["dict"].items()}
+    return data["json"]
+
+
+def _encode_error(error: BaseException) -> dict:
+    return {
+        "type": type(error).__name__,
+        "message": str(error),
+        "status": getattr(error, "status", None),
+        "reason": getattr(error, "reason", None),
+    }
+
+
+def _decode_error(data: dict) -> Exception:
+    if data.get("status") is not None:
+        return api.ApiException(status=data["status"], reason=data.get("reason"))
+    return RuntimeError(f"{data['type']}: {data['message']}")
+
+
+def _request_key(args: tuple, kwargs: dict) -> str:
+    payload = {
+        "args": [_encode(arg) for arg in args if not callable(arg)],
+        "kwargs": {
+            name: _encode(value)
+            for name, value in sorted(kwargs.items())
+            # request options like _request_timeout don't change the response
+            if not callable(value) and not name.startswith("_")
+        },
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+async def _sleep(seconds: float) -> None:
+    # always yield to the event loop, like a real request would
+    await asyncio.sleep(max(seconds, 0.0))
+
+
+class ApiRecording:
+    """A file of recorded API calls, either being written or being replayed.
+
+    Use :meth:`shared` to get the recording of a :class:`ApiRecordingConfig`. All gateways of a
+    process that use the same configuration (e.g. the gateway of :class:`Nova` and the ones of
+    its controllers) then write to or read from the same recording.
+    """
+
+    def __init__(self, config: ApiRecordingConfig):
+        """
+        Args:
+            config (ApiRecordingConfig): Where to record to or replay from, and how.
+        """
+        self._config = config
+        self._path = Path(config.path)
+        # (api, method, request key) -> recorded entries in call order
+        self._entries: dict[tuple[str, str, str], list[dict]] = defaultdict(list)
+        self._replayed: dict[tuple[str, str, str], int] = defaultdict(int)
+        if config.mode == "record":
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._path.write_text("")
+        else:
+            self._load()
+
+    @classmethod
+    def shared(cls, config: ApiRecordingConfig) -> "ApiRecording":
+        """Return the recording of ``config``, opening it on first use."""
+        recording = _recordings.get(config)
+        if recording is None:
+            recording = _recordings[config] = cls(config)
+        return recording
+
+    @property
+    def config(self) -> ApiRecordingConfig:
+        return self._config
+
+    def _load(self) -> None:
+        with self._path.open() as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self._entries[(entry["api"], entry["method"], entry["key"])].append(entry)
+        logger.info(
+            f"Replaying {sum(map(len, self._entries.values()))} API calls from {self._path}"
+        )
+
+    def _write(self, entry: dict) -> None:
+        with self._path.open("a") as f:
+            f.write(json.dumps(entry, separators=(",", ":"), default=str))
+            f.write("\n")
+
+    def _next(self, api_name: str, method: str, key: str) -> dict:
+        entries = self._entries.get((api_name, method, key))
+        if not entries:
+            raise ApiRecordingMissing(f"{api_name}.{method}")
+        index = self._replayed[(api_name, method, key)]
+        self._replayed[(api_name, method, key)] = index + 1
+        return entries[min(index, len(entries) - 1)]
+
+    def _call_delay(self, entry: dict) -> float:
+        if self._config.latency is not None:
+            return self._config.latency
+        return entry["duration"] * self._config.time_scale
+
+    def wrap(self, instance: Any) -> Any:
+        """Wrap a generated API instance to record or replay its calls."""
+        if self._config.mode == "record":
+            return _RecordingApi(instance, self)
+        return _ReplayApi(instance, self)
+
+
+_recordings: dict[ApiRecordingConfig, ApiRecording] = {}
+
+
+def _is_bidirectional(method: Callable) -> bool:
+    try:
+        return _REQUEST_GENERATOR in inspect.signature(method).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+class _RecordingApi:
+    """Forwards all calls to a generated API instance and records them."""
+
+    def __init__(self, instance: Any, recording: ApiRecording):
+        self._instance = instance
+        self._recording = recording
+        self._api_name = type(instance).__name__
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._instance, name)
+        if not callable(attr) or name.startswith("_"):
+            return attr
+        if asyncio.iscoroutinefunction(attr):
+            if _is_bidirectional(attr):
+                return self._record_bidirectional(name, attr)
+            return self._record_call(name, attr)
+        return self._record_stream(name, attr)
+
+    def _entry(self, name: str, key: str, kind: str, **fields) -> dict:
+        return {"api": self._api_name, "method": name, "key": key, "kind": kind, **fields}
+
+    def _record_call(self, name: str, method: Callable) -> Callable:
+        async def call(*args, **kwargs):
+            key = _request_key(args, kwargs)
+            start = time.perf_counter()
+            try:
+                response = await method(*args, **kwargs)
+            except Exception as e:
+                duration = time.perf_counter() - start
+                self._recording._write(
+                    self._entry(name, key, _CALL, duration=duration, error=_encode_error(e))
+                )
+                raise
+            duration = time.perf_counter() - start
+            self._recording._write(
+                self._entry(name, key, _CALL, duration=duration, response=_encode(response))
+            )
+            return response
+
+        return call
+
+    def _record_stream(self, name: str, method: Callable) -> Callable:
+        def stream(*args, **kwargs):
+            result = method(*args, **kwargs)
+            if not inspect.isasyncgen(result):
+                return result
+            return self._record_items(name, _request_key(args, kwargs), result)
+
+        return stream
+
+    async def _record_items(
+        self, name: str, key: str, stream: AsyncGenerator
+    ) -> AsyncGenerator[Any, None]:
+        items: list[dict] = []
+        error = None
+        complete = False
+        start = time.perf_counter()
+        try:
+            async for item in stream:
+                items.append({"t": time.perf_counter() - start, "value": _encode(item)})
+                yield item
+            complete = True
+        except Exception as e:
+            error = _encode_error(e)
+            raise
+        finally:
+            # a stream that was closed by the consumer is replayed as a stream that stays open
+            self._recording._write(
+                self._entry(name, key, _STREAM, items=items, complete=complete, error=error)
+            )
+
+    def _record_bidirectional(self, name: str, method: Callable) -> Callable:
+        async def call(*args, **kwargs):
+            bound = inspect.signature(method).bind(*args, **kwargs)
+            request_generator = bound.arguments.pop(_REQUEST_GENERATOR)
+            key = _request_key(bound.args, bound.kwargs)
+            items: list[dict] = []
+            requests_sent = 0
+            start = time.perf_counter()
+
+            def recording_request_generator(responses):
+                async def recorded_responses():
+                    async for response in responses:
+                        items.append(
+                            {
+                                "t": time.perf_counter() - start,
+                                "after_requests": requests_sent,
+                                "value": _encode(response),
+                            }
+                        )
+                        yield response
+
+                async def requests():
+                    nonlocal requests_sent
+                    async for request in request_generator(recorded_responses()):
+                        requests_sent += 1
+                        yield request
+
+                return requests()
+
+            error = None
+            try:
+                return await method(
+                    *bound.args, **bound.kwargs, **{_REQUEST_GENERATOR: recording_request_generator}
+                )
+            except Exception as e:
+                error = _encode_error(e)
+                raise
+            finally:
+                self._recording._write(
+                    self._entry(
+                        name,
+                        key,
+                        _BIDIRECTIONAL,
+                        duration=time.perf_counter() - start,
+                        items=items,
+                        error=error,
+                    )
+                )
+
+        return call
+
+    def __dir__(self):
+        return self._instance.__dir__()
+
+
+class _ReplayApi:
+    """Answers the calls of a generated API instance from a recording."""
+
+    def __init__(self, instance: Any, recording: ApiRecording):
+        # only used to tell unary, streaming and bidirectional methods apart, it is never called
+        self._instance = instance
+        self._recording = recording
+        self._api_name = type(instance).__name__
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._instance, name)
+        if not callable(attr) or name.startswith("_"):
+            return attr
+        if asyncio.iscoroutinefunction(attr):
+            if _is_bidirectional(attr):
+                return self._replay_bidirectional(name, attr)
+            return self._replay_call(name)
+        return self._replay_stream(name)
+
+    def _replay_call(self, name: str) -> Callable:
+        recording = self._recording
+
+        async def call(*args, **kwargs):
+            entry = recording._next(self._api_name, name, _request_key(args, kwargs))
+            await _sleep(recording._call_delay(entry))
+            if entry.get("error") is not None:
+                raise _decode_error(entry["error"])
+            return _decode(entry["response"])
+
+        return call
+
+    async def _replay_items(
+        self, items: list[dict], wait_until_due: Callable[[dict], Awaitable[None]] | None = None
+    ) -> AsyncGenerator[Any, None]:
+        time_scale = self._recording.config.time_scale
+        previous = 0.0
+        for item in items:
+            await _sleep((item["t"] - previous) * time_scale)
+            previous = item["t"]
+            if wait_until_due is not None:
+                await wait_until_due(item)
+            yield _decode(item["value"])
+
+    def _replay_stream(self, name: str) -> Callable:
+        def stream(*args, **kwargs):
+            entry = self._recording._next(self._api_name, name, _request_key(args, kwargs))
+            return self._stream_items(entry)
+
+        return stream
+
+    async def _stream_items(self, entry: dict) -> AsyncGenerator[Any, None]:
+        async for item in self._replay_items(entry["items"]):
+            yield item
+        if entry.get("error") is not None:
+            raise _decode_error(entry["error"])
+        if not entry["complete"]:
+            # the consumer closed the live stream, keep it open until the consumer does so again
+            await asyncio.Event().wait()
+
+    def _replay_bidirectional(self, name: str, method: Callable) -> Callable:
+        recording = self._recording
+
+        async def call(*args, **kwargs):
+            bound = inspect.signature(method).bind(*args, **kwargs)
+            request_generator = bound.arguments.pop(_REQUEST_GENERATOR)
+            entry = recording._next(self._api_name, name, _request_key(bound.args, bound.kwargs))
+            requests_sent = 0
+            request_sent = asyncio.Event()
+
+            async def wait_until_due(item: dict) -> None:
+                # responses are delivered no earlier than after the requests they followed live
+                while requests_sent < item["after_requests"]:
+                    request_sent.clear()
+                    await request_sent.wait()
+
+            responses = self._replay_items(entry["items"], wait_until_due)
+            async for _ in request_generator(responses):
+                requests_sent += 1
+                request_sent.set()
+            if entry.get("error") is not None:
+                raise _decode_error(entry["error"])
+
+        return call
+
+    def __dir__(self):
+        return self._instance.__dir__()
@@ -0,0 +1,136 @@
+"""HTTP transport shared by all API gateways that talk to the same NOVA instance.
+
+The generated API client opens its own ``aiohttp`` connection pool per :class:`ApiGateway`.
+Every controller of a cell has its own gateway, so multi-controller cells paid the connection
+setup (TCP, TLS, DNS) once per controller. :class:`SharedRESTClient` replaces the REST client of
+a gateway and draws its session from a pool that is shared by all gateways with the same host,
+SSL verification and :class:`HttpTransportConfig`. The session is closed when the last gateway
+using it is closed.
+"""
+
+import asyncio
+import logging
+import ssl
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from nova import api
+from nova.config import HttpTransportConfig
+
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class _SharedSession:
+    loop: asyncio.AbstractEventLoop
+    session: "aiohttp.ClientSession"
+    users: int = 0
+
+
+# (host, verify_ssl, transport settings) -> session shared by all gateways in the same event loop
+_sessions: dict[tuple[str, bool, HttpTransportConfig], _SharedSession] = {}
+
+
+def _create_session(
+    transport: HttpTransportConfig, ssl_context: ssl.SSLContext
+) -> "aiohttp.ClientSession":
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(
+        limit=transport.pool_size,
+        limit_per_host=transport.pool_size_per_host,
+        keepalive_timeout=transport.keepalive_timeout,
+        use_dns_cache=transport.dns_cache_ttl > 0,
+        ttl_dns_cache=transport.dns_cache_ttl or None,
+        ssl=ssl_context,
+    )
+    return aiohttp.ClientSession(connector=connector, trust_env=True)
+
+
+class SharedRESTClient:
+    """REST client of the generated API client that uses a shared connection pool.
+
+    Wraps the generated ``RESTClientObject`` and hands it the shared session before every
+    request.
+    """
+
+    def __init__(self, configuration: api.Configuration, transport: HttpTransportConfig):
+        """
+        Args:
+            configuration (api.Configuration): The configuration of the API client.
+            transport (HttpTransportConfig): Connection pool and timeout settings.
+        """
+        self._rest_client = api.rest.RESTClientObject(configuration)
+        self._key = (configuration.host, bool(configuration.verify_ssl), transport)
+        self._transport = transport
+        self._shared: _SharedSession | None = None
+
+    def _acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        if (
+            self._shared is not None
+            and self._shared.loop is loop
+            and not self._shared.session.closed
+        ):
+            return
+
+        # sessions are bound to the event loop they were created in
+        self._release()
+        shared = _sessions.get(self._key)
+        if shared is None or shared.loop is not loop or shared.session.closed:
+            logger.debug(f"Opening shared HTTP connection pool for {self._key[0]}")
+            shared = _SharedSession(
+                loop=loop, session=_create_session(self._transport, self._rest_client.ssl_context)
+            )
+            _sessions[self._key] = shared
+        shared.users += 1
+        self._shared = shared
+        self._rest_client.pool_manager = shared.session
+        # a retry client wraps (and would close) the session it was created with
+        self._rest_client.retry_client = None
+
+    def _release(self) -> "aiohttp.ClientSession | None":
+        """Drop the reference to the shared session, return it if this was the last user."""
+        shared, self._shared = self._shared, None
+        self._rest_client.pool_manager = None
+        self._rest_client.retry_client = None
+        if shared is None:
+            return None
+        shared.users -= 1
+        if shared.users > 0:
+            return None
+        if _sessions.get(self._key) is shared:
+            del _sessions[self._key]
+        return shared.session
+
+    async def request(
+        self, method, url, headers=None, body=None, post_params=None, _request_timeout=None
+    ):
+        import aiohttp
+
+        self._acquire()
+        if _request_timeout is None:
+            _request_timeout = aiohttp.ClientTimeout(
+                total=self._transport.request_timeout, sock_connect=self._transport.connect_timeout
+            )
+        return await self._rest_client.request(
+            method,
+            url,
+            headers=headers,
+            body=body,
+            post_params=post_params,
+            _request_timeout=_request_timeout,
+        )
+
+    async def close(self) -> None:
+        shared = self._shared
+        session = self._release()
+        if session is None or session.closed:
+            return
+        if shared is not None and shared.loop is not asyncio.get_running_loop():
+            # the loop the session was created in is gone, its connections went with it
+            return
+        await session.close()
@@ -107,3 +107,14 @@ class NoInverseKinematicsSolutionFound(ValueError):
     def pose(self) -> Pose:
         """Return the target pose that could not be solved."""
         return self._pose
+
+
+class ApiRecordingMissing(Exception):
+    """Raised on replay when the API recording has no response for a call."""
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        super().__init__(
+            f"No recorded response for {endpoint} with these arguments. "
+            "Record the program again against a live NOVA instance."
+        )
@@ -0,0 +1,345 @@
+"""Measure how the async runtime scales with the number of robots and IO devices of a cell.
+
+The benchmark builds a :class:`SimulatedRobotCell` with N robots and M IO devices and runs a
+synthetic program on it. Every robot moves back and forth between two joint configurations
+while every IO device toggles an output and reads it back. The program is either plain Python,
+which merges the motion state streams of all robots like ``RobotCell.stream_state`` does, or a
+generated Wandelscript program, whose action queue merges the motions of all robots.
+
+The report contains:
+
+* the lag of the event loop, i.e. how much later than requested a timer fires,
+* the motion states streamed per second of wall-clock time,
+* the peak memory allocated while the program ran.
+
+Run ``python -m nova.helper_scripts.benchmark_simulated_cell --robots 1 4 12 --ios 8``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import dataclasses
+import json
+import os
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+from aiostream import stream
+
+from nova.actions import jnt
+from nova.cell.simulation import (
+    SimulatedController,
+    SimulatedRobot,
+    SimulatedRobotCell,
+    VirtualClock,
+    get_simulated_robot_configs,
+    get_ur5e_motion_group_description,
+    naive_joints_to_pose,
+)
+from nova.types import Pose
+from nova.utils.kinematics import DHKinematics
+
+ProgramKind = Literal["python", "wandelscript"]
+
+# the two joint configurations every robot moves between
+JOINTS_A = (0.5, -1.2, 1.0, -0.5, 0.5, 0.0)
+JOINTS_B = (-0.5, -1.0, 1.2, -0.7, -0.5, 0.3)
+
+# the interval of the timer that measures the event loop lag
+_LAG_PROBE_INTERVAL = 0.01
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """The measurements of one benchmark run.
+
+    Attributes:
+        robots (int): Number of robots in the cell.
+        io_devices (int): Number of IO devices in the cell.
+        program (str): The kind of program that ran.
+        wall_seconds (float): The wall-clock duration of the program.
+        simulated_seconds (float): The duration of the program on the clock of the cell.
+        states (int): Number of motion states streamed by all robots.
+        io_operations (int): Number of IO reads and writes.
+        loop_lag_mean_seconds (float): Mean delay of the lag probe timer.
+        loop_lag_p99_seconds (float): 99th percentile delay of the lag probe timer.
+        loop_lag_max_seconds (float): Maximum delay of the lag probe timer.
+        memory_peak_bytes (int | None): Peak memory allocated during the run, None if memory
+            was not traced.
+    """
+
+    robots: int
+    io_devices: int
+    program: str
+    wall_seconds: float
+    simulated_seconds: float
+    states: int
+    io_operations: int
+    loop_lag_mean_seconds: float
+    loop_lag_p99_seconds: float
+    loop_lag_max_seconds: float
+    memory_peak_bytes: int | None
+
+    @property
+    def states_per_second(self) -> float:
+        return self.states / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        """Return the result as one line of text."""
+        memory = (
+            "n/a" if self.memory_peak_bytes is None else f"{self.memory_peak_bytes / 2**20:.1f} MiB"
+        )
+        return (
+            f"{self.program:>12} robots={self.robots:<3} ios={self.io_devices:<3} "
+            f"wall={self.wall_seconds:.2f}s simulated={self.simulated_seconds:.1f}s "
+            f"states/s={self.states_per_second:.0f} "
+            f"lag mean/p99/max={self.loop_lag_mean_seconds * 1000:.2f}/"
+            f"{self.loop_lag_p99_seconds * 1000:.2f}/{self.loop_lag_max_seconds * 1000:.2f}ms "
+            f"memory peak={memory}"
+        )
+
+
+def build_cell(
+    num_robots: int, num_ios: int, clock: VirtualClock | None = None, kinematics: bool = False
+) -> SimulatedRobotCell:
+    """Build a simulated cell with N robots and M IO devices.
+
+    The robots belong to the controller ``controller``. Every IO device is a simulated
+    controller without robots named ``io<j>``, so Wandelscript can address it with
+    ``get_controller``.
+
+    Args:
+        num_robots: The number of robots.
+        num_ios: The number of IO devices.
+        clock: The clock of the cell, see :class:`SimulatedRobotCell`.
+        kinematics: Whether the robots use the kinematics and joint limits of a UR5e.
+    """
+    description = get_ur5e_motion_group_description() if kinematics else None
+    devices = {
+        "controller": SimulatedController(
+            SimulatedController.Configuration(
+                id="controller",
+                robots=get_simulated_robot_configs("controller", num_robots, description),
+            )
+        )
+    }
+    for j in range(num_ios):
+        devices[f"io{j}"] = SimulatedController(
+            SimulatedController.Configuration(id=f"io{j}", robots=[])
+        )
+    return SimulatedRobotCell(clock=clock, **devices)
+
+
+def target_poses(kinematics: bool = False) -> tuple[Pose, Pose]:
+    """Return the flange poses of :data:`JOINTS_A` and :data:`JOINTS_B`."""
+    if not kinematics:
+        return naive_joints_to_pose(JOINTS_A), naive_joints_to_pose(JOINTS_B)
+    dh = DHKinematics.from_motion_group_description(get_ur5e_motion_group_description())
+    pose_a, pose_b = dh.flange_poses([JOINTS_A, JOINTS_B]).tolist()
+    return Pose(pose_a), Pose(pose_b)
+
+
+def wandelscript_program(
+    num_robots: int, num_ios: int, cycles: int, poses: tuple[Pose, Pose]
+) -> str:
+    """Generate a Wandelscript program for a cell from :func:`build_cell`.
+
+    All robots move concurrently between ``poses`` for ``cycles`` times. Afterwards every IO
+    device toggles an output ``cycles`` times.
+
+    Example:
+    >>> print(wandelscript_program(1, 1, 2, (Pose((1, 0, 0, 0, 0, 0)), Pose((0, 1, 0, 0, 0, 0)))))
+    controller = get_controller("controller")
+    io0 = get_controller("io0")
+    flange = frame("Flange")
+    do with controller[0]:
+        for i = 0..<2:
+            move flange via p2p() to (1.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+            move flange via p2p() to (0.0, 1.0, 0.0, 0.0, 0.0, 0.0)
+    for i = 0..<2:
+        write(io0, "digital_out[0]", True)
+        value0 = read(io0, "digital_out[0]")
+        write(io0, "digital_out[0]", False)
+    <BLANKLINE>
+    """
+    targets = [str(tuple(round(float(value), 6) for value in pose.to_tuple())) for pose in poses]
+    lines = ['controller = get_controller("controller")']
+    lines += [f'io{j} = get_controller("io{j}")' for j in range(num_ios)]
+    lines.append('flange = frame("Flange")')
+    for i in range(num_robots):
+        lines.append(f"{'do' if i == 0 else 'and do'} with controller[{i}]:")
+        lines.append(f"    for i = 0..<{cycles}:")
+        lines += [f"        move flange via p2p() to {target}" for target in targets]
+    if num_ios > 0:
+        lines.append(f"for i = 0..<{cycles}:")
+        for j in range(num_ios):
+            lines.append(f'    write(io{j}, "digital_out[0]", True)')
+            lines.append(f'    value{j} = read(io{j}, "digital_out[0]")')
+            lines.append(f'    write(io{j}, "digital_out[0]", False)')
+    return "\n".join(lines) + "\n"
+
+
+async def _run_python(cell: SimulatedRobotCell, clock: VirtualClock, cycles: int) -> int:
+    robots = list(cell.get_motion_groups().values())
+    ios = [cell.get_controller(name) for name in cell.devices if name.startswith("io")]
+    actions = [jnt(JOINTS_A), jnt(JOINTS_B)] * cycles
+    trajectories = await asyncio.gather(
+        *(robot.plan(actions, tcp="Flange", start_joint_position=JOINTS_A) for robot in robots)
+    )
+    motions = [
+        robot.stream_execute(trajectory, "Flange", actions)
+        for robot, trajectory in zip(robots, trajectories, strict=True)
+    ]
+    io_operations = 0
+
+    async def toggle(io: SimulatedController):
+        nonlocal io_operations
+        for _ in range(2 * cycles):
+            await io.write("digital_out[0]", True)
+            await io.read("digital_out[0]")
+            await io.write("digital_out[0]", False)
+            io_operations += 3
+            await clock.sleep(0.05)
+
+    async def consume():
+        if not motions:
+            return
+        async with stream.merge(*motions).stream() as states:
+            async for _ in states:
+                pass
+
+    await asyncio.gather(consume(), *(toggle(io) for io in ios))
+    return io_operations
+
+
+async def _run_wandelscript(
+    cell: SimulatedRobotCell, num_robots: int, num_ios: int, cycles: int, kinematics: bool
+) -> int:
+    # imported on demand, Wandelscript needs the optional antlr4 runtime
+    from wandelscript.metamodel import run_program
+
+    code = wandelscript_program(num_robots, num_ios, cycles, target_poses(kinematics))
+    await run_program(code, cell=cell, default_tcp="Flange")
+    return 3 * num_ios * cycles
+
+
+async def _probe_loop_lag(lags: list[float]) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(_LAG_PROBE_INTERVAL)
+        lags.append(loop.time() - start - _LAG_PROBE_INTERVAL)
+
+
+async def run_benchmark(
+    num_robots: int = 12,
+    num_ios: int = 8,
+    cycles: int = 5,
+    program: ProgramKind = "python",
+    speed_factor: float | None = None,
+    kinematics: bool = False,
+    trace_memory: bool = True,
+) -> BenchmarkResult:
+    """Run the synthetic program on a cell from :func:`build_cell` and measure it.
+
+    Args:
+        num_robots: The number of robots.
+        num_ios: The number of IO devices.
+        cycles: How often every robot moves back and forth and every IO device toggles.
+        program: Whether to run the Python or the Wandelscript program.
+        speed_factor: The speed factor of the clock of the cell. None runs on a virtual clock
+            as fast as possible, which stresses the runtime most.
+        kinematics: Whether the robots use the kinematics and joint limits of a UR5e.
+        trace_memory: Whether to trace the memory with ``tracemalloc``. Tracing slows down
+            the program, the other measurements are more accurate without it.
+    """
+    if trace_memory:
+        tracemalloc.start()
+    clock = VirtualClock(speed_factor)
+    lags: list[float] = []
+    probe = asyncio.create_task(_probe_loop_lag(lags))
+    try:
+        cell = build_cell(num_robots, num_ios, clock=clock, kinematics=kinematics)
+        start = time.perf_counter()
+        # the simulated devices print every operation
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            async with cell:
+                if program == "python":
+                    io_operations = await _run_python(cell, clock, cycles)
+                else:
+                    io_operations = await _run_wandelscript(
+                        cell, num_robots, num_ios, cycles, kinematics
+                    )
+        wall_seconds = time.perf_counter() - start
+        memory_peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        probe.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await probe
+        if trace_memory:
+            tracemalloc.stop()
+
+    robots = cell.get_motion_groups().values()
+    lag_array = np.asarray(lags) if lags else np.zeros(1)
+    return BenchmarkResult(
+        robots=num_robots,
+        io_devices=num_ios,
+        program=program,
+        wall_seconds=wall_seconds,
+        simulated_seconds=clock.time(),
+        states=sum(robot.states_streamed for robot in robots if isinstance(robot, SimulatedRobot)),
+        io_operations=io_operations,
+        loop_lag_mean_seconds=float(lag_array.mean()),
+        loop_lag_p99_seconds=float(np.percentile(lag_array, 99)),
+        loop_lag_max_seconds=float(lag_array.max()),
+        memory_peak_bytes=memory_peak,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--robots", type=int, nargs="+", default=[1, 4, 12])
+    parser.add_argument("--ios", type=int, nargs="+", default=[8])
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument("--program", choices=["python", "wandelscript"], default="python")
+    parser.add_argument(
+        "--speed-factor", type=float, default=None, help="run on a scaled real-time clock"
+    )
+    parser.add_argument("--kinematics", action="store_true", help="use the UR5e kinematics")
+    parser.add_argument("--no-trace-memory", action="store_true")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per run")
+    args = parser.parse_args()
+
+    for num_robots in args.robots:
+        for num_ios in args.ios:
+            result = asyncio.run(
+                run_benchmark(
+                    num_robots,
+                    num_ios,
+                    cycles=args.cycles,
+                    program=args.program,
+                    speed_factor=args.speed_factor,
+                    kinematics=args.kinematics,
+                    trace_memory=not args.no_trace_memory,
+                )
+            )
+            if args.json:
+                print(
+                    json.dumps(
+                        {
+                            **dataclasses.asdict(result),
+                            "states_per_second": result.states_per_second,
+                        }
+                    )
+                )
+            else:
+                print(result.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -28,7 +28,7 @@ from nova.exceptions import ControllerCreationFailed, PlanTrajectoryFailed
 from nova.program.exceptions import NotPlannableError
 from nova.program.function import Program
 from nova.program.utils import Tee, stoppable_run
-from nova.types import MotionState
+from nova.types import MotionStateLike
 from nova.utils import timestamp
 
 from .function import ProgramPreconditions
@@ -80,7 +80,7 @@ class ProgramStatus(BaseModel):
 class ExecutionContext:
     # Maps the motion group id to the list of recorded motion lists
     # Each motion list is a path the was planned separately
-    motion_group_recordings: list[list[MotionState]]
+    motion_group_recordings: list[list[MotionStateLike]]
     output_data: dict[str, Any]
     nova: Nova | None
 
@@ -4,7 +4,15 @@ import nova.api as api
 from nova.types.dataset_pose import ConfiguredPose, DatasetPose
 from nova.types.motion_settings import MotionSettings
 from nova.types.pose import Pose
-from nova.types.state import MotionState, RobotState
+from nova.types.pose_array import PoseArray
+from nova.types.state import (
+    MotionState,
+    MotionStateLike,
+    MotionStateView,
+    RobotState,
+    RobotStateView,
+)
+from nova.types.trajectory import TrajectoryArray
 from nova.types.vector3d import Vector3d
 
 ExecuteTrajectoryRequestStream: TypeAlias = AsyncIterator[
@@ -23,12 +31,17 @@ MovementControllerFunction: TypeAlias = Callable[
 __all__ = [
     "Vector3d",
     "Pose",
+    "PoseArray",
     "ConfiguredPose",
     "DatasetPose",
     "CollisionScene",
     "MotionState",
     "RobotState",
+    "MotionStateView",
+    "RobotStateView",
+    "MotionStateLike",
     "MotionSettings",
+    "TrajectoryArray",
     "ExecuteTrajectoryRequestStream",
     "ExecuteTrajectoryResponseStream",
     "MovementControllerFunction",
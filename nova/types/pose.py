@@ -69,6 +69,9 @@ class Pose(pydantic.BaseModel, Sized):
     orientation: Vector3d
     kinematic_configuration: api.models.KinematicConfiguration | None = None
 
+    # the values the matrix was computed from and the matrix, see `matrix`
+    _matrix_cache: tuple[tuple[float, ...], np.ndarray] | None = pydantic.PrivateAttr(default=None)
+
     def __init__(self, *args, **kwargs):
         """Parse a tuple into a dict
 
@@ -143,11 +146,9 @@ class Pose(pydantic.BaseModel, Sized):
         if n is not None:
             raise NotImplementedError("Setting precision is not supported yet")
         pos_and_rot_vector = self.to_tuple()
-        return Pose(
-            tuple(
-                [round(a, 1) for a in pos_and_rot_vector[:3]]
-                + [round(a, 3) for a in pos_and_rot_vector[3:]]
-            )
+        return Pose.from_trusted_tuple(
+            [round(a, 1) for a in pos_and_rot_vector[:3]]
+            + [round(a, 3) for a in pos_and_rot_vector[3:]]
         )
 
     def __len__(self):
@@ -183,9 +184,11 @@ class Pose(pydantic.BaseModel, Sized):
         >>> np.allclose(identity_approx.position.to_tuple(), (0, 0, 0), atol=1e-7)
         True
         """
-        # Invert the homogeneous transformation matrix
-        inv_matrix = np.linalg.inv(self.matrix)
-        # Convert back to a Pose
+        matrix = self.matrix
+        inv_rotation = matrix[:3, :3].T
+        inv_matrix = np.eye(4)
+        inv_matrix[:3, :3] = inv_rotation
+        inv_matrix[:3, 3] = -inv_rotation @ matrix[:3, 3]
         return self._matrix_to_pose(inv_matrix)
 
     def __getitem__(self, item):
@@ -234,8 +237,9 @@ class Pose(pydantic.BaseModel, Sized):
         >>> Pose((1, 2, 3, 0, 0, 0)) @ Pose(DatasetPose(id='p1', pose=api.models.Pose(position=api.models.Vector3d([1, 2, 3]), orientation=api.models.RotationVector([0, 0, 0]))))
         Pose(position=Vector3d(x=2.0, y=4.0, z=6.0), orientation=Vector3d(x=0.0, y=0.0, z=0.0), kinematic_configuration=None)
         """
-
-        transformed_matrix = np.dot(self.matrix, other.matrix)
+        if not isinstance(other, Pose):
+            return NotImplemented
+        transformed_matrix = self.matrix @ other.matrix
         return self._matrix_to_pose(transformed_matrix)
 
     def __array__(self, dtype=None):
@@ -310,16 +314,7 @@ class Pose(pydantic.BaseModel, Sized):
         rotation_matrix = matrix[:3, :3]
         position = matrix[:3, 3]
         rotation_vec = Rotation.from_matrix(rotation_matrix).as_rotvec()
-        return Pose(
-            (
-                position[0],
-                position[1],
-                position[2],
-                rotation_vec[0],
-                rotation_vec[1],
-                rotation_vec[2],
-            )
-        )
+        return Pose.from_trusted_tuple([*position.tolist(), *rotation_vec.tolist()])
 
     @classmethod
     def from_tuple(
@@ -349,6 +344,29 @@ class Pose(pydantic.BaseModel, Sized):
             )
         raise ValueError("Pose.from_tuple expects 3 or 6 values")
 
+    @classmethod
+    def from_trusted_tuple(
+        cls,
+        values: Sequence[float],
+        kinematic_configuration: api.models.KinematicConfiguration | None = None,
+    ) -> Pose:
+        """Create a Pose from six floats (position + orientation) without validating them.
+
+        `Pose(...)` dispatches on its arguments and validates the result twice, which adds up
+        in state callbacks and pose algebra. Only use this for values that are known to be
+        valid, e.g. taken from an API model or computed with numpy and converted with
+        ``tolist()``.
+
+        Example:
+        >>> Pose.from_trusted_tuple((1.0, 2.0, 3.0, 4.0, 5.0, 6.0))
+        Pose(position=Vector3d(x=1.0, y=2.0, z=3.0), orientation=Vector3d(x=4.0, y=5.0, z=6.0), kinematic_configuration=None)
+        """
+        return cls.model_construct(
+            position=Vector3d.from_trusted_tuple(values[:3]),
+            orientation=Vector3d.from_trusted_tuple(values[3:]),
+            kinematic_configuration=kinematic_configuration,
+        )
+
     @classmethod
     def from_api_model(
         cls,
@@ -357,17 +375,15 @@ class Pose(pydantic.BaseModel, Sized):
     ) -> Pose:
         """Create a Pose from a wandelbots_api_client Pose model.
 
+        The API model was validated already, so its values are not validated again.
+
         Example:
         >>> Pose.from_api_model(api.models.Pose(position=api.models.Vector3d([1, 2, 3]), orientation=api.models.RotationVector([4, 5, 6])))
         Pose(position=Vector3d(x=1.0, y=2.0, z=3.0), orientation=Vector3d(x=4.0, y=5.0, z=6.0), kinematic_configuration=None)
         """
-        pos = pose.position if pose.position is not None else [0.0, 0.0, 0.0]
-        ori = pose.orientation if pose.orientation is not None else [0.0, 0.0, 0.0]
-        return cls(
-            position=Vector3d(x=pos[0], y=pos[1], z=pos[2]),
-            orientation=Vector3d(x=ori[0], y=ori[1], z=ori[2]),
-            kinematic_configuration=kinematic_configuration,
-        )
+        pos = pose.position.root if pose.position is not None else [0.0, 0.0, 0.0]
+        ori = pose.orientation.root if pose.orientation is not None else [0.0, 0.0, 0.0]
+        return cls.from_trusted_tuple([*pos, *ori], kinematic_configuration=kinematic_configuration)
 
     @classmethod
     def from_dataset_pose(cls, dataset_pose: DatasetPose | ConfiguredPose) -> Pose:
@@ -413,9 +429,7 @@ class Pose(pydantic.BaseModel, Sized):
 
         # convert eulerangles to rotation vector
         rotation = Rotation.from_euler(convention, euler_angles, degrees=degrees)
-        rotation_vector = rotation.as_rotvec()
-
-        orientation = Vector3d.from_tuple(tuple(rotation_vector))
+        orientation = Vector3d.from_trusted_tuple(rotation.as_rotvec().tolist())
 
         return cls(position=position, orientation=orientation)
 
@@ -426,5 +440,22 @@ class Pose(pydantic.BaseModel, Sized):
 
     @property
     def matrix(self) -> np.ndarray:
-        """Returns the homogeneous transformation matrix."""
-        return self._to_homogenous_transformation_matrix()
+        """Returns the homogeneous transformation matrix.
+
+        The matrix is computed once and returned again as long as the position and orientation
+        don't change. It is read-only, copy it to modify it.
+
+        Example:
+        >>> pose = Pose((1, 2, 3, 0, 0, 0))
+        >>> pose.matrix is pose.matrix
+        True
+        >>> pose.position = Vector3d(x=4, y=5, z=6)
+        >>> pose.matrix[:3, 3].tolist()
+        [4.0, 5.0, 6.0]
+        """
+        values = self.to_tuple()
+        if self._matrix_cache is None or self._matrix_cache[0] != values:
+            matrix = self._to_homogenous_transformation_matrix()
+            matrix.flags.writeable = False
+            self._matrix_cache = (values, matrix)
+        return self._matrix_cache[1]
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Sequence, overload
+
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+from nova import api
+from nova.types.pose import Pose
+
+
+@dataclass(frozen=True, eq=False)
+class PoseArray:
+    """Many poses stored as NumPy arrays.
+
+    Every :class:`Pose` operation builds pydantic models, scipy rotations and 4x4 matrices for a
+    single pose. ``PoseArray`` holds N poses in two arrays and applies the same operations to
+    all of them at once, so only the final conversion to :class:`Pose` or API models builds
+    objects.
+
+    Attributes:
+        positions (np.ndarray): The (N, 3) positions.
+        orientations (np.ndarray): The (N, 3) orientations as rotation vectors.
+
+    Example:
+    >>> poses = PoseArray.from_poses([Pose((1, 2, 3, 0, 0, 0)), Pose((4, 5, 6, 0, 0, 0))])
+    >>> (poses @ Pose((0, 0, 1, 0, 0, 0))).positions.tolist()
+    [[1.0, 2.0, 4.0], [4.0, 5.0, 7.0]]
+    """
+
+    positions: np.ndarray
+    orientations: np.ndarray
+
+    def __post_init__(self):
+        positions = np.asarray(self.positions, dtype=float)
+        orientations = np.asarray(self.orientations, dtype=float)
+        if positions.size == 0 and orientations.size == 0:
+            positions = positions.reshape(0, 3)
+            orientations = orientations.reshape(0, 3)
+        if positions.ndim != 2 or positions.shape[1] != 3 or orientations.shape != positions.shape:
+            raise ValueError(
+                "Expected positions and orientations of shape (N, 3), got "
+                f"{positions.shape} and {orientations.shape}"
+            )
+        object.__setattr__(self, "positions", positions)
+        object.__setattr__(self, "orientations", orientations)
+
+    @classmethod
+    def from_poses(cls, poses: Iterable[Pose]) -> PoseArray:
+        """Create the arrays from poses.
+
+        Kinematic configurations are not kept.
+        """
+        values = np.array([pose.to_tuple() for pose in poses], dtype=float).reshape(-1, 6)
+        return cls(positions=values[:, :3], orientations=values[:, 3:])
+
+    @classmethod
+    def from_api_models(cls, poses: Iterable[api.models.Pose]) -> PoseArray:
+        """Create the arrays from API poses, missing positions or orientations are zero."""
+        values = np.array(
+            [
+                (
+                    *(pose.position if pose.position is not None else (0.0, 0.0, 0.0)),
+                    *(pose.orientation if pose.orientation is not None else (0.0, 0.0, 0.0)),
+                )
+                for pose in poses
+            ],
+            dtype=float,
+        ).reshape(-1, 6)
+        return cls(positions=values[:, :3], orientations=values[:, 3:])
+
+    @classmethod
+    def from_euler(
+        cls,
+        positions: Sequence[Sequence[float]] | np.ndarray,
+        euler_angles: Sequence[Sequence[float]] | np.ndarray,
+        convention: str = "xyz",
+        degrees: bool = False,
+    ) -> PoseArray:
+        """Create the poses from (N, 3) positions and (N, 3) Euler angles.
+
+        See :meth:`Pose.from_euler` for the meaning of ``convention`` and ``degrees``.
+
+        Example:
+        >>> poses = PoseArray.from_euler([(1, 2, 3)], [(0, 0, 90)], degrees=True)
+        >>> np.allclose(poses.orientations, [(0, 0, np.pi / 2)])
+        True
+        """
+        rotations = Rotation.from_euler(
+            convention, np.asarray(euler_angles, dtype=float).reshape(-1, 3), degrees=degrees
+        )
+        return cls(positions=positions, orientations=rotations.as_rotvec())
+
+    @classmethod
+    def from_quaternions(
+        cls,
+        positions: Sequence[Sequence[float]] | np.ndarray,
+        quaternions: Sequence[Sequence[float]] | np.ndarray,
+    ) -> PoseArray:
+        """Create the poses from (N, 3) positions and (N, 4) quaternions ``(w, x, y, z)``."""
+        rotations = Rotation.from_quat(
+            np.asarray(quaternions, dtype=float).reshape(-1, 4), scalar_first=True
+        )
+        return cls(positions=positions, orientations=rotations.as_rotvec())
+
+    @classmethod
+    def from_matrices(cls, matrices: np.ndarray) -> PoseArray:
+        """Create the poses from (N, 4, 4) homogeneous transformation matrices."""
+        matrices = np.asarray(matrices, dtype=float).reshape(-1, 4, 4)
+        return cls(
+            positions=matrices[:, :3, 3],
+            orientations=Rotation.from_matrix(matrices[:, :3, :3]).as_rotvec(),
+        )
+
+    def to_poses(self) -> list[Pose]:
+        """Return the poses as list of :class:`Pose`."""
+        return [Pose(values) for values in np.hstack((self.positions, self.orientations)).tolist()]
+
+    def to_api_models(self) -> list[api.models.Pose]:
+        """Return the poses as list of API models.
+
+        The arrays were validated on construction, so the models are built without another
+        round of pydantic validation.
+        """
+        return [
+            api.models.Pose.model_construct(
+                position=api.models.Vector3d.model_construct(position),
+                orientation=api.models.RotationVector.model_construct(orientation),
+            )
+            for position, orientation in zip(
+                self.positions.tolist(), self.orientations.tolist(), strict=True
+            )
+        ]
+
+    def as_euler(self, convention: str = "xyz", degrees: bool = False) -> np.ndarray:
+        """Return the orientations as (N, 3) Euler angles."""
+        return self.rotations.as_euler(convention, degrees=degrees)
+
+    def as_quaternions(self) -> np.ndarray:
+        """Return the orientations as (N, 4) quaternions ``(w, x, y, z)``.
+
+        This matches the order of :meth:`Pose.orientation_to_quaternion`.
+        """
+        return self.rotations.as_quat(scalar_first=True)
+
+    def interpolate(self, other: PoseArray | Pose, fractions: float | np.ndarray) -> PoseArray:
+        """Interpolate from these poses towards ``other``.
+
+        Positions are interpolated linearly and orientations along the shortest rotation. A
+        fraction of 0 returns these poses, 1 returns ``other``. ``fractions`` is a scalar or
+        an (N,) array with one fraction per pose. Interpolating between two single poses with
+        N fractions returns N poses along the way between them.
+
+        Example:
+        >>> start = PoseArray.from_poses([Pose((0, 0, 0, 0, 0, 0))])
+        >>> middle = start.interpolate(Pose((10, 0, 0, 0, 0, np.pi / 2)), 0.5)
+        >>> np.allclose(middle.positions, [(5, 0, 0)]), np.allclose(middle.orientations, [(0, 0, np.pi / 4)])
+        (True, True)
+        """
+        other = _as_pose_array(other)
+        fractions = np.asarray(fractions, dtype=float).reshape(-1, 1)
+        start = self.rotations
+        delta = (start.inv() * other.rotations).as_rotvec()
+        return PoseArray(
+            positions=self.positions + fractions * (other.positions - self.positions),
+            orientations=(start * Rotation.from_rotvec(fractions * delta)).as_rotvec(),
+        )
+
+    @property
+    def rotations(self) -> Rotation:
+        """The orientations as one stacked scipy ``Rotation``."""
+        return Rotation.from_rotvec(self.orientations)
+
+    @property
+    def matrices(self) -> np.ndarray:
+        """The (N, 4, 4) homogeneous transformation matrices."""
+        matrices = np.zeros((len(self), 4, 4))
+        matrices[:, :3, :3] = self.rotations.as_matrix()
+        matrices[:, :3, 3] = self.positions
+        matrices[:, 3, 3] = 1.0
+        return matrices
+
+    def __matmul__(self, other: PoseArray | Pose) -> PoseArray:
+        """Concatenate the poses pairwise, like :meth:`Pose.__matmul__`.
+
+        A single pose, or an array of length 1, is applied to every pose of the other side.
+        """
+        other = _as_pose_array(other)
+        rotations = self.rotations
+        return PoseArray(
+            positions=self.positions + rotations.apply(other.positions),
+            orientations=(rotations * other.rotations).as_rotvec(),
+        )
+
+    def __rmatmul__(self, other: Pose) -> PoseArray:
+        if not isinstance(other, Pose):
+            return NotImplemented
+        return _as_pose_array(other) @ self
+
+    def __invert__(self) -> PoseArray:
+        """Return the inverse of every pose, like :meth:`Pose.__invert__`."""
+        inverse = self.rotations.inv()
+        return PoseArray(positions=-inverse.apply(self.positions), orientations=inverse.as_rotvec())
+
+    def __len__(self) -> int:
+        return self.positions.shape[0]
+
+    def __iter__(self):
+        return iter(self.to_poses())
+
+    @overload
+    def __getitem__(self, item: int) -> Pose: ...
+
+    @overload
+    def __getitem__(self, item: slice | Sequence[int] | np.ndarray) -> PoseArray: ...
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            return Pose((*self.positions[item].tolist(), *self.orientations[item].tolist()))
+        return PoseArray(positions=self.positions[item], orientations=self.orientations[item])
+
+
+def _as_pose_array(poses: PoseArray | Pose) -> PoseArray:
+    if isinstance(poses, PoseArray):
+        return poses
+    if isinstance(poses, Pose):
+        return PoseArray(
+            positions=[poses.position.to_tuple()], orientations=[poses.orientation.to_tuple()]
+        )
+    raise TypeError(f"Expected PoseArray or Pose, got {type(poses).__name__}")
@@ -1,3 +1,5 @@
+from typing import TypeAlias
+
 import pydantic
 
 from nova import api
@@ -29,17 +31,104 @@ class MotionState(pydantic.BaseModel):
     state: RobotState
 
 
-# TODO this should return different types of MotionState depending on the fields set in the MotionGroupState
-def motion_group_state_to_motion_state(
+class RobotStateView:
+    """Read-only view of the robot state in a motion group state.
+
+    Has the attributes of :class:`RobotState`, but the pose and the joints are only converted
+    when they are accessed.
+    """
+
+    __slots__ = ("_motion_group_state", "_pose", "_joints")
+
+    def __init__(self, motion_group_state: api.models.MotionGroupState):
+        self._motion_group_state = motion_group_state
+        self._pose: Pose | None = None
+        self._joints: tuple[float, ...] | None = None
+
+    @property
+    def pose(self) -> Pose:
+        if self._pose is None:
+            tcp_pose = self._motion_group_state.tcp_pose
+            assert tcp_pose is not None
+            self._pose = Pose.from_api_model(tcp_pose)
+        return self._pose
+
+    @property
+    def tcp(self) -> str | None:
+        return self._motion_group_state.tcp
+
+    @property
+    def joints(self) -> tuple[float, ...]:
+        if self._joints is None:
+            self._joints = tuple(self._motion_group_state.joint_position.root)
+        return self._joints
+
+    def to_robot_state(self) -> RobotState:
+        return RobotState(pose=self.pose, tcp=self.tcp, joints=self.joints)
+
+    def __repr__(self) -> str:
+        return f"RobotStateView(pose={self.pose!r}, tcp={self.tcp!r}, joints={self.joints!r})"
+
+
+class MotionStateView:
+    """Read-only view of a motion group state during trajectory execution.
+
+    Has the attributes of :class:`MotionState`. Building a `MotionState` validates three
+    pydantic models for every state sample, the view only keeps the API model and converts
+    what is accessed. Use :meth:`to_motion_state` to keep a state beyond the current sample,
+    e.g. for recordings that are serialized later.
+
+    Attributes:
+        motion_group_state (api.models.MotionGroupState): The state the view is created from.
+    """
+
+    __slots__ = ("motion_group_state", "_state")
+
+    def __init__(self, motion_group_state: api.models.MotionGroupState):
+        self.motion_group_state = motion_group_state
+        self._state: RobotStateView | None = None
+
+    @property
+    def motion_group_id(self) -> str:
+        return self.motion_group_state.motion_group
+
+    @property
+    def path_parameter(self) -> float:
+        return self.motion_group_state.execute.details.location.root  # ty: ignore[possibly-missing-attribute]
+
+    @property
+    def state(self) -> RobotStateView:
+        if self._state is None:
+            self._state = RobotStateView(self.motion_group_state)
+        return self._state
+
+    def to_motion_state(self) -> MotionState:
+        return MotionState(
+            motion_group_id=self.motion_group_id,
+            path_parameter=self.path_parameter,
+            state=self.state.to_robot_state(),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"MotionStateView(motion_group_id={self.motion_group_id!r}, "
+            f"path_parameter={self.path_parameter!r}, state={self.state!r})"
+        )
+
+
+MotionStateLike: TypeAlias = MotionState | MotionStateView
+
+
+def motion_group_state_to_motion_state_view(
     motion_group_state: api.models.MotionGroupState,
-) -> MotionState:
-    """Convert a motion group state to a motion state. Should only be used when the motion group is executing a trajectory.
+) -> MotionStateView:
+    """Create a lazy view of a motion group state. Should only be used when the motion group is executing a trajectory.
 
     Args:
         motion_group_state (api.models.MotionGroupState): The motion group state to convert.
 
     Returns:
-        MotionState: The motion state.
+        MotionStateView: The view of the motion state.
     """
     if not motion_group_state.execute:
         raise ValueError("There is no trajectory execution going on.")
@@ -47,18 +136,25 @@ def motion_group_state_to_motion_state(
     if not isinstance(motion_group_state.execute.details, api.models.TrajectoryDetails):
         raise ValueError("The trajectory execution details are not a trajectory details.")
 
-    tcp_name = motion_group_state.tcp
-    if tcp_name is None:
+    if motion_group_state.tcp is None:
         raise ValueError("There is no TCP attached to the motion group.")
 
-    tcp_pose = motion_group_state.tcp_pose
-    if tcp_pose is None:
+    if motion_group_state.tcp_pose is None:
         raise ValueError("There is no TCP pose attached to the motion group.")
 
-    joints = motion_group_state.joint_position
-    path_parameter = motion_group_state.execute.details.location
-    return MotionState(
-        motion_group_id=motion_group_state.motion_group,
-        path_parameter=path_parameter.root,
-        state=RobotState(pose=Pose(tcp_pose), tcp=tcp_name, joints=tuple(joints.root)),
-    )
+    return MotionStateView(motion_group_state)
+
+
+# TODO this should return different types of MotionState depending on the fields set in the MotionGroupState
+def motion_group_state_to_motion_state(
+    motion_group_state: api.models.MotionGroupState,
+) -> MotionState:
+    """Convert a motion group state to a motion state. Should only be used when the motion group is executing a trajectory.
+
+    Args:
+        motion_group_state (api.models.MotionGroupState): The motion group state to convert.
+
+    Returns:
+        MotionState: The motion state.
+    """
+    return motion_group_state_to_motion_state_view(motion_group_state).to_motion_state()
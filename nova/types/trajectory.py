@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from nova import api
+
+
+@dataclass(frozen=True, eq=False)
+class TrajectoryArray:
+    """A joint trajectory stored as NumPy arrays.
+
+    :class:`api.models.JointTrajectory` holds one pydantic object per sample, which dominates
+    CPU time and memory for long trajectories. ``TrajectoryArray`` keeps the same data in
+    three arrays and only builds the API model when it is sent to the API.
+
+    Attributes:
+        times (np.ndarray): The (N,) sample times in seconds.
+        locations (np.ndarray): The (N,) path parameters of the samples.
+        joints (np.ndarray): The (N, J) joint positions of the samples.
+
+    Example:
+    >>> trajectory = TrajectoryArray.hold((0.0, 1.0), duration=0.1, timestep=0.05)
+    >>> trajectory.times.tolist(), trajectory.joints.shape
+    ([0.0, 0.05, 0.1], (3, 2))
+    """
+
+    times: np.ndarray
+    locations: np.ndarray
+    joints: np.ndarray
+
+    def __post_init__(self):
+        times = np.asarray(self.times, dtype=float)
+        locations = np.asarray(self.locations, dtype=float)
+        joints = np.asarray(self.joints, dtype=float)
+        if joints.ndim == 1 and joints.size == 0:
+            joints = joints.reshape(0, 0)
+        if times.ndim != 1 or locations.shape != times.shape or joints.ndim != 2:
+            raise ValueError(
+                "Expected times and locations of shape (N,) and joints of shape (N, J), got "
+                f"{times.shape}, {locations.shape} and {joints.shape}"
+            )
+        if joints.shape[0] != times.shape[0]:
+            raise ValueError(
+                f"Expected {times.shape[0]} joint positions, got {joints.shape[0]} instead"
+            )
+        object.__setattr__(self, "times", times)
+        object.__setattr__(self, "locations", locations)
+        object.__setattr__(self, "joints", joints)
+
+    @classmethod
+    def from_api_model(cls, trajectory: api.models.JointTrajectory) -> TrajectoryArray:
+        """Create the arrays from an API joint trajectory."""
+        count = len(trajectory.times)
+        joint_count = len(trajectory.joint_positions[0].root) if count > 0 else 0
+        return cls(
+            times=np.fromiter(trajectory.times, dtype=float, count=count),
+            locations=np.fromiter(
+                (location.root for location in trajectory.locations), dtype=float, count=count
+            ),
+            joints=np.array(
+                [joints.root for joints in trajectory.joint_positions], dtype=float
+            ).reshape(count, joint_count),
+        )
+
+    @classmethod
+    def hold(
+        cls, joints: Sequence[float], duration: float, timestep: float = 0.050
+    ) -> TrajectoryArray:
+        """Create a trajectory that holds ``joints`` for ``duration`` seconds.
+
+        Samples are spaced by ``timestep``, at least two samples are created and the last one
+        is at exactly ``duration``.
+        """
+        count = max(2, int(duration / timestep) + 1)
+        times = np.arange(count) * timestep
+        times[-1] = duration
+        return cls(
+            times=times,
+            locations=np.zeros(count),
+            joints=np.tile(np.asarray(joints, dtype=float), (count, 1)),
+        )
+
+    @classmethod
+    def concatenate(cls, trajectories: Sequence[TrajectoryArray]) -> TrajectoryArray:
+        """Append the trajectories one after another.
+
+        The first sample of every following trajectory is dropped since it coincides with the
+        last sample of its predecessor. Times and locations are shifted to continue from there.
+        """
+        if not trajectories:
+            raise ValueError("No trajectories provided")
+        first = trajectories[0]
+        times = [first.times]
+        locations = [first.locations]
+        joints = [first.joints]
+        end_time = first.times[-1]
+        end_location = first.locations[-1]
+        for trajectory in trajectories[1:]:
+            times.append(trajectory.times[1:] + end_time)
+            locations.append(trajectory.locations[1:] + end_location)
+            joints.append(trajectory.joints[1:])
+            if len(trajectory) > 1:
+                end_time = times[-1][-1]
+                end_location = locations[-1][-1]
+        return cls(
+            times=np.concatenate(times),
+            locations=np.concatenate(locations),
+            joints=np.concatenate(joints),
+        )
+
+    def to_api_model(self) -> api.models.JointTrajectory:
+        """Return the trajectory as API model.
+
+        The arrays were validated on construction, so the models are built without another
+        round of pydantic validation.
+        """
+        return api.models.JointTrajectory.model_construct(
+            joint_positions=[
+                api.models.Joints.model_construct(row) for row in self.joints.tolist()
+            ],
+            times=self.times.tolist(),
+            locations=[
+                api.models.Location.model_construct(value) for value in self.locations.tolist()
+            ],
+        )
+
+    def take(self, indices: Sequence[int] | np.ndarray) -> TrajectoryArray:
+        """Return the samples at ``indices``."""
+        return TrajectoryArray(
+            times=self.times[indices],
+            locations=self.locations[indices],
+            joints=self.joints[indices],
+        )
+
+    def index_at_time(self, time: float) -> int:
+        """Return the index of the last sample at or before ``time``, clamped to the samples."""
+        return _index_at(self.times, time)
+
+    def index_at_location(self, location: float) -> int:
+        """Return the index of the last sample at or before ``location``, clamped to the samples."""
+        return _index_at(self.locations, location)
+
+    def time_at_location(self, location: float) -> float:
+        """Return the time at which ``location`` is reached, interpolated between samples.
+
+        If the location stays the same for a while, e.g. during a wait, the time it is
+        reached first is returned.
+
+        Example:
+        >>> trajectory = TrajectoryArray(times=[0, 1, 3], locations=[0, 1, 2], joints=[[0], [1], [2]])
+        >>> trajectory.time_at_location(1.5)
+        2.0
+        """
+        return float(_interpolate(self.locations, self.times, location))
+
+    def location_at_time(self, time: float) -> float:
+        """Return the location at ``time``, interpolated between samples."""
+        return float(_interpolate(self.times, self.locations, time))
+
+    def joints_at_location(self, location: float) -> tuple[float, ...]:
+        """Return the joint position at ``location``, interpolated linearly between samples.
+
+        Example:
+        >>> trajectory = TrajectoryArray(times=[0, 1], locations=[0, 1], joints=[[0, 2], [1, 4]])
+        >>> trajectory.joints_at_location(0.25)
+        (0.25, 2.5)
+        """
+        return tuple(_interpolate(self.locations, self.joints, location).tolist())
+
+    @property
+    def duration(self) -> float:
+        """The time between the first and the last sample in seconds."""
+        return float(self.times[-1] - self.times[0]) if len(self) > 0 else 0.0
+
+    @property
+    def end_joints(self) -> tuple[float, ...]:
+        """The joint position of the last sample."""
+        return tuple(self.joints[-1].tolist())
+
+    def __len__(self) -> int:
+        return self.times.shape[0]
+
+
+def _index_at(keys: np.ndarray, value: float) -> int:
+    """Index of the last entry of the sorted ``keys`` that is at or before ``value``."""
+    index = int(np.searchsorted(keys, value, side="right")) - 1
+    return min(max(index, 0), keys.shape[0] - 1)
+
+
+def _interpolate(keys: np.ndarray, values: np.ndarray, key: float) -> np.ndarray:
+    """Interpolate ``values`` at ``key`` in the sorted ``keys``, clamped to the first and last.
+
+    Uses the first of several equal keys, other than ``np.interp``, which leaves this undefined.
+    """
+    if keys.shape[0] == 0:
+        raise ValueError("Cannot look up a value in an empty trajectory")
+    index = int(np.searchsorted(keys, key, side="left"))
+    if index == 0:
+        return values[0]
+    if index == keys.shape[0]:
+        return values[-1]
+    start, end = keys[index - 1], keys[index]
+    if key >= end or end == start:
+        return values[index]
+    fraction = (key - start) / (end - start)
+    return values[index - 1] + fraction * (values[index] - values[index - 1])
+
+
+def as_trajectory_array(
+    trajectory: api.models.JointTrajectory | TrajectoryArray,
+) -> TrajectoryArray:
+    """Return ``trajectory`` as :class:`TrajectoryArray`, converting API models."""
+    if isinstance(trajectory, TrajectoryArray):
+        return trajectory
+    return TrajectoryArray.from_api_model(trajectory)
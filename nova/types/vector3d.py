@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Sequence
 
 import numpy as np
 import pydantic
@@ -90,6 +90,19 @@ class Vector3d(pydantic.BaseModel):
         """
         return cls(x=value[0], y=value[1], z=value[2])
 
+    @classmethod
+    def from_trusted_tuple(cls, value: Sequence[float]) -> Vector3d:
+        """Create a new Vector3d from three floats without validating them
+
+        Only use this for values that are known to be valid, e.g. taken from an API model or
+        computed with numpy and converted with ``tolist()``.
+
+        Examples:
+        >>> Vector3d.from_trusted_tuple((10.0, 20.5, 30.2))
+        Vector3d(x=10.0, y=20.5, z=30.2)
+        """
+        return cls.model_construct(x=value[0], y=value[1], z=value[2])
+
     def to_tuple(self) -> tuple[float, float, float]:
         """Return the vector as a tuple
 
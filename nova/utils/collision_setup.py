@@ -1,18 +1,91 @@
+import hashlib
+from typing import ItemsView
+
 from nova import api
 from nova.actions.base import Action
 from nova.actions.motions import Motion
 from nova.exceptions import InconsistentCollisionScenes
 
 
-def compare_collision_setups(setup1: api.models.CollisionSetup, setup2: api.models.CollisionSetup):
+def collision_setup_fingerprint(
+    setup: api.models.CollisionSetup, memo: dict[int, str] | None = None
+) -> str:
+    """Return a stable content hash of a collision setup.
+
+    Two setups with equal content (ignoring unset and None fields) have the same fingerprint.
+    Collision setups are mutable, so the fingerprint is computed from the current content on
+    every call. Callers that hash many references to the same setups within one computation can
+    pass a ``memo`` dict, which maps ``id(setup)`` to the fingerprint and must not outlive the
+    computation.
+
+    Example:
+    >>> first = api.models.CollisionSetup(self_collision_detection=True)
+    >>> second = api.models.CollisionSetup(self_collision_detection=True)
+    >>> collision_setup_fingerprint(first) == collision_setup_fingerprint(second)
+    True
+    """
+    if memo is not None and id(setup) in memo:
+        return memo[id(setup)]
+    dump = setup.model_dump_json(exclude_unset=True, exclude_none=True)
+    fingerprint = hashlib.sha256(dump.encode()).hexdigest()
+    if memo is not None:
+        memo[id(setup)] = fingerprint
+    return fingerprint
+
+
+def compare_collision_setups(
+    setup1: api.models.CollisionSetup,
+    setup2: api.models.CollisionSetup,
+    memo: dict[int, str] | None = None,
+):
     """Return True if two pydantic CollisionSetup models are equal by value.
 
-    Uses model_dump in json mode with exclude_unset/none to avoid differences caused
-    by default/unset fields or None values.
+    Compares the :func:`collision_setup_fingerprint` of both setups, which ignores differences
+    caused by default/unset fields or None values.
+    """
+    return setup1 is setup2 or collision_setup_fingerprint(
+        setup1, memo
+    ) == collision_setup_fingerprint(setup2, memo)
+
+
+class CollisionSetupRegistry:
+    """Maps collision setup fingerprints to the setups.
+
+    Identical setups that are referenced by many actions are stored once, which makes the
+    fingerprint a compact key for caches and viewers.
+
+    Example:
+    >>> registry = CollisionSetupRegistry()
+    >>> fingerprint = registry.register(api.models.CollisionSetup())
+    >>> registry.register(api.models.CollisionSetup()) == fingerprint, len(registry)
+    (True, 1)
     """
-    dump1 = setup1.model_dump_json(exclude_unset=True, exclude_none=True)
-    dump2 = setup2.model_dump_json(exclude_unset=True, exclude_none=True)
-    return dump1 == dump2
+
+    def __init__(self):
+        self._setups: dict[str, api.models.CollisionSetup] = {}
+
+    def register(self, setup: api.models.CollisionSetup) -> str:
+        """Register ``setup`` and return its fingerprint.
+
+        If an equal setup is registered already, the registered one is kept.
+        """
+        fingerprint = collision_setup_fingerprint(setup)
+        self._setups.setdefault(fingerprint, setup)
+        return fingerprint
+
+    def get(self, fingerprint: str) -> api.models.CollisionSetup | None:
+        """Return the setup registered under ``fingerprint`` or None if there is none."""
+        return self._setups.get(fingerprint)
+
+    def items(self) -> ItemsView[str, api.models.CollisionSetup]:
+        """Return the registered fingerprints and setups."""
+        return self._setups.items()
+
+    def __contains__(self, fingerprint: object) -> bool:
+        return fingerprint in self._setups
+
+    def __len__(self) -> int:
+        return len(self._setups)
 
 
 def validate_collision_setups(actions: list[Action]) -> list[api.models.CollisionSetup]:
@@ -46,10 +119,14 @@ def validate_collision_setups(actions: list[Action]) -> list[api.models.Collisio
             "Only some of the actions have collision scene. Either specify it for all or none."
         )
 
-    # If a collision scene is provided, the same should be provided for all the collision scene
+    # If a collision scene is provided, the same should be provided for all the collision scene.
+    # Actions usually share one setup object, so this only hashes each distinct object once.
     if len(collision_setups) > 1:
         first_setup = collision_setups[0]
-        if not all(compare_collision_setups(first_setup, setup) for setup in collision_setups[1:]):
+        memo: dict[int, str] = {}
+        if not all(
+            compare_collision_setups(first_setup, setup, memo) for setup in collision_setups[1:]
+        ):
             raise InconsistentCollisionScenes(
                 "All actions must use the same collision scene but some are different"
             )
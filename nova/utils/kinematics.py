@@ -0,0 +1,264 @@
+"""Local forward kinematics based on the Denavit-Hartenberg parameters of a motion group.
+
+The transformation from the world frame to the TCP frame of a motion group is described by its
+:class:`api.models.MotionGroupDescription`::
+
+    world -> mounting -> kinematic_chain_offset -> DH chain -> flange_offset -> flange -> tcp_offset
+
+:class:`DHKinematics` evaluates this chain for many joint configurations at once and solves the
+inverse kinematics numerically. All poses use
+millimeters for positions and rotation vectors in radians for orientations, the same as the NOVA
+API.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+from nova import api
+from nova.types.pose import Pose
+
+PoseLike = Pose | api.models.Pose | Sequence[float] | np.ndarray
+
+
+def pose_to_matrix(pose: PoseLike | None) -> np.ndarray:
+    """Return the 4x4 homogeneous matrix of a pose, the identity if ``pose`` is None.
+
+    Examples:
+    >>> pose_to_matrix((1, 2, 3, 0, 0, 0))[:3, 3]
+    array([1., 2., 3.])
+    >>> np.allclose(pose_to_matrix(None), np.eye(4))
+    True
+    """
+    matrix = np.eye(4)
+    if pose is None:
+        return matrix
+    if isinstance(pose, api.models.Pose):
+        position = list(pose.position) if pose.position is not None else [0.0, 0.0, 0.0]
+        orientation = list(pose.orientation) if pose.orientation is not None else [0.0, 0.0, 0.0]
+    else:
+        values = np.asarray(pose.to_tuple() if isinstance(pose, Pose) else pose, dtype=float)
+        position, orientation = values[:3], values[3:6]
+    matrix[:3, :3] = Rotation.from_rotvec(orientation).as_matrix()
+    matrix[:3, 3] = position
+    return matrix
+
+
+def matrices_to_poses(matrices: np.ndarray) -> np.ndarray:
+    """Convert an (N, 4, 4) array of homogeneous matrices to an (N, 6) array of poses.
+
+    Each pose row holds the position followed by the rotation vector.
+
+    Examples:
+    >>> matrices_to_poses(np.eye(4)[None])
+    array([[0., 0., 0., 0., 0., 0.]])
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    poses = np.empty((matrices.shape[0], 6))
+    poses[:, :3] = matrices[:, :3, 3]
+    if matrices.shape[0] > 0:
+        poses[:, 3:] = Rotation.from_matrix(matrices[:, :3, :3]).as_rotvec()
+    return poses
+
+
+def _dh_matrices(theta: np.ndarray, d: np.ndarray, a: float, alpha: float) -> np.ndarray:
+    """Return the (N, 4, 4) standard DH transforms Rz(theta) Tz(d) Tx(a) Rx(alpha)."""
+    cos_theta, sin_theta = np.cos(theta), np.sin(theta)
+    cos_alpha, sin_alpha = np.cos(alpha), np.sin(alpha)
+    matrices = np.zeros((theta.shape[0], 4, 4))
+    matrices[:, 0, 0] = cos_theta
+    matrices[:, 0, 1] = -sin_theta * cos_alpha
+    matrices[:, 0, 2] = sin_theta * sin_alpha
+    matrices[:, 0, 3] = a * cos_theta
+    matrices[:, 1, 0] = sin_theta
+    matrices[:, 1, 1] = cos_theta * cos_alpha
+    matrices[:, 1, 2] = -cos_theta * sin_alpha
+    matrices[:, 1, 3] = a * sin_theta
+    matrices[:, 2, 1] = sin_alpha
+    matrices[:, 2, 2] = cos_alpha
+    matrices[:, 2, 3] = d
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+
+class DHKinematics:
+    """Vectorized forward kinematics of a serial motion group described by DH parameters.
+
+    Example:
+    >>> planar = DHKinematics([api.models.DHParameter(a=100.0), api.models.DHParameter(a=50.0)])
+    >>> planar.flange_poses([[0.0, np.pi / 2]]).round(6).tolist()
+    [[100.0, 50.0, 0.0, 0.0, 0.0, 1.570796]]
+    """
+
+    def __init__(
+        self,
+        dh_parameters: Sequence[api.models.DHParameter],
+        mounting: PoseLike | None = None,
+        kinematic_chain_offset: PoseLike | None = None,
+        flange_offset: PoseLike | None = None,
+    ):
+        """
+        Args:
+            dh_parameters: The DH parameters of the joints along the kinematic chain.
+            mounting: The offset from the world frame to the motion group base.
+            kinematic_chain_offset: The offset from the base to the start of the DH chain.
+            flange_offset: The offset from the end of the DH chain to the flange.
+        """
+        if len(dh_parameters) == 0:
+            raise ValueError("At least one DH parameter is required")
+        self._theta = np.array([p.theta or 0.0 for p in dh_parameters])
+        self._d = np.array([p.d or 0.0 for p in dh_parameters])
+        self._a = np.array([p.a or 0.0 for p in dh_parameters])
+        self._alpha = np.array([p.alpha or 0.0 for p in dh_parameters])
+        self._direction = np.array(
+            [-1.0 if p.reverse_rotation_direction else 1.0 for p in dh_parameters]
+        )
+        self._prismatic = np.array(
+            [p.type == api.models.JointTypeEnum.PRISMATIC_JOINT for p in dh_parameters]
+        )
+        self._base = pose_to_matrix(mounting) @ pose_to_matrix(kinematic_chain_offset)
+        self._flange_offset = pose_to_matrix(flange_offset)
+
+    @classmethod
+    def from_motion_group_description(
+        cls, description: api.models.MotionGroupDescription
+    ) -> DHKinematics:
+        """Create the kinematics from the DH parameters and offsets of a motion group description.
+
+        Raises:
+            ValueError: If the description does not contain DH parameters.
+        """
+        if not description.dh_parameters:
+            raise ValueError(
+                f"Motion group description of '{description.motion_group_model.root}' "
+                "has no DH parameters"
+            )
+        return cls(
+            dh_parameters=description.dh_parameters,
+            mounting=description.mounting,
+            kinematic_chain_offset=description.kinematic_chain_offset,
+            flange_offset=description.flange_offset,
+        )
+
+    @property
+    def joint_count(self) -> int:
+        return len(self._theta)
+
+    def _as_joint_array(self, joints: Sequence[Sequence[float]] | np.ndarray) -> np.ndarray:
+        joint_array = np.asarray(joints, dtype=float)
+        if joint_array.ndim == 1:
+            joint_array = joint_array[None, :]
+        if joint_array.ndim != 2 or joint_array.shape[1] < self.joint_count:
+            raise ValueError(
+                f"Expected joint configurations of shape (N, {self.joint_count}), "
+                f"got {joint_array.shape}"
+            )
+        # additional axes (e.g. a linear track modelled elsewhere) are not part of the DH chain
+        return joint_array[:, : self.joint_count]
+
+    def link_matrices(self, joints: Sequence[Sequence[float]] | np.ndarray) -> np.ndarray:
+        """Return the world frames along the kinematic chain.
+
+        Args:
+            joints: An (N, J) array of joint configurations, or a single configuration.
+
+        Returns:
+            np.ndarray: An (N, J + 1, 4, 4) array. Index 0 is the start of the DH chain, index
+                j the frame after joint j.
+        """
+        joint_array = self._as_joint_array(joints)
+        count = joint_array.shape[0]
+        frames = np.empty((count, self.joint_count + 1, 4, 4))
+        frames[:, 0] = self._base
+        joint_values = joint_array * self._direction
+        for j in range(self.joint_count):
+            if self._prismatic[j]:
+                theta = np.full(count, self._theta[j])
+                d = self._d[j] + joint_values[:, j]
+            else:
+                theta = self._theta[j] + joint_values[:, j]
+                d = np.full(count, self._d[j])
+            frames[:, j + 1] = frames[:, j] @ _dh_matrices(theta, d, self._a[j], self._alpha[j])
+        return frames
+
+    def flange_matrices(self, joints: Sequence[Sequence[float]] | np.ndarray) -> np.ndarray:
+        """Return the (N, 4, 4) flange frames in world coordinates."""
+        return self.link_matrices(joints)[:, -1] @ self._flange_offset
+
+    def tcp_matrices(
+        self, joints: Sequence[Sequence[float]] | np.ndarray, tcp_offset: PoseLike | None = None
+    ) -> np.ndarray:
+        """Return the (N, 4, 4) TCP frames in world coordinates.
+
+        Args:
+            joints: An (N, J) array of joint configurations, or a single configuration.
+            tcp_offset: The offset of the TCP relative to the flange. The flange frames are
+                returned if None.
+        """
+        return self.flange_matrices(joints) @ pose_to_matrix(tcp_offset)
+
+    def flange_poses(self, joints: Sequence[Sequence[float]] | np.ndarray) -> np.ndarray:
+        """Return the (N, 6) flange poses (position and rotation vector) in world coordinates."""
+        return matrices_to_poses(self.flange_matrices(joints))
+
+    def tcp_poses(
+        self, joints: Sequence[Sequence[float]] | np.ndarray, tcp_offset: PoseLike | None = None
+    ) -> np.ndarray:
+        """Return the (N, 6) TCP poses (position and rotation vector) in world coordinates."""
+        return matrices_to_poses(self.tcp_matrices(joints, tcp_offset))
+
+    def inverse_kinematics(
+        self,
+        pose: PoseLike,
+        seed: Sequence[float] | np.ndarray,
+        tcp_offset: PoseLike | None = None,
+        max_iterations: int = 200,
+        tolerance: float = 1e-6,
+    ) -> np.ndarray:
+        """Return the joint configuration closest to ``seed`` that reaches ``pose``.
+
+        The solution is found by damped least squares iterations starting at ``seed``. The
+        Jacobian is estimated by finite differences, evaluating the kinematics of all joint
+        perturbations at once. Orientation errors are weighted as if a radian was a meter.
+
+        Args:
+            pose: The target TCP pose in world coordinates.
+            seed: The joint configuration to start from, usually the current one.
+            tcp_offset: The offset of the TCP relative to the flange.
+            max_iterations: The maximum number of iterations.
+            tolerance: The remaining error (millimeters or milliradians) regarded as reached.
+
+        Raises:
+            ValueError: If no solution was found, e.g. because the pose is out of reach.
+
+        Example:
+        >>> planar = DHKinematics([api.models.DHParameter(a=100.0), api.models.DHParameter(a=50.0)])
+        >>> joints = planar.inverse_kinematics((100, 50, 0, 0, 0, np.pi / 2), seed=[0.1, 0.1])
+        >>> np.allclose(joints, [0, np.pi / 2])
+        True
+        """
+        target = pose_to_matrix(pose)
+        tcp_matrix = pose_to_matrix(tcp_offset)
+        joints = self._as_joint_array(seed)[0].copy()
+        step = 1e-6
+        perturbations = np.vstack((np.zeros(self.joint_count), np.eye(self.joint_count) * step))
+        weights = np.array([1.0, 1.0, 1.0, 1000.0, 1000.0, 1000.0])
+        damping = 1e-3
+        for _ in range(max_iterations):
+            matrices = self.flange_matrices(joints + perturbations) @ tcp_matrix
+            errors = np.empty((len(matrices), 6))
+            errors[:, :3] = target[:3, 3] - matrices[:, :3, 3]
+            errors[:, 3:] = Rotation.from_matrix(
+                target[:3, :3] @ np.transpose(matrices[:, :3, :3], (0, 2, 1))
+            ).as_rotvec()
+            errors *= weights
+            error = errors[0]
+            if np.max(np.abs(error)) < tolerance:
+                return joints
+            jacobian = (errors[0] - errors[1:]).T / step
+            delta = jacobian.T @ np.linalg.solve(jacobian @ jacobian.T + damping * np.eye(6), error)
+            joints = joints + delta
+        raise ValueError(f"No inverse kinematics solution found for {pose}")
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from nova.actions import Action
     from nova.cell.motion_group import MotionGroup
     from nova.core.nova import Nova
+    from nova.types.trajectory import TrajectoryArray
 
 
 @runtime_checkable
@@ -47,7 +48,7 @@ class NovaRerunBridgeProtocol(Protocol):
 
     async def log_trajectory(
         self,
-        trajectory: api.models.JointTrajectory,
+        trajectory: api.models.JointTrajectory | TrajectoryArray,
         tcp: str,
         motion_group: MotionGroup,
         collision_setups: dict[str, api.models.CollisionSetup],
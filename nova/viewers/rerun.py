@@ -5,6 +5,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Sequence, cast
 
+from nova.types.trajectory import as_trajectory_array
+
 if TYPE_CHECKING:
     from nova import api
     from nova.actions import Action
@@ -227,7 +229,8 @@ class Rerun(Viewer):
             # Downsample trajectory for visualization performance
             # Uses adaptive sampling that keeps more points at high-curvature regions
             downsampled_trajectory = downsample_trajectory(
-                trajectory, sample_interval_ms=self.trajectory_sample_interval_ms
+                as_trajectory_array(trajectory),
+                sample_interval_ms=self.trajectory_sample_interval_ms,
             )
 
             # Log trajectory with tool asset if configured for this TCP
@@ -314,7 +317,7 @@ class Rerun(Viewer):
                 # Log the trajectory from the failed plan
                 if hasattr(error.error, "joint_trajectory") and error.error.joint_trajectory:
                     downsampled_trajectory = downsample_trajectory(
-                        error.error.joint_trajectory,  # ty: ignore[invalid-argument-type]
+                        as_trajectory_array(error.error.joint_trajectory),  # ty: ignore[invalid-argument-type]
                         sample_interval_ms=self.trajectory_sample_interval_ms,
                     )
                     if tcp is not None:
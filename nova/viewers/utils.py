@@ -3,22 +3,23 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Sequence, TypeVar
 
 import numpy as np
 
 if TYPE_CHECKING:
     from nova import api
     from nova.actions import Action
+    from nova.types.trajectory import TrajectoryArray
+
+TrajectoryT = TypeVar("TrajectoryT", "api.models.JointTrajectory", "TrajectoryArray")
 
 logger = logging.getLogger(__name__)
 
 
 def downsample_trajectory(
-    trajectory: api.models.JointTrajectory,
-    sample_interval_ms: float = 50.0,
-    curvature_weight: float = 0.7,
-) -> api.models.JointTrajectory:
+    trajectory: TrajectoryT, sample_interval_ms: float = 50.0, curvature_weight: float = 0.7
+) -> TrajectoryT:
     """Downsample a trajectory adaptively based on time and joint movement.
 
     This function reduces the number of samples in a trajectory while preserving
@@ -34,7 +35,8 @@ def downsample_trajectory(
     4. Always preserves the first and last samples
 
     Args:
-        trajectory: The joint trajectory to downsample
+        trajectory: The joint trajectory to downsample, either as API model or as
+            :class:`~nova.types.TrajectoryArray`
         sample_interval_ms: Target time interval between samples in milliseconds.
             Lower values = more samples = higher fidelity but more data.
             Higher values = fewer samples = lower fidelity but faster rendering.
@@ -45,12 +47,12 @@ def downsample_trajectory(
             Lower values result in more uniform time-based sampling. (default: 0.7)
 
     Returns:
-        A new JointTrajectory with reduced samples, or the original if it's
+        A new trajectory of the same type with reduced samples, or the original if it's
         already at or below the target sample rate.
     """
-    from nova import api
+    from nova.types.trajectory import TrajectoryArray, as_trajectory_array
 
-    n_samples = len(trajectory.joint_positions)
+    n_samples = len(trajectory.times)
 
     if n_samples <= 2:
         return trajectory
@@ -68,20 +70,15 @@ def downsample_trajectory(
     if n_samples <= target_samples:
         return trajectory
 
-    # Convert joint positions to numpy array for efficient computation
-    # Shape: (n_samples, n_joints)
-    joint_array = np.array([list(jp.root) for jp in trajectory.joint_positions])
+    # Work on the arrays, the joints have shape (n_samples, n_joints)
+    array = as_trajectory_array(trajectory)
 
     # Compute importance scores based on joint movement
-    importance = _compute_sample_importance(joint_array, curvature_weight)
+    importance = _compute_sample_importance(array.joints, curvature_weight)
 
     # Select indices based on importance-weighted distribution
     selected_indices = _select_samples_by_importance(importance, target_samples)
-
-    # Build the downsampled trajectory
-    downsampled_positions = [trajectory.joint_positions[i] for i in selected_indices]
-    downsampled_times = [trajectory.times[i] for i in selected_indices]
-    downsampled_locations = [trajectory.locations[i] for i in selected_indices]
+    downsampled = array.take(selected_indices)
 
     logger.debug(
         "Downsampled trajectory from %d to %d samples (%.1f%% reduction, %.1fms interval)",
@@ -91,11 +88,9 @@ def downsample_trajectory(
         duration_ms / max(1, len(selected_indices) - 1),
     )
 
-    return api.models.JointTrajectory(
-        joint_positions=downsampled_positions,
-        times=downsampled_times,
-        locations=downsampled_locations,
-    )
+    if isinstance(trajectory, TrajectoryArray):
+        return downsampled
+    return downsampled.to_api_model()
 
 
 def _compute_sample_importance(joint_array: np.ndarray, curvature_weight: float) -> np.ndarray:
@@ -221,6 +216,9 @@ def extract_collision_setups_from_actions(
 ) -> dict[str, api.models.CollisionSetup]:
     """Extract unique collision scenes from a list of actions.
 
+    Actions that share a collision scene (by content) yield a single entry, keyed by the
+    fingerprint of the scene.
+
     Args:
         actions: List of actions to extract collision scenes from
 
@@ -228,14 +226,12 @@ def extract_collision_setups_from_actions(
         Dictionary mapping collision scene IDs to CollisionScene objects
     """
     from nova.actions.motions import CollisionFreeMotion, Motion
+    from nova.utils.collision_setup import CollisionSetupRegistry
 
-    collision_scenes: dict[str, api.models.CollisionSetup] = {}
-
-    for i, action in enumerate(actions):
+    registry = CollisionSetupRegistry()
+    for action in actions:
         # Check if action is a motion with collision_scene attribute
         if isinstance(action, (Motion, CollisionFreeMotion)) and action.collision_setup is not None:
-            # Generate a deterministic ID based on action index and type
-            scene_id = f"action_{i}_{type(action).__name__}_scene"
-            collision_scenes[scene_id] = action.collision_setup
+            registry.register(action.collision_setup)
 
-    return collision_scenes
+    return {f"scene_{fingerprint[:16]}": setup for fingerprint, setup in registry.items()}
@@ -13,6 +13,7 @@ from nova.actions.io import WriteAction
 from nova.actions.motions import CollisionFreeMotion, Motion
 from nova.core.nova import Nova
 from nova.types.pose import Pose
+from nova.types.trajectory import TrajectoryArray
 from nova_rerun_bridge.blueprint import send_blueprint
 from nova_rerun_bridge.collision_scene import log_collision_setups
 from nova_rerun_bridge.consts import TIME_INTERVAL_NAME
@@ -183,7 +184,7 @@ class NovaRerunBridge:
 
     async def log_motion(
         self,
-        trajectory: api.models.JointTrajectory,
+        trajectory: api.models.JointTrajectory | TrajectoryArray,
         tcp: str,
         collision_setups: dict[str, api.models.CollisionSetup],
         motion_group: MotionGroup,
@@ -214,7 +215,7 @@ class NovaRerunBridge:
             current_time = self._motion_group_timers.get(motion_group_id, 0.0)
 
             logger.debug(
-                f"Calling log_motion function with trajectory points: {len(trajectory.joint_positions or [])}"
+                f"Calling log_motion function with trajectory points: {len(trajectory.times)}"
             )
             await log_motion(
                 trajectory=trajectory,
@@ -228,7 +229,7 @@ class NovaRerunBridge:
                 show_safety_link_chain=self.show_safety_link_chain,
             )
             # Update the timer for this motion group based on trajectory duration
-            if trajectory and trajectory.times:
+            if len(trajectory.times) > 0:
                 last_trajectory_time = trajectory.times[-1]
                 self._motion_group_timers[motion_group_id] = (
                     current_time + time_offset + last_trajectory_time
@@ -248,7 +249,7 @@ class NovaRerunBridge:
 
     async def log_trajectory(
         self,
-        trajectory: api.models.JointTrajectory,
+        trajectory: api.models.JointTrajectory | TrajectoryArray,
         tcp: str,
         motion_group: MotionGroup,
         collision_setups: dict[str, api.models.CollisionSetup],
@@ -276,7 +277,7 @@ class NovaRerunBridge:
                 stacklevel=2,
             )
 
-        if len(trajectory.joint_positions) == 0:
+        if len(trajectory.times) == 0:
             raise ValueError("No joint trajectory provided")
 
         # TODO: this is not needed anymore since we pass the data directly
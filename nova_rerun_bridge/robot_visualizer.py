@@ -9,6 +9,7 @@ from scipy.spatial.transform import Rotation
 
 from nova import api
 from nova.types import Pose
+from nova.types.trajectory import TrajectoryArray, as_trajectory_array
 from nova_rerun_bridge import colors
 from nova_rerun_bridge.dh_robot import DHRobot
 from nova_rerun_bridge.hull_visualizer import HullVisualizer
@@ -734,13 +735,13 @@ class RobotVisualizer:
                 log_geometry(entity_path, final_transform)
 
     def log_robot_geometries(
-        self, trajectory: api.models.JointTrajectory, times_column: rr.TimeColumn
+        self, trajectory: api.models.JointTrajectory | TrajectoryArray, times_column: rr.TimeColumn
     ):
         """
         Log the robot geometries for each link and TCP as separate entities.
 
         Args:
-            trajectory (list[api.models.TrajectoryData]): The list of trajectory sample points.
+            trajectory (api.models.JointTrajectory | TrajectoryArray): The trajectory sample points.
             times_column (rr.TimeColumn): The time column associated with the trajectory points.
         """
         link_positions = {}
@@ -757,8 +758,8 @@ class RobotVisualizer:
             link_positions[entity_path].append(translation)
             link_rotations[entity_path].append(rr.RotationAxisAngle(axis=axis, angle=angle))
 
-        for joint_position in trajectory.joint_positions:
-            transforms = self.compute_forward_kinematics(joint_positions=joint_position.root)
+        for joint_position in as_trajectory_array(trajectory).joints.tolist():
+            transforms = self.compute_forward_kinematics(joint_positions=joint_position)
 
             # Log robot joint geometries
             if self.mesh_loaded:
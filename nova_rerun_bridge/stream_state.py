@@ -7,7 +7,6 @@ from scipy.spatial.transform import Rotation as R
 
 from nova import MotionGroup, Nova, api
 from nova.types import Pose
-from nova.utils.downsample import downsample_stream
 from nova_rerun_bridge import colors
 from nova_rerun_bridge.consts import TIME_REALTIME_NAME
 from nova_rerun_bridge.dh_robot import DHRobot
@@ -127,9 +126,11 @@ async def stream_motion_group(
 
         logger.info(f"Started streaming motion group {motion_group.id}")
 
-        async for state in downsample_stream(motion_group.stream_state(), target_frequency):
+        # the shared state stream is downsampled for this consumer only
+        response_rate_msecs = int(1000 / target_frequency) if target_frequency else None
+        async for state in motion_group.stream_state(response_rate_msecs=response_rate_msecs):
             current_joint_position = state.joint_position.root
-            tcp_pose = Pose(state.tcp_pose)
+            tcp_pose = Pose.from_api_model(state.tcp_pose)
             if processor.tcp_pose_changed(motion_group_id=motion_group.id, tcp_pose=tcp_pose):
                 rr.reset_time()
                 rr.set_time(TIME_REALTIME_NAME, timestamp=time.time())
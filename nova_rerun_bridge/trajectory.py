@@ -2,12 +2,12 @@ import uuid
 from enum import Enum, auto
 from typing import Optional
 
-import numpy as np
 import rerun as rr
 from scipy.spatial.transform import Rotation as R
 
 from nova import MotionGroup, api
 from nova.types import Pose
+from nova.types.trajectory import TrajectoryArray, as_trajectory_array
 from nova_rerun_bridge.collision_scene import extract_link_chain_and_tcp
 from nova_rerun_bridge.consts import TIME_INTERVAL_NAME
 from nova_rerun_bridge.dh_robot import DHRobot
@@ -37,7 +37,7 @@ _visualizer_cache: dict[str, RobotVisualizer] = {}
 
 
 async def log_motion(
-    trajectory: api.models.JointTrajectory,
+    trajectory: api.models.JointTrajectory | TrajectoryArray,
     tcp: str,
     motion_group: MotionGroup,
     collision_setups: dict[str, api.models.CollisionSetup],
@@ -183,16 +183,16 @@ async def log_motion(
 
 
 def get_times_column(
-    trajectory: api.models.JointTrajectory, timer_offset: float = 0
+    trajectory: api.models.JointTrajectory | TrajectoryArray, timer_offset: float = 0
 ) -> rr.TimeColumn:
-    times = np.array([timer_offset + time for time in trajectory.times])
+    times = as_trajectory_array(trajectory).times + timer_offset
     times_column = rr.TimeColumn(TIME_INTERVAL_NAME, duration=times)
     return times_column
 
 
 async def log_trajectory(
     motion_id: str,
-    trajectory: api.models.JointTrajectory,
+    trajectory: api.models.JointTrajectory | TrajectoryArray,
     tcp: str,
     motion_group: MotionGroup,
     robot: DHRobot,
@@ -206,11 +206,12 @@ async def log_trajectory(
     rr.reset_time()
     rr.set_time(TIME_INTERVAL_NAME, duration=timer_offset)
 
+    trajectory = as_trajectory_array(trajectory)
     times_column = get_times_column(trajectory, timer_offset)
     motion_group_id = motion_group.id
 
     # TODO: calculate tcp pose from joint positions
-    joint_positions = [tuple(p.root) for p in trajectory.joint_positions]
+    joint_positions = [tuple(joints) for joints in trajectory.joints.tolist()]
     tcp_poses = await motion_group.forward_kinematics(joints=joint_positions, tcp=tcp)
     positions = [[p.position.x, p.position.y, p.position.z] for p in tcp_poses]
 
@@ -223,8 +224,8 @@ async def log_trajectory(
 
     # Calculate and log joint positions
     line_segments_batch = []
-    for joint_position in trajectory.joint_positions:
-        robot_joint_positions = robot.calculate_joint_positions(joint_positions=joint_position.root)
+    for joint_position in joint_positions:
+        robot_joint_positions = robot.calculate_joint_positions(joint_positions=joint_position)
         line_segments_batch.append([robot_joint_positions])  # Wrap each as a line strip
 
     rr.send_columns(
@@ -1,17 +1,28 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
+import numpy as np
 import pytest
 
 from nova import api
-from nova.actions import cartesian_ptp, collision_free, io_write, linear, wait
+from nova.actions import cartesian_ptp, collision_free, io_write, jnt, linear, wait
 from nova.actions.base import Action
 from nova.actions.io import ReadAction
-from nova.cell.motion_group import MotionGroup, split_actions_into_batches
+from nova.cell.motion_group import (
+    MotionGroup,
+    _group_batches_by_known_start,
+    split_actions_into_batches,
+)
 from nova.core.gateway import ApiGateway
 from nova.exceptions import InconsistentCollisionScenes
 from nova.types import Pose
 from nova.types.motion_settings import MotionSettings
-from nova.utils.collision_setup import compare_collision_setups, validate_collision_setups
+from nova.utils.collision_setup import (
+    CollisionSetupRegistry,
+    collision_setup_fingerprint,
+    compare_collision_setups,
+    validate_collision_setups,
+)
 
 
 @pytest.mark.asyncio
@@ -165,6 +176,45 @@ async def test_compare_collision_setup():
     assert compare_collision_setups(collision_setup_1, collision_setup_2) is False
 
 
+def test_collision_setup_fingerprint_uses_memo(monkeypatch):
+    collision_setup = _test_collider([0, 0, 0])
+    memo: dict[int, str] = {}
+    fingerprint = collision_setup_fingerprint(collision_setup, memo)
+    model_dump_json = MagicMock()
+    monkeypatch.setattr(api.models.CollisionSetup, "model_dump_json", model_dump_json)
+
+    assert collision_setup_fingerprint(collision_setup, memo) == fingerprint
+    model_dump_json.assert_not_called()
+
+
+def test_collision_setup_fingerprint_follows_changes():
+    collision_setup = _test_collider([0, 0, 0])
+    fingerprint = collision_setup_fingerprint(collision_setup)
+
+    collision_setup.colliders.root["test_collider"].pose.position.root[1] = 10
+
+    assert collision_setup_fingerprint(collision_setup) != fingerprint
+    assert collision_setup_fingerprint(collision_setup) == collision_setup_fingerprint(
+        _test_collider([0, 10, 0])
+    )
+
+
+def test_collision_setup_registry_deduplicates_by_content():
+    registry = CollisionSetupRegistry()
+    first = _test_collider([0, 0, 0])
+
+    fingerprints = [
+        registry.register(first),
+        registry.register(_test_collider([0, 0, 0])),
+        registry.register(_test_collider([0, 10, 0])),
+    ]
+
+    assert fingerprints[0] == fingerprints[1] != fingerprints[2]
+    assert len(registry) == 2
+    assert registry.get(fingerprints[0]) is first
+    assert fingerprints[2] in registry
+
+
 def test_validate_collision_setup_single_action():
     validate_collision_setups([linear((0, 0, 0, 0, 0, 0))])
     validate_collision_setups([linear((0, 0, 0, 0, 0, 0), settings=MotionSettings())])
@@ -588,3 +638,435 @@ async def test_forward_kinematics_with_tcp_applies_tcp_offset(mock_motion_group)
         "forward_kinematics_request"
     ]
     assert request.tcp_offset == Pose(gripper_pose).to_api_model()
+
+
+def _description_with_tcps(*tcp_names: str) -> api.models.MotionGroupDescription:
+    pose = api.models.Pose(
+        position=api.models.Vector3d([0, 0, 0]), orientation=api.models.RotationVector([0, 0, 0])
+    )
+    return api.models.MotionGroupDescription(
+        motion_group_model=api.models.MotionGroupModel("test-model"),
+        operation_limits=api.models.OperationLimits(),
+        tcps={name: api.models.TcpOffset(name=name, pose=pose) for name in tcp_names},
+    )
+
+
+@pytest.mark.asyncio
+async def test_motion_group_description_is_cached(mock_motion_group):
+    get_description = mock_motion_group._api_client.motion_group_api.get_motion_group_description
+    get_description.return_value = _description_with_tcps("Flange")
+
+    await mock_motion_group.get_model()
+    await mock_motion_group.tcp_offset("Flange")
+    await mock_motion_group.get_mounting()
+    await mock_motion_group.tcps()
+
+    get_description.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_motion_group_description_concurrent_fetches_are_merged(mock_motion_group):
+    get_description = mock_motion_group._api_client.motion_group_api.get_motion_group_description
+    get_description.return_value = _description_with_tcps("Flange")
+
+    await asyncio.gather(*(mock_motion_group.get_description() for _ in range(5)))
+
+    get_description.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_motion_group_description_invalidate_and_ttl(mock_motion_group):
+    get_description = mock_motion_group._api_client.motion_group_api.get_motion_group_description
+    get_description.return_value = _description_with_tcps("Flange")
+
+    await mock_motion_group.get_description()
+    mock_motion_group.invalidate()
+    await mock_motion_group.get_description()
+    assert get_description.await_count == 2
+
+    # an expired entry is fetched again
+    mock_motion_group._description_fetched_at -= mock_motion_group._description_cache_ttl
+    await mock_motion_group.get_description()
+    assert get_description.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_motion_group_description_cache_disabled():
+    mock_api_client = MagicMock(spec=ApiGateway)
+    mock_api_client.motion_group_api = MagicMock()
+    mock_api_client.motion_group_api.get_motion_group_description = AsyncMock(
+        return_value=_description_with_tcps("Flange")
+    )
+    motion_group = MotionGroup(
+        api_client=mock_api_client,
+        cell="test_cell",
+        controller_id="test-controller",
+        motion_group_id="0@test-controller",
+        description_cache_ttl=0,
+    )
+
+    await motion_group.get_description()
+    await motion_group.get_description()
+
+    assert mock_api_client.motion_group_api.get_motion_group_description.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_ensure_virtual_tcp_invalidates_cached_description(mock_motion_group):
+    get_description = mock_motion_group._api_client.motion_group_api.get_motion_group_description
+    get_description.side_effect = [
+        _description_with_tcps("Flange"),
+        _description_with_tcps("Flange", "test_tcp"),
+    ]
+    tcp = api.models.RobotTcp(
+        id="test_tcp",
+        name="test_tcp",
+        position=api.models.Vector3d([0, 0, 0]),
+        orientation=api.models.Orientation([0, 0, 0]),
+    )
+
+    assert "test_tcp" not in await mock_motion_group.tcps()
+    result = await mock_motion_group.ensure_virtual_tcp(tcp)
+
+    assert result.id == "test_tcp"
+    assert "test_tcp" in await mock_motion_group.tcps()
+    assert get_description.await_count == 2
+
+
+def test_group_batches_by_known_start():
+    start = (0.0,) * 6
+    cf_joints = collision_free((1.0,) * 6)
+    cf_pose = collision_free(Pose((1, 2, 3, 0, 0, 0)))
+    l1 = linear((0, 0, 0, 0, 0, 0))
+    j1 = jnt((2.0,) * 6)
+    w1 = wait(1)
+    l2 = linear((1, 1, 1, 0, 0, 0))
+
+    batches = split_actions_into_batches([cf_joints, l1, j1, w1, cf_pose, l2])
+    groups = _group_batches_by_known_start(batches, start)
+
+    assert groups == [
+        (start, [[cf_joints]]),
+        ((1.0,) * 6, [[l1, j1]]),
+        ((2.0,) * 6, [[w1]]),
+        ((2.0,) * 6, [[cf_pose], [l2]]),
+    ]
+
+
+def test_group_batches_by_known_start_cartesian_end_chains_batches():
+    start = (0.0,) * 6
+    l1 = linear((0, 0, 0, 0, 0, 0))
+    w1 = wait(1)
+    cf_joints = collision_free((1.0,) * 6)
+
+    batches = split_actions_into_batches([l1, w1, cf_joints])
+
+    assert _group_batches_by_known_start(batches, start) == [(start, [[l1], [w1], [cf_joints]])]
+
+
+@pytest.mark.asyncio
+async def test_plan_independent_batches_waits_for_cancelled_groups(mock_motion_group):
+    async def plan_collision_free(action, tcp, motion_group_setup, start_joint_position):
+        if action.target[0] == 1.0:
+            raise RuntimeError("unreachable")
+        await asyncio.sleep(10)
+
+    mock_motion_group._plan_collision_free = AsyncMock(side_effect=plan_collision_free)
+    actions = [collision_free((float(i),) * 6) for i in range(1, 4)]
+
+    with pytest.raises(RuntimeError, match="unreachable"):
+        await mock_motion_group._plan(
+            actions,
+            tcp=None,
+            start_joint_position=(0.0,) * 6,
+            motion_group_setup=api.models.MotionGroupSetup(
+                motion_group_model=api.models.MotionGroupModel("test-model"), cycle_time=8
+            ),
+        )
+
+    assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
+
+
+@pytest.mark.asyncio
+async def test_plan_independent_batches_concurrently(mock_motion_group):
+    """Batches starting at a known joint position are planned concurrently and stitched in order."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def plan_collision_free(action, tcp, motion_group_setup, start_joint_position):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return api.models.JointTrajectory(
+            joint_positions=[
+                api.models.Joints(list(start_joint_position)),
+                api.models.Joints(list(action.target)),
+            ],
+            times=[0.0, 1.0],
+            locations=[api.models.Location(0.0), api.models.Location(1.0)],
+        )
+
+    mock_motion_group._plan_collision_free = AsyncMock(side_effect=plan_collision_free)
+    actions = [collision_free((float(i),) * 6) for i in range(1, 4)]
+
+    trajectory = await mock_motion_group._plan(
+        actions,
+        tcp=None,
+        start_joint_position=(0.0,) * 6,
+        motion_group_setup=api.models.MotionGroupSetup(
+            motion_group_model=api.models.MotionGroupModel("test-model"), cycle_time=8
+        ),
+    )
+
+    assert max_in_flight == 3
+    assert [tuple(joints) for joints in trajectory.joint_positions] == [
+        (float(i),) * 6 for i in range(4)
+    ]
+    assert trajectory.times == [0.0, 1.0, 2.0, 3.0]
+
+
+def _collision_free_motion_group(
+    concurrency: int, selection: str, durations: dict[float, float | None]
+) -> tuple[MotionGroup, list[float]]:
+    """Motion group whose planner reaches a candidate (keyed by its first joint) after
+    ``durations[joint]`` seconds of planning or fails when the duration is None."""
+    mock_api_client = MagicMock(spec=ApiGateway)
+    mock_api_client.trajectory_planning_api = MagicMock()
+    started: list[float] = []
+
+    async def plan_collision_free(cell, plan_collision_free_request):
+        target = plan_collision_free_request.target.root
+        started.append(target[0])
+        duration = durations[target[0]]
+        await asyncio.sleep(abs(duration) if duration is not None else 0.01)
+        if duration is None:
+            raise RuntimeError("unreachable")
+        return MagicMock(
+            response=api.models.JointTrajectory(
+                joint_positions=[api.models.Joints([0.0] * 6), api.models.Joints(target)],
+                times=[0.0, duration],
+                locations=[api.models.Location(0.0), api.models.Location(1.0)],
+            )
+        )
+
+    mock_api_client.trajectory_planning_api.plan_collision_free = AsyncMock(
+        side_effect=plan_collision_free
+    )
+    motion_group = MotionGroup(
+        api_client=mock_api_client,
+        cell="test_cell",
+        controller_id="test-controller",
+        motion_group_id="0@test-controller",
+        collision_free_candidate_concurrency=concurrency,
+        collision_free_candidate_selection=selection,
+    )
+    # candidates are ranked by their distance to the start joints
+    motion_group._inverse_kinematics = AsyncMock(
+        return_value=[[(joint,) + (0.0,) * 5 for joint in durations]]
+    )
+    return motion_group, started
+
+
+async def _plan_to_pose(motion_group: MotionGroup) -> api.models.JointTrajectory:
+    return await motion_group._plan_collision_free(
+        action=collision_free(Pose((1, 2, 3, 0, 0, 0))),
+        tcp="Flange",
+        motion_group_setup=api.models.MotionGroupSetup(
+            motion_group_model=api.models.MotionGroupModel("test-model"), cycle_time=8
+        ),
+        start_joint_position=(0.0,) * 6,
+    )
+
+
+@pytest.mark.asyncio
+async def test_collision_free_candidates_sequential_by_default():
+    motion_group, started = _collision_free_motion_group(
+        1, "best_ranked", {0.1: None, 0.2: 0.05, 0.3: 0.01}
+    )
+
+    trajectory = await _plan_to_pose(motion_group)
+
+    assert trajectory.joint_positions[-1].root[0] == 0.2
+    assert started == [0.1, 0.2]
+
+
+@pytest.mark.asyncio
+async def test_collision_free_candidates_concurrent_keeps_ranking():
+    # the third candidate finishes first, but the second-ranked reachable one wins
+    motion_group, started = _collision_free_motion_group(
+        3, "best_ranked", {0.1: None, 0.2: 0.05, 0.3: 0.01, 0.4: 0.01}
+    )
+
+    trajectory = await _plan_to_pose(motion_group)
+
+    assert trajectory.joint_positions[-1].root[0] == 0.2
+    # the best-ranked candidates start first, the fourth only once the first one failed
+    assert started == [0.1, 0.2, 0.3, 0.4]
+
+
+@pytest.mark.asyncio
+async def test_collision_free_candidates_concurrent_waits_for_cancelled_candidates():
+    motion_group, _ = _collision_free_motion_group(2, "best_ranked", {0.1: 0.01, 0.2: 10})
+
+    await _plan_to_pose(motion_group)
+
+    assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
+
+
+@pytest.mark.asyncio
+async def test_collision_free_candidates_concurrent_shortest():
+    motion_group, started = _collision_free_motion_group(
+        2, "shortest", {0.1: 0.05, 0.2: None, 0.3: 0.02}
+    )
+
+    trajectory = await _plan_to_pose(motion_group)
+
+    assert trajectory.joint_positions[-1].root[0] == 0.3
+    assert sorted(started) == [0.1, 0.2, 0.3]
+
+
+@pytest.mark.asyncio
+async def test_collision_free_candidates_concurrent_all_fail():
+    motion_group, _ = _collision_free_motion_group(2, "best_ranked", {0.1: None, 0.2: None})
+
+    with pytest.raises(ValueError, match="No collision free trajectory found"):
+        await _plan_to_pose(motion_group)
+
+
+def _kinematics_motion_group(mock_motion_group, max_in_flight: list[int]):
+    """Mock IK returning (pose.x,) * 6 as only solution and FK returning (joint[0], 0, ...)."""
+    in_flight = 0
+    mock_motion_group._api_client.motion_group_api.get_motion_group_description.return_value = (
+        _description_with_tcps("Flange")
+    )
+
+    async def track():
+        nonlocal in_flight
+        in_flight += 1
+        max_in_flight[0] = max(max_in_flight[0], in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    async def inverse_kinematics(cell, inverse_kinematics_request):
+        await track()
+        return MagicMock(
+            joints=[[[pose.position.root[0]] * 6] for pose in inverse_kinematics_request.tcp_poses]
+        )
+
+    async def forward_kinematics(cell, forward_kinematics_request):
+        await track()
+        return MagicMock(
+            tcp_poses=[
+                api.models.Pose(
+                    position=api.models.Vector3d([joints.root[0], 0, 0]),
+                    orientation=api.models.RotationVector([0, 0, 0]),
+                )
+                for joints in forward_kinematics_request.joint_positions
+            ]
+        )
+
+    mock_motion_group._api_client.kinematics_api.inverse_kinematics = AsyncMock(
+        side_effect=inverse_kinematics
+    )
+    mock_motion_group._api_client.kinematics_api.forward_kinematics = AsyncMock(
+        side_effect=forward_kinematics
+    )
+    mock_motion_group.get_setup = AsyncMock(
+        return_value=api.models.MotionGroupSetup(
+            motion_group_model=api.models.MotionGroupModel("test-model"), cycle_time=8
+        )
+    )
+    return mock_motion_group
+
+
+@pytest.mark.asyncio
+async def test_inverse_kinematics_many_chunks_requests(mock_motion_group):
+    max_in_flight = [0]
+    motion_group = _kinematics_motion_group(mock_motion_group, max_in_flight)
+    poses = [(float(i), 0, 0, 0, 0, 0) for i in range(10)]
+
+    solutions = await motion_group.inverse_kinematics_many(
+        poses, tcp="Flange", chunk_size=3, max_concurrency=2
+    )
+
+    assert len(solutions) == 10
+    for i, pose_solutions in enumerate(solutions):
+        np.testing.assert_allclose(pose_solutions, [[float(i)] * 6])
+    assert motion_group._api_client.kinematics_api.inverse_kinematics.await_count == 4
+    assert max_in_flight[0] == 2
+    motion_group.get_setup.assert_awaited_once()
+    motion_group._api_client.motion_group_api.get_motion_group_description.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_inverse_kinematics_many_keeps_joint_count_of_unreachable_poses(mock_motion_group):
+    mock_motion_group._api_client.motion_group_api.get_motion_group_description.return_value = (
+        _description_with_tcps("Flange")
+    )
+    mock_motion_group._api_client.kinematics_api.inverse_kinematics = AsyncMock(
+        return_value=MagicMock(joints=[[[0.0] * 6], []])
+    )
+    joint_limits = api.models.JointLimits(
+        position=api.models.LimitRange(lower_limit=-np.pi, upper_limit=np.pi)
+    )
+    setup = api.models.MotionGroupSetup(
+        motion_group_model=api.models.MotionGroupModel("test-model"),
+        cycle_time=8,
+        global_limits=api.models.LimitSet(joints=[joint_limits] * 6),
+    )
+
+    solutions = await mock_motion_group.inverse_kinematics_many(
+        [(0, 0, 0, 0, 0, 0), (5000, 0, 0, 0, 0, 0)], tcp="Flange", motion_group_setup=setup
+    )
+
+    assert [solution.shape for solution in solutions] == [(1, 6), (0, 6)]
+
+
+@pytest.mark.asyncio
+async def test_kinematics_many_return_empty_results_for_empty_input(mock_motion_group):
+    assert await mock_motion_group.inverse_kinematics_many([], tcp="Flange") == []
+    poses = await mock_motion_group.forward_kinematics_many(np.empty((0, 6)), tcp=None)
+
+    assert poses.shape == (0, 6)
+    mock_motion_group._api_client.kinematics_api.forward_kinematics.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_forward_kinematics_many_returns_array(mock_motion_group):
+    max_in_flight = [0]
+    motion_group = _kinematics_motion_group(mock_motion_group, max_in_flight)
+    joints = np.arange(7, dtype=float)[:, None] * np.ones((1, 6))
+
+    poses = await motion_group.forward_kinematics_many(joints, tcp=None, chunk_size=2)
+
+    assert poses.shape == (7, 6)
+    np.testing.assert_allclose(poses[:, 0], np.arange(7))
+    assert motion_group._api_client.kinematics_api.forward_kinematics.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_forward_kinematics_local_uses_dh_parameters(mock_motion_group):
+    gripper_pose = api.models.Pose(
+        position=api.models.Vector3d([0, 0, 10]), orientation=api.models.RotationVector([0, 0, 0])
+    )
+    mock_motion_group._api_client.motion_group_api.get_motion_group_description.return_value = (
+        api.models.MotionGroupDescription(
+            motion_group_model=api.models.MotionGroupModel("test-model"),
+            operation_limits=api.models.OperationLimits(),
+            mounting=api.models.Pose(
+                position=api.models.Vector3d([0, 0, 500]),
+                orientation=api.models.RotationVector([0, 0, 0]),
+            ),
+            tcps={"gripper": api.models.TcpOffset(name="gripper", pose=gripper_pose)},
+            dh_parameters=[api.models.DHParameter(a=100.0), api.models.DHParameter(a=50.0)],
+        )
+    )
+
+    result = await mock_motion_group.forward_kinematics(
+        joints=[(0.0, 0.0), (np.pi / 2, 0.0)], tcp="gripper", local=True
+    )
+
+    assert result == [Pose((150, 0, 510, 0, 0, 0)), Pose((0, 150, 510, 0, 0, np.pi / 2))]
+    mock_motion_group._api_client.kinematics_api.forward_kinematics.assert_not_awaited()
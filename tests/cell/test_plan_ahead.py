@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+
+from nova.actions import collision_free, jnt, lin, wait
+from nova.cell.robot_cell import PLAN_AHEAD_BOUNDARY, split_actions_into_segments
+from nova.cell.simulation import SimulatedRobot
+from nova.types import MotionSettings
+
+
+def test_split_at_motions_without_blending():
+    actions = [jnt((i, 0, 0, 0, 0, 0)) for i in range(5)]
+
+    assert split_actions_into_segments(actions, 2) == [actions[:2], actions[2:4], actions[4:]]
+
+
+def test_split_keeps_blended_motions_together():
+    blended = MotionSettings(blending_radius=10)
+    actions = [
+        lin((100, 0, 0), settings=blended),
+        lin((200, 0, 0), settings=blended),
+        lin((300, 0, 0)),
+        lin((400, 0, 0)),
+    ]
+
+    assert split_actions_into_segments(actions, 1) == [actions[:3], actions[3:]]
+
+
+def test_split_at_collision_free_motions_waits_and_markers():
+    blended = MotionSettings(blending_radius=10)
+    marked = lin((100, 0, 0), settings=blended, **{PLAN_AHEAD_BOUNDARY: True})
+    actions = [
+        lin((0, 0, 0), settings=blended),
+        collision_free((0, 0, 0, 0, 0, 0)),
+        lin((0, 0, 0), settings=blended),
+        marked,
+        lin((200, 0, 0), settings=blended),
+        wait(1),
+        lin((300, 0, 0), settings=blended),
+    ]
+
+    assert split_actions_into_segments(actions, 1) == [
+        actions[:1],
+        actions[1:2],
+        actions[2:4],
+        actions[4:5],
+        actions[5:],
+    ]
+
+
+def test_split_appends_trailing_actions_without_motions():
+    actions = [jnt((0, 0, 0, 0, 0, 0)), jnt((1, 0, 0, 0, 0, 0)), wait(1)]
+
+    assert split_actions_into_segments(actions, 1) == [actions[:1], actions[1:]]
+
+
+def test_split_rejects_invalid_segment_size():
+    with pytest.raises(ValueError):
+        split_actions_into_segments([jnt((0, 0, 0, 0, 0, 0))], 0)
+
+
+class _RecordingRobot(SimulatedRobot):
+    def __init__(self, fail_on_segment: int | None = None):
+        super().__init__()
+        self.events: list[str] = []
+        self.plan_starts: list[tuple[float, ...] | None] = []
+        self._fail_on_segment = fail_on_segment
+
+    async def _plan(self, actions, tcp=None, start_joint_position=None, **kwargs):
+        segment = len(self.plan_starts)
+        self.plan_starts.append(start_joint_position)
+        self.events.append(f"plan {segment}")
+        if segment == self._fail_on_segment:
+            raise RuntimeError("planning failed")
+        await asyncio.sleep(0.01)
+        trajectory = await super()._plan(actions, tcp, start_joint_position, **kwargs)
+        # speed up the simulated execution, which waits for the planned times
+        trajectory.times = [t / 100 for t in trajectory.times]
+        return trajectory
+
+    async def _execute(self, joint_trajectory, tcp, actions, movement_controller, **kwargs):
+        self.events.append(f"execute {len(self.record_of_commands)}")
+        async for state in super()._execute(
+            joint_trajectory, tcp, actions, movement_controller, **kwargs
+        ):
+            yield state
+
+
+@pytest.mark.asyncio
+async def test_stream_plan_and_execute_plans_ahead():
+    robot = _RecordingRobot()
+    actions = [jnt((0.1 * i, 0, 0, 0, 0, 0)) for i in range(1, 7)]
+
+    states = [
+        state
+        async for state in robot.stream_plan_and_execute(
+            actions, "Flange", plan_ahead_segment_size=2
+        )
+    ]
+
+    assert robot.record_of_commands == [actions[:2], actions[2:4], actions[4:]]
+    # execution starts after the first segment is planned
+    assert robot.events.index("execute 0") < robot.events.index("plan 2")
+    # each segment starts where the previous one ended
+    assert robot.plan_starts[1] == pytest.approx((0.2, 0, 0, 0, 0, 0))
+    assert robot.plan_starts[2] == pytest.approx((0.4, 0, 0, 0, 0, 0))
+    # path parameters continue across segments
+    path_parameters = [state.path_parameter for state in states]
+    assert path_parameters == sorted(path_parameters)
+    assert path_parameters[-1] == pytest.approx(6)
+    assert states[-1].state.joints == pytest.approx((0.6, 0, 0, 0, 0, 0))
+
+
+@pytest.mark.asyncio
+async def test_stream_plan_and_execute_without_segment_size_plans_everything():
+    robot = _RecordingRobot()
+    actions = [jnt((0.1 * i, 0, 0, 0, 0, 0)) for i in range(1, 4)]
+
+    await robot.plan_and_execute(actions, "Flange")
+
+    assert robot.record_of_commands == [actions]
+    assert robot.events == ["plan 0", "execute 0"]
+
+
+@pytest.mark.asyncio
+async def test_plan_ahead_propagates_planning_errors():
+    robot = _RecordingRobot(fail_on_segment=1)
+    actions = [jnt((0.1 * i, 0, 0, 0, 0, 0)) for i in range(1, 5)]
+
+    with pytest.raises(RuntimeError, match="planning failed"):
+        await robot.plan_and_execute(actions, "Flange", plan_ahead_segment_size=2)
+
+    assert robot.record_of_commands == [actions[:2]]
+
+
+@pytest.mark.asyncio
+async def test_plan_ahead_stops_the_planner_when_the_consumer_stops():
+    robot = _RecordingRobot()
+    actions = [jnt((0.1 * i, 0, 0, 0, 0, 0)) for i in range(1, 7)]
+
+    states = robot.stream_plan_and_execute(actions, "Flange", plan_ahead_segment_size=1)
+    await anext(states)
+    await states.aclose()
+
+    assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
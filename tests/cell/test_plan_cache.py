@@ -0,0 +1,177 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nova import api
+from nova.actions import jnt, linear, wait
+from nova.cell.motion_group import MotionGroup
+from nova.cell.plan_cache import (
+    DirectoryPlanCacheBackend,
+    InMemoryPlanCacheBackend,
+    PlanCache,
+    plan_cache_key,
+)
+from nova.core.gateway import ApiGateway
+from nova.types import MotionSettings
+
+START = (0.0, -1.57, 1.57, 0.0, 0.0, 0.0)
+
+
+def _setup(payload_mass: float | None = None) -> api.models.MotionGroupSetup:
+    return api.models.MotionGroupSetup(
+        motion_group_model=api.models.MotionGroupModel("test-model"),
+        cycle_time=8,
+        payload=api.models.Payload(name="payload", payload=payload_mass)
+        if payload_mass is not None
+        else None,
+    )
+
+
+def _trajectory(end: float = 1.0) -> api.models.JointTrajectory:
+    return api.models.JointTrajectory(
+        joint_positions=[api.models.Joints(list(START)), api.models.Joints([end] * 6)],
+        times=[0.0, 1.0],
+        locations=[api.models.Location(0.0), api.models.Location(1.0)],
+    )
+
+
+def test_plan_cache_key_ignores_metas():
+    a = linear((1, 2, 3, 0, 0, 0))
+    b = linear((1, 2, 3, 0, 0, 0), line_number=42)
+    assert plan_cache_key([a], "Flange", START, _setup()) == plan_cache_key(
+        [b], "Flange", START, _setup()
+    )
+
+
+@pytest.mark.parametrize(
+    "actions, tcp, start, setup",
+    [
+        ([linear((1, 2, 4, 0, 0, 0))], "Flange", START, _setup()),
+        (
+            [linear((1, 2, 3, 0, 0, 0), settings=MotionSettings(tcp_velocity_limit=10))],
+            "Flange",
+            START,
+            _setup(),
+        ),
+        ([linear((1, 2, 3, 0, 0, 0))], "Gripper", START, _setup()),
+        ([linear((1, 2, 3, 0, 0, 0))], "Flange", (0.1,) + START[1:], _setup()),
+        ([linear((1, 2, 3, 0, 0, 0))], "Flange", START, _setup(payload_mass=5.0)),
+        ([linear((1, 2, 3, 0, 0, 0)), wait(1)], "Flange", START, _setup()),
+    ],
+)
+def test_plan_cache_key_changes_with_inputs(actions, tcp, start, setup):
+    reference = plan_cache_key([linear((1, 2, 3, 0, 0, 0))], "Flange", START, _setup())
+    assert plan_cache_key(actions, tcp, start, setup) != reference
+
+
+def test_plan_cache_key_hashes_setup_collision_setups_by_content():
+    def setup_with(self_collision_detection: bool) -> api.models.MotionGroupSetup:
+        return _setup().model_copy(
+            update={
+                "collision_setups": api.models.CollisionSetups(
+                    {
+                        "scene": api.models.CollisionSetup(
+                            self_collision_detection=self_collision_detection
+                        )
+                    }
+                )
+            }
+        )
+
+    actions = [linear((1, 2, 3, 0, 0, 0))]
+    key = plan_cache_key(actions, "Flange", START, setup_with(True))
+
+    assert plan_cache_key(actions, "Flange", START, setup_with(True)) == key
+    assert plan_cache_key(actions, "Flange", START, setup_with(False)) != key
+    assert plan_cache_key(actions, "Flange", START, _setup()) != key
+
+
+def test_plan_cache_key_follows_collision_setup_changes():
+    collision_setup = api.models.CollisionSetup(self_collision_detection=True)
+    actions = [linear((1, 2, 3, 0, 0, 0), collision_setup=collision_setup)] * 2
+    key = plan_cache_key(actions, "Flange", START, _setup())
+
+    collision_setup.self_collision_detection = False
+
+    assert plan_cache_key(actions, "Flange", START, _setup()) != key
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_evicts_least_recently_used():
+    backend = InMemoryPlanCacheBackend(max_entries=2)
+    await backend.put("a", _trajectory(1.0))
+    await backend.put("b", _trajectory(2.0))
+    assert await backend.get("a") is not None
+    await backend.put("c", _trajectory(3.0))
+
+    assert len(backend) == 2
+    assert await backend.get("b") is None
+    assert await backend.get("a") is not None
+    assert await backend.get("c") is not None
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_returns_copies():
+    backend = InMemoryPlanCacheBackend()
+    await backend.put("a", _trajectory())
+    cached = await backend.get("a")
+    cached.times.append(2.0)
+
+    assert (await backend.get("a")).times == [0.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_directory_backend_persists_and_evicts_by_size(tmp_path):
+    entry_size = len(_trajectory().model_dump_json())
+    backend = DirectoryPlanCacheBackend(tmp_path, max_size_bytes=2 * entry_size)
+    await backend.put("a", _trajectory(1.0))
+    await backend.put("b", _trajectory(2.0))
+
+    reopened = DirectoryPlanCacheBackend(tmp_path, max_size_bytes=2 * entry_size)
+    assert await reopened.get("a") == _trajectory(1.0)
+
+    await reopened.put("c", _trajectory(3.0))
+    assert len(reopened) == 2
+    assert await reopened.get("c") == _trajectory(3.0)
+
+    await reopened.clear()
+    assert len(reopened) == 0
+
+
+@pytest.mark.asyncio
+async def test_plan_cache_counts_hits_and_misses():
+    cache = PlanCache()
+    plan = AsyncMock(return_value=_trajectory())
+
+    assert await cache.get_or_plan("key", plan) == _trajectory()
+    assert await cache.get_or_plan("key", plan) == _trajectory()
+
+    plan.assert_awaited_once()
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+@pytest.mark.asyncio
+async def test_motion_group_plan_uses_plan_cache():
+    mock_api_client = MagicMock(spec=ApiGateway)
+    mock_api_client.trajectory_planning_api = MagicMock()
+    mock_api_client.trajectory_planning_api.plan_trajectory = AsyncMock(
+        return_value=MagicMock(response=_trajectory())
+    )
+    motion_group = MotionGroup(
+        api_client=mock_api_client,
+        cell="test_cell",
+        controller_id="test-controller",
+        motion_group_id="0@test-controller",
+        plan_cache=PlanCache(),
+    )
+
+    for _ in range(3):
+        trajectory = await motion_group.plan(
+            [jnt((1.0,) * 6)], start_joint_position=START, motion_group_setup=_setup()
+        )
+        assert trajectory == _trajectory()
+
+    mock_api_client.trajectory_planning_api.plan_trajectory.assert_awaited_once()
+    assert motion_group.plan_cache.stats().hits == 2
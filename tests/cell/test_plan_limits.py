@@ -267,11 +267,25 @@ def test_with_collision_setup_does_not_mutate_caller():
 
     result = _with_collision_setup(setup, "collision-check", _collision_setup())
 
-    # Input setup is deep-copied: its collision_setups stays None.
+    # Input setup is copied: its collision_setups stays None.
     assert setup.collision_setups is None
     assert "collision-check" in result.collision_setups.root
 
 
+def test_with_collision_setup_shares_existing_collision_setups():
+    existing = _collision_setup()
+    setup = _bare_setup()
+    setup.collision_setups = models.CollisionSetups({"scene": existing})
+    added = _collision_setup()
+
+    result = _with_collision_setup(setup, "collision-check", added)
+
+    # copy-on-write: the mapping is new, the (potentially large) collision setups are shared
+    assert list(setup.collision_setups.root) == ["scene"]
+    assert result.collision_setups.root["scene"] is existing
+    assert result.collision_setups.root["collision-check"] is added
+
+
 def test_with_collision_setup_none_collision_is_noop():
     result = _with_collision_setup(_bare_setup(), "collision-check", None)
 
@@ -0,0 +1,92 @@
+import asyncio
+import time
+
+import pytest
+
+from nova.actions import jnt, wait
+from nova.cell.simulation import (
+    SimulatedRobot,
+    SimulatedTimer,
+    VirtualClock,
+    get_simulated_robot_cell,
+)
+
+
+async def test_virtual_clock_wakes_sleepers_in_order():
+    clock = VirtualClock()
+    woken = []
+
+    async def sleeper(name: str, seconds: float):
+        await clock.sleep(seconds)
+        woken.append((name, clock.time()))
+
+    await asyncio.gather(sleeper("late", 30), sleeper("early", 10), sleeper("middle", 20))
+
+    assert woken == [("early", 10), ("middle", 20), ("late", 30)]
+
+
+async def test_cancelled_sleep_does_not_advance_the_clock():
+    clock = VirtualClock()
+    task = asyncio.create_task(clock.sleep(100))
+    await asyncio.sleep(0)
+    task.cancel()
+
+    await clock.sleep(1)
+
+    assert clock.time() == 1
+
+
+async def test_scaled_clock_runs_faster_than_real_time():
+    clock = VirtualClock(speed_factor=100)
+    start = time.monotonic()
+
+    await clock.sleep(2)
+
+    assert time.monotonic() - start < 1
+    assert clock.time() >= 2
+
+
+def test_speed_factor_must_be_positive():
+    with pytest.raises(ValueError):
+        VirtualClock(speed_factor=0)
+
+
+async def test_robot_executes_on_the_virtual_clock():
+    clock = VirtualClock()
+    robot = SimulatedRobot()
+    robot.use_clock(clock)
+    actions = [jnt((1, 0, 0, 0, 0, 0)), wait(600), jnt((0, 0, 0, 0, 0, 0))]
+    trajectory = await robot.plan(actions, tcp="Flange")
+    start = time.monotonic()
+
+    states = [state async for state in robot.stream_execute(trajectory, "Flange", actions)]
+
+    assert time.monotonic() - start < 5
+    assert clock.time() == pytest.approx(trajectory.times[-1])
+    assert clock.time() > 600
+    # the robot holds still at the end of the first motion while waiting
+    waiting = [state for state in states if state.path_parameter == 1]
+    assert len(waiting) > 1
+    assert {state.state.joints for state in waiting} == {(1, 0, 0, 0, 0, 0)}
+
+
+async def test_cell_shares_the_clock_with_all_devices():
+    clock = VirtualClock()
+    cell = get_simulated_robot_cell(clock=clock)
+    robot = cell["controller"]["0"]
+    trajectory = await robot.plan([jnt((1, 0, 0, 0, 0, 0))], tcp="Flange")
+
+    await asyncio.gather(
+        robot.execute(trajectory, "Flange", [jnt((1, 0, 0, 0, 0, 0))]), cell["timer"](120_000)
+    )
+
+    assert cell.clock is clock
+    assert clock.time() == 120
+
+
+async def test_timer_without_clock_returns_immediately():
+    start = time.monotonic()
+
+    await SimulatedTimer()(60_000)
+
+    assert time.monotonic() - start < 1
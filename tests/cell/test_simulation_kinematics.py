@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from nova.actions import cartesian_ptp, jnt, wait
+from nova.cell.simulation import SimulatedRobot, get_ur5e_motion_group_description
+from nova.types import Pose
+from nova.types.trajectory import TrajectoryArray
+from nova.utils.kinematics import DHKinematics
+
+
+def _robot() -> SimulatedRobot:
+    return SimulatedRobot(
+        SimulatedRobot.Configuration(
+            motion_group_description=get_ur5e_motion_group_description(),
+            tools={"Flange": Pose((0, 0, 0, 0, 0, 0)), "Gripper": Pose((0, 0, 100, 0, 0, 0))},
+        )
+    )
+
+
+async def test_motions_are_timed_by_the_joint_limits():
+    robot = _robot()
+    # the UR5e moves at most pi rad/s and accelerates at most 2 pi rad/s^2
+    trajectory = TrajectoryArray.from_api_model(
+        await robot.plan(
+            [jnt((np.pi, 0, 0, 0, 0, 0)), wait(1), jnt((np.pi, 0.1, 0, 0, 0, 0))], "Flange"
+        )
+    )
+
+    velocities = np.diff(trajectory.joints, axis=0) / np.diff(trajectory.times)[:, None]
+    assert trajectory.time_at_location(1) == pytest.approx(1.5)
+    assert trajectory.duration - trajectory.time_at_location(1) == pytest.approx(
+        1 + 2 * np.sqrt(0.1 / (2 * np.pi))
+    )
+    assert np.all(np.abs(velocities) <= np.pi + 1e-9)
+    assert trajectory.locations[-1] == 2
+    np.testing.assert_allclose(trajectory.joints[-1], (np.pi, 0.1, 0, 0, 0, 0))
+
+
+async def test_cartesian_targets_are_reached():
+    robot = _robot()
+    kinematics = DHKinematics.from_motion_group_description(get_ur5e_motion_group_description())
+    joints = np.array([0.3, -1.2, 1.1, -0.4, 0.5, 0.2])
+    target = Pose(tuple(kinematics.tcp_poses(joints, Pose((0, 0, 100, 0, 0, 0)))[0]))
+    trajectory = await robot.plan(
+        [cartesian_ptp(target)], "Gripper", start_joint_position=tuple(joints + 0.1)
+    )
+
+    states = [state async for state in robot.stream_execute(trajectory, "Gripper", [])]
+
+    np.testing.assert_allclose(np.asarray(states[-1].state.pose), np.asarray(target), atol=1e-4)
+    assert states[0].state.joints == pytest.approx(tuple(joints + 0.1))
+
+
+async def test_targets_beyond_the_position_limits_are_rejected():
+    with pytest.raises(ValueError):
+        await _robot().plan([jnt((7, 0, 0, 0, 0, 0))], "Flange")
+
+
+def test_description_needs_velocity_and_acceleration_limits():
+    description = get_ur5e_motion_group_description()
+    description.operation_limits.auto_limits.joints[0].velocity = None
+
+    with pytest.raises(ValueError):
+        SimulatedRobot(SimulatedRobot.Configuration(motion_group_description=description))
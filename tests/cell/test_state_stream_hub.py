@@ -0,0 +1,243 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nova.cell.motion_group import MotionGroup
+from nova.cell.state_stream_hub import StateStreamHub, motion_group_state_hub
+from nova.core.gateway import ApiGateway
+
+
+class _Upstream:
+    """An upstream stream fed by the test, counting how often it is opened and closed."""
+
+    def __init__(self):
+        self.opened = 0
+        self.closed = 0
+        self.intervals: list[float | None] = []
+        self.items: asyncio.Queue = asyncio.Queue()
+
+    async def stream(self, interval: float | None):
+        self.opened += 1
+        self.intervals.append(interval)
+        try:
+            while True:
+                item = await self.items.get()
+                if isinstance(item, BaseException):
+                    raise item
+                if item is None:
+                    return
+                yield item
+        finally:
+            self.closed += 1
+
+
+async def _collect(stream, count: int) -> list:
+    items = []
+    async for item in stream:
+        items.append(item)
+        if len(items) == count:
+            break
+    return items
+
+
+async def _wait_for_subscribers(hub: StateStreamHub, count: int):
+    while hub.subscriber_count < count:
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_fans_out_one_upstream_to_all_consumers():
+    upstream = _Upstream()
+    hub = StateStreamHub()
+
+    first = asyncio.create_task(_collect(hub.subscribe(upstream.stream), 3))
+    second = asyncio.create_task(_collect(hub.subscribe(upstream.stream), 3))
+    await _wait_for_subscribers(hub, 2)
+    for i in range(3):
+        upstream.items.put_nowait(i)
+
+    assert await first == [0, 1, 2]
+    assert await second == [0, 1, 2]
+    assert upstream.opened == 1
+
+
+@pytest.mark.asyncio
+async def test_closes_upstream_when_last_consumer_leaves():
+    upstream = _Upstream()
+    hub = StateStreamHub()
+
+    first = asyncio.create_task(_collect(hub.subscribe(upstream.stream), 1))
+    second = asyncio.create_task(_collect(hub.subscribe(upstream.stream), 2))
+    await _wait_for_subscribers(hub, 2)
+    upstream.items.put_nowait("a")
+    await first
+    assert hub.is_streaming
+
+    upstream.items.put_nowait("b")
+    await second
+    # let the cancelled upstream task close its stream
+    await asyncio.sleep(0.01)
+
+    assert not hub.is_streaming
+    assert upstream.closed == 1
+
+    # a new consumer opens a new upstream
+    third = asyncio.create_task(_collect(hub.subscribe(upstream.stream), 1))
+    await _wait_for_subscribers(hub, 1)
+    upstream.items.put_nowait("c")
+    assert await third == ["c"]
+    assert upstream.opened == 2
+
+
+@pytest.mark.asyncio
+async def test_downsamples_per_consumer():
+    now = [0.0]
+    upstream = _Upstream()
+    hub = StateStreamHub(clock=lambda: now[0])
+
+    full = asyncio.create_task(_collect(hub.subscribe(upstream.stream), 6))
+    slow = asyncio.create_task(_collect(hub.subscribe(upstream.stream, min_interval=0.1), 2))
+    await _wait_for_subscribers(hub, 2)
+    for i in range(6):
+        now[0] = i * 0.04
+        upstream.items.put_nowait(i)
+        await asyncio.sleep(0)
+
+    assert await full == [0, 1, 2, 3, 4, 5]
+    # delivered at 0.0 and 0.12
+    assert await slow == [0, 3]
+
+
+@pytest.mark.asyncio
+async def test_reopens_upstream_for_faster_consumers():
+    now = [0.0]
+    upstream = _Upstream()
+    hub = StateStreamHub(clock=lambda: now[0])
+
+    slow = asyncio.create_task(_collect(hub.subscribe(upstream.stream, min_interval=0.5), 2))
+    await _wait_for_subscribers(hub, 1)
+    upstream.items.put_nowait("a")
+    await asyncio.sleep(0.01)
+    assert hub.upstream_interval == 0.5
+
+    fast = asyncio.create_task(_collect(hub.subscribe(upstream.stream, min_interval=0.1), 1))
+    await _wait_for_subscribers(hub, 2)
+    slower = asyncio.create_task(_collect(hub.subscribe(upstream.stream, min_interval=1.0), 1))
+    await _wait_for_subscribers(hub, 3)
+    await asyncio.sleep(0.01)
+    assert upstream.intervals == [0.5, 0.1]
+
+    full = asyncio.create_task(_collect(hub.subscribe(upstream.stream), 1))
+    await _wait_for_subscribers(hub, 4)
+    await asyncio.sleep(0.01)
+    assert upstream.intervals == [0.5, 0.1, None]
+    assert upstream.closed == 2
+
+    # the consumers of the closed upstreams keep receiving states
+    now[0] = 10.0
+    upstream.items.put_nowait("b")
+    assert await slow == ["a", "b"]
+    assert await fast == ["b"]
+    assert await slower == ["b"]
+    assert await full == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_upstream_errors_reach_all_consumers():
+    upstream = _Upstream()
+    hub = StateStreamHub()
+
+    consumers = [
+        asyncio.create_task(_collect(hub.subscribe(upstream.stream), 10)) for _ in range(2)
+    ]
+    await _wait_for_subscribers(hub, 2)
+    upstream.items.put_nowait(RuntimeError("connection lost"))
+
+    for consumer in consumers:
+        with pytest.raises(RuntimeError, match="connection lost"):
+            await consumer
+    assert hub.subscriber_count == 0
+    assert not hub.is_streaming
+
+
+@pytest.mark.asyncio
+async def test_ends_consumers_when_upstream_ends():
+    upstream = _Upstream()
+    hub = StateStreamHub()
+
+    consumer = asyncio.create_task(_collect(hub.subscribe(upstream.stream), 10))
+    await _wait_for_subscribers(hub, 1)
+    upstream.items.put_nowait(1)
+    upstream.items.put_nowait(None)
+
+    assert await consumer == [1]
+
+
+@pytest.mark.asyncio
+async def test_slow_consumers_drop_the_oldest_states():
+    upstream = _Upstream()
+    hub = StateStreamHub(max_pending=2)
+
+    stream = hub.subscribe(upstream.stream)
+    consumer = asyncio.create_task(stream.__anext__())
+    await _wait_for_subscribers(hub, 1)
+    upstream.items.put_nowait(0)
+    assert await consumer == 0
+
+    for i in range(1, 5):
+        upstream.items.put_nowait(i)
+    while not upstream.items.empty():
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert [await stream.__anext__(), await stream.__anext__()] == [3, 4]
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_motion_groups_share_the_state_stream():
+    api_client = MagicMock(spec=ApiGateway)
+    api_client.motion_group_api = MagicMock()
+    api_client.motion_group_api.get_motion_group_description = AsyncMock()
+    upstream = _Upstream()
+    api_client.motion_group_api.stream_motion_group_state = MagicMock(
+        side_effect=lambda **kwargs: upstream.stream(kwargs.get("response_rate"))
+    )
+    first_group = MotionGroup(api_client, "cell", "controller", "0@controller")
+    second_group = MotionGroup(api_client, "cell", "controller", "0@controller")
+    hub = motion_group_state_hub(api_client, "cell", "controller", "0@controller")
+
+    first = asyncio.create_task(_collect(first_group.stream_state(), 2))
+    second = asyncio.create_task(_collect(second_group.stream_state(), 2))
+    await _wait_for_subscribers(hub, 2)
+    upstream.items.put_nowait("state-1")
+    upstream.items.put_nowait("state-2")
+
+    assert await first == ["state-1", "state-2"]
+    assert await second == ["state-1", "state-2"]
+    api_client.motion_group_api.stream_motion_group_state.assert_called_once_with(
+        cell="cell", controller="controller", motion_group="0@controller"
+    )
+    assert motion_group_state_hub(api_client, "cell", "controller", "1@controller") is not hub
+
+
+@pytest.mark.asyncio
+async def test_motion_group_opens_the_state_stream_at_the_requested_rate():
+    api_client = MagicMock(spec=ApiGateway)
+    api_client.motion_group_api = MagicMock()
+    upstream = _Upstream()
+    api_client.motion_group_api.stream_motion_group_state = MagicMock(
+        side_effect=lambda **kwargs: upstream.stream(kwargs.get("response_rate"))
+    )
+    motion_group = MotionGroup(api_client, "cell", "controller", "1@controller")
+    hub = motion_group_state_hub(api_client, "cell", "controller", "1@controller")
+
+    consumer = asyncio.create_task(_collect(motion_group.stream_state(50), 1))
+    await _wait_for_subscribers(hub, 1)
+    upstream.items.put_nowait("state")
+
+    assert await consumer == ["state"]
+    api_client.motion_group_api.stream_motion_group_state.assert_called_once_with(
+        cell="cell", controller="controller", motion_group="1@controller", response_rate=50
+    )
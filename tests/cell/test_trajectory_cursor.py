@@ -398,3 +398,44 @@ async def test_cursor_accepts_mixed_motion_and_non_motion_actions():
         cursor._initialize_task.cancel()
         with contextlib.suppress(asyncio.CancelledError):
             await cursor._initialize_task
+
+
+async def test_cursor_looks_up_time_location_and_joints():
+    from nova import api
+
+    trajectory = api.models.JointTrajectory(
+        joint_positions=[api.models.Joints([float(i)] * 6) for i in range(4)],
+        times=[0.0, 1.0, 3.0, 4.0],
+        locations=[api.models.Location(root=location) for location in (0.0, 1.0, 1.0, 2.0)],
+    )
+    cursor = TrajectoryCursor(
+        motion_id="traj-index",
+        motion_group_state_stream=_silent_state_stream(),
+        joint_trajectory=trajectory,
+        initial_location=1.5,
+    )
+    try:
+        # location 1.0 is held from 1s to 3s and reached at 1s
+        assert cursor.time_at_location(1.0) == 1.0
+        assert cursor.time_at_location(1.5) == 3.5
+        assert cursor.location_at_time(2.0) == 1.0
+        assert cursor.location_at_time(10.0) == 2.0
+        assert cursor.sample_index_at_location(1.0) == 2
+        assert cursor.joints_at_location(0.5) == (0.5,) * 6
+        assert cursor.current_time == 3.5
+        assert cursor.time_remaining == 0.5
+
+        cursor.forward_to = MagicMock()
+        cursor.backward_to = MagicMock()
+        cursor.seek_time(3.75)
+        cursor.forward_to.assert_called_once()
+        assert cursor.forward_to.call_args.args == (1.75,)
+        cursor.seek_time(0.5)
+        assert cursor.backward_to.call_args.args == (0.5,)
+
+        result = await cursor.seek_time(3.5)
+        assert result.final_location == 1.5
+    finally:
+        cursor._initialize_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await cursor._initialize_task
@@ -0,0 +1,137 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nova import api
+from nova.cell.motion_group import MotionGroup
+from nova.cell.trajectory_id_cache import (
+    TrajectoryIdCache,
+    controller_trajectory_id_cache,
+    trajectory_id_cache_key,
+)
+from nova.core.gateway import ApiGateway
+from nova.exceptions import LoadPlanFailed
+
+
+def _trajectory(end: float) -> api.models.JointTrajectory:
+    return api.models.JointTrajectory(
+        joint_positions=[api.models.Joints([0.0, 0.0]), api.models.Joints([end, end])],
+        times=[0.0, 1.0],
+        locations=[api.models.Location(0.0), api.models.Location(1.0)],
+    )
+
+
+@pytest.fixture
+def api_client():
+    """An API client whose controller keeps uploaded trajectories in ``uploaded``."""
+    client = MagicMock(spec=ApiGateway)
+    client.uploaded = []
+
+    async def add_trajectory(cell, controller, add_trajectory_request):
+        trajectory_id = f"trajectory-{len(client.uploaded)}"
+        client.uploaded.append(trajectory_id)
+        return api.models.AddTrajectoryResponse(trajectory=trajectory_id)
+
+    async def list_trajectories(cell, controller):
+        return api.models.ListTrajectoriesResponse(trajectories=list(client.uploaded))
+
+    client.trajectory_caching_api = MagicMock()
+    client.trajectory_caching_api.add_trajectory = AsyncMock(side_effect=add_trajectory)
+    client.trajectory_caching_api.list_trajectories = AsyncMock(side_effect=list_trajectories)
+    return client
+
+
+def _motion_group(api_client, **kwargs) -> MotionGroup:
+    return MotionGroup(api_client, "cell", "controller", "0@controller", **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_reuses_uploaded_trajectory_across_motion_groups(api_client):
+    first = await _motion_group(api_client)._load_planned_motion(_trajectory(1.0), "flange")
+    second = await _motion_group(api_client)._load_planned_motion(_trajectory(1.0), "flange")
+
+    assert first == second == "trajectory-0"
+    assert api_client.trajectory_caching_api.add_trajectory.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_uploads_different_trajectory_or_tcp(api_client):
+    motion_group = _motion_group(api_client)
+
+    ids = [
+        await motion_group._load_planned_motion(_trajectory(1.0), "flange"),
+        await motion_group._load_planned_motion(_trajectory(2.0), "flange"),
+        await motion_group._load_planned_motion(_trajectory(1.0), "gripper"),
+    ]
+
+    assert ids == ["trajectory-0", "trajectory-1", "trajectory-2"]
+
+
+@pytest.mark.asyncio
+async def test_uploads_again_if_controller_dropped_trajectory(api_client):
+    motion_group = _motion_group(api_client)
+    await motion_group._load_planned_motion(_trajectory(1.0), "flange")
+    api_client.uploaded.clear()
+
+    assert await motion_group._load_planned_motion(_trajectory(1.0), "flange") == "trajectory-0"
+    assert api_client.trajectory_caching_api.add_trajectory.await_count == 2
+    assert await motion_group._load_planned_motion(_trajectory(1.0), "flange") == "trajectory-0"
+    assert api_client.trajectory_caching_api.add_trajectory.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_uploads_every_time_if_disabled(api_client):
+    motion_group = _motion_group(api_client, trajectory_id_cache_size=0)
+
+    await motion_group._load_planned_motion(_trajectory(1.0), "flange")
+    await motion_group._load_planned_motion(_trajectory(1.0), "flange")
+
+    assert api_client.trajectory_caching_api.add_trajectory.await_count == 2
+    api_client.trajectory_caching_api.list_trajectories.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_upload_is_not_cached(api_client):
+    api_client.trajectory_caching_api.add_trajectory = AsyncMock(
+        return_value=api.models.AddTrajectoryResponse(
+            error=api.models.AddTrajectoryError(message="invalid")
+        )
+    )
+    motion_group = _motion_group(api_client)
+
+    for _ in range(2):
+        with pytest.raises(LoadPlanFailed):
+            await motion_group._load_planned_motion(_trajectory(1.0), "flange")
+    api_client.trajectory_caching_api.list_trajectories.assert_not_awaited()
+
+
+def test_evicts_least_recently_used():
+    cache = TrajectoryIdCache(max_entries=2)
+    cache.put("a", "trajectory-a")
+    cache.put("b", "trajectory-b")
+    assert cache.get("a") == "trajectory-a"
+
+    cache.put("c", "trajectory-c")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "trajectory-a"
+    assert cache.get("c") == "trajectory-c"
+    assert len(cache) == 2
+
+
+def test_shared_cache_grows_to_largest_requested_size():
+    api_client = MagicMock()
+    cache = controller_trajectory_id_cache(api_client, "cell", "controller", max_entries=2)
+
+    assert controller_trajectory_id_cache(api_client, "cell", "controller", 8) is cache
+    assert cache.max_entries == 8
+    assert controller_trajectory_id_cache(api_client, "cell", "controller", 4) is cache
+    assert cache.max_entries == 8
+
+
+def test_key_depends_on_motion_group():
+    trajectory = _trajectory(1.0)
+
+    assert trajectory_id_cache_key("0@controller", trajectory, None) != trajectory_id_cache_key(
+        "1@controller", trajectory, None
+    )
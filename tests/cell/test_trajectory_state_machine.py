@@ -566,3 +566,33 @@ class TestStateUpdateResult:
         state = _make_motion_group_state(standstill=False)
         result = machine.process_motion_state(state)
         assert result.skip
+
+
+class TestCounters:
+    def test_counts_processed_and_skipped_states(self):
+        machine = TrajectoryExecutionMachine()
+        machine.send("start")
+
+        running = [
+            _make_motion_group_state(
+                standstill=False,
+                execute=_make_execute(
+                    api.models.TrajectoryRunning(time_to_end=1000), location=location
+                ),
+            )
+            for location in (0.5, 1.0, 1.5)
+        ]
+        for state in running:
+            machine.process_motion_state(state)
+        machine.process_motion_state(_make_motion_group_state(standstill=False))
+        result = machine.process_motion_state(
+            _make_motion_group_state(
+                standstill=True, execute=_make_execute(api.models.TrajectoryEnded(), location=2.0)
+            )
+        )
+
+        assert machine.location == 2.0
+        assert result.state_changed
+        assert machine.is_ended
+        assert machine.states_processed == 5
+        assert machine.states_skipped == 4
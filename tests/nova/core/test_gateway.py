@@ -0,0 +1,168 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from nova.config import NovaConfig
+from nova.core.gateway import ApiGateway
+from nova.core.metrics import api_metrics
+from nova.core.nova import Nova
+
+
+class _SlowCall:
+    """Stands in for a generated API method, counts calls and blocks until released."""
+
+    def __init__(self, result="description"):
+        self.calls = 0
+        self.result = result
+        self.release = asyncio.Event()
+
+    async def call(self, *args, **kwargs):
+        self.calls += 1
+        await self.release.wait()
+        if isinstance(self.result, BaseException):
+            raise self.result
+        return self.result
+
+
+def _gateway(coalesce: bool) -> ApiGateway:
+    return ApiGateway(NovaConfig(host="http://localhost", coalesce_read_requests=coalesce))
+
+
+async def _start(gateway: ApiGateway, count: int, **kwargs) -> list[asyncio.Task]:
+    tasks = [
+        asyncio.create_task(
+            gateway.motion_group_api.get_motion_group_description(
+                cell="cell", controller="controller", **kwargs
+            )
+        )
+        for _ in range(count)
+    ]
+    await asyncio.sleep(0)
+    return tasks
+
+
+@pytest.mark.asyncio
+async def test_merges_identical_concurrent_reads():
+    gateway = _gateway(coalesce=True)
+    slow_call = _SlowCall()
+    gateway.motion_group_api._instance.get_motion_group_description = slow_call.call
+
+    tasks = await _start(gateway, 3, motion_group="0@controller")
+    other = await _start(gateway, 1, motion_group="1@controller")
+    slow_call.release.set()
+
+    assert await asyncio.gather(*tasks, *other) == ["description"] * 4
+    assert slow_call.calls == 2
+    assert gateway._single_flight.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_and_cancellation_of_merged_reads():
+    gateway = _gateway(coalesce=True)
+    slow_call = _SlowCall(result=RuntimeError("unavailable"))
+    gateway.motion_group_api._instance.get_motion_group_description = slow_call.call
+
+    first, second = await _start(gateway, 2, motion_group="0@controller")
+    first.cancel()
+    slow_call.release.set()
+
+    # cancelling one caller doesn't cancel the request of the other
+    with pytest.raises(RuntimeError, match="unavailable"):
+        await second
+    assert first.cancelled()
+    assert slow_call.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_reads_are_not_merged_by_default():
+    gateway = _gateway(coalesce=False)
+    slow_call = _SlowCall()
+    gateway.motion_group_api._instance.get_motion_group_description = slow_call.call
+
+    tasks = await _start(gateway, 2, motion_group="0@controller")
+    slow_call.release.set()
+    await asyncio.gather(*tasks)
+
+    assert slow_call.calls == 2
+
+
+@pytest.fixture
+def metrics():
+    api_metrics.reset()
+    yield api_metrics
+    api_metrics.reset()
+
+
+@pytest.mark.asyncio
+async def test_records_metrics_per_endpoint(metrics):
+    gateway = ApiGateway(NovaConfig(host="http://localhost", api_metrics=True))
+    slow_call = _SlowCall()
+    gateway.motion_group_api._instance.get_motion_group_description = slow_call.call
+    endpoint = "MotionGroupApi.get_motion_group_description"
+
+    tasks = await _start(gateway, 2, motion_group="0@controller")
+    assert Nova().metrics().endpoints[endpoint].in_flight == 2
+    slow_call.release.set()
+    await asyncio.gather(*tasks)
+    slow_call.result = RuntimeError("unavailable")
+    with pytest.raises(RuntimeError):
+        await gateway.motion_group_api.get_motion_group_description(
+            cell="cell", controller="controller", motion_group="0@controller"
+        )
+
+    snapshot = Nova().metrics().endpoints[endpoint]
+    assert (snapshot.calls, snapshot.errors, snapshot.in_flight) == (3, 1, 0)
+    assert sum(snapshot.buckets) == 3
+    assert snapshot.max_seconds >= snapshot.mean_seconds > 0
+
+
+@pytest.mark.asyncio
+async def test_metrics_are_disabled_by_default(metrics):
+    gateway = _gateway(coalesce=False)
+    slow_call = _SlowCall()
+    slow_call.release.set()
+    gateway.motion_group_api._instance.get_motion_group_description = slow_call.call
+
+    await gateway.motion_group_api.get_motion_group_description(
+        cell="cell", controller="controller", motion_group="0@controller"
+    )
+
+    assert gateway._call_observer is None
+    assert metrics.snapshot().endpoints == {}
+
+
+@pytest.mark.asyncio
+async def test_traces_calls_in_spans(monkeypatch):
+    tracer = MagicMock()
+    monkeypatch.setattr("nova.core.metrics._opentelemetry_tracer", lambda: tracer)
+    gateway = ApiGateway(NovaConfig(host="http://localhost", api_tracing=True))
+    slow_call = _SlowCall()
+    slow_call.release.set()
+    gateway.motion_group_api._instance.get_motion_group_description = slow_call.call
+
+    await gateway.motion_group_api.get_motion_group_description(
+        cell="cell", controller="controller", motion_group="0@controller"
+    )
+
+    tracer.start_span.assert_called_once_with(
+        "nova.api.MotionGroupApi.get_motion_group_description"
+    )
+    tracer.start_span.return_value.end.assert_called_once()
+
+
+def test_apis_are_created_on_first_access():
+    gateway = _gateway(coalesce=False)
+    assert "motion_group_api" not in vars(gateway)
+
+    motion_group_api = gateway.motion_group_api
+
+    assert gateway.motion_group_api is motion_group_api
+    assert type(motion_group_api._instance).__name__ == "MotionGroupApi"
+    assert gateway.virtual_robot_setup_api is gateway.virtual_controller_api
+    assert set(vars(gateway)) >= {"motion_group_api", "virtual_controller_api"}
+    assert "cell_api" not in vars(gateway)
+
+    gateway._init_api_client()
+    assert gateway.motion_group_api is not motion_group_api
+    assert gateway.motion_group_api._instance.api_client is gateway._api_client
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from nova import api
+from nova.config import ApiRecordingConfig, NovaConfig
+from nova.core import recording
+from nova.core.gateway import ApiGateway
+from nova.core.recording import ApiRecording
+from nova.exceptions import ApiRecordingMissing
+
+
+class _FakeApi:
+    """Stands in for a generated API class with a unary, a streaming and a websocket method."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_value(self, cell: str, name: str):
+        self.calls += 1
+        if name == "missing":
+            raise api.ApiException(status=404, reason="Not Found")
+        return {"cell": cell, "name": name}
+
+    def stream_values(self, cell: str):
+        async def values():
+            for value in range(3):
+                yield value
+
+        return values()
+
+    async def execute(self, cell: str, client_request_generator):
+        acks: asyncio.Queue = asyncio.Queue()
+
+        async def responses():
+            while True:
+                yield await acks.get()
+
+        async for request in client_request_generator(responses()):
+            await acks.put(f"ack {request}")
+
+
+def _client(received: list):
+    async def requests(responses):
+        responses = responses.__aiter__()
+        for request in (1, 2):
+            yield request
+            received.append(await responses.__anext__())
+
+    return requests
+
+
+@pytest.fixture(autouse=True)
+def clear_recordings():
+    recording._recordings.clear()
+    yield
+    recording._recordings.clear()
+
+
+def _config(tmp_path, mode) -> ApiRecordingConfig:
+    return ApiRecordingConfig(path=tmp_path / "calls.jsonl", mode=mode, time_scale=0)
+
+
+async def _run(fake_api) -> tuple:
+    value = await fake_api.get_value("cell", name="a")
+    with pytest.raises(api.ApiException) as error:
+        await fake_api.get_value("cell", name="missing")
+    streamed = [item async for item in fake_api.stream_values("cell")]
+    received: list = []
+    await fake_api.execute("cell", client_request_generator=_client(received))
+    return value, error.value.status, streamed, received
+
+
+@pytest.mark.asyncio
+async def test_replays_recorded_calls(tmp_path):
+    live_api = _FakeApi()
+    live = await _run(ApiRecording(_config(tmp_path, "record")).wrap(live_api))
+
+    replay_api = _FakeApi()
+    replayed = await _run(ApiRecording(_config(tmp_path, "replay")).wrap(replay_api))
+
+    assert live == ({"cell": "cell", "name": "a"}, 404, [0, 1, 2], ["ack 1", "ack 2"])
+    assert replayed == live
+    assert replay_api.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_unknown_calls_are_reported(tmp_path):
+    await ApiRecording(_config(tmp_path, "record")).wrap(_FakeApi()).get_value("cell", "a")
+    replay = ApiRecording(_config(tmp_path, "replay")).wrap(_FakeApi())
+
+    assert await replay.get_value("cell", "a") == await replay.get_value("cell", "a")
+    with pytest.raises(ApiRecordingMissing, match="_FakeApi.get_value"):
+        await replay.get_value("cell", "b")
+
+
+@pytest.mark.asyncio
+async def test_gateway_replays_models(tmp_path):
+    pose = api.models.Pose(position=[1, 2, 3], orientation=[0, 0, 1])
+
+    async def get_motion_group_description(cell, controller, motion_group, **kwargs):
+        return pose
+
+    gateway = ApiGateway(NovaConfig(host="http://localhost", recording=_config(tmp_path, "record")))
+    gateway.motion_group_api._instance._instance.get_motion_group_description = (
+        get_motion_group_description
+    )
+    await gateway.motion_group_api.get_motion_group_description(
+        cell="cell", controller="controller", motion_group="0@controller"
+    )
+
+    replay_gateway = ApiGateway(NovaConfig(host="", recording=_config(tmp_path, "replay")))
+    replayed = await replay_gateway.motion_group_api.get_motion_group_description(
+        cell="cell", controller="controller", motion_group="0@controller"
+    )
+
+    assert replayed == pose
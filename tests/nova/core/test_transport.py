@@ -0,0 +1,77 @@
+import pytest
+from aiohttp import web
+
+from nova import api
+from nova.config import HttpTransportConfig, NovaConfig
+from nova.core.gateway import ApiGateway
+from nova.core.transport import SharedRESTClient
+
+
+@pytest.fixture
+async def server_url():
+    async def handle(request: web.Request) -> web.Response:
+        return web.json_response({"path": request.path})
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # ty: ignore[possibly-missing-attribute]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+def _rest_client(gateway: ApiGateway) -> SharedRESTClient:
+    rest_client = gateway._api_client.rest_client
+    assert isinstance(rest_client, SharedRESTClient)
+    return rest_client
+
+
+async def _get(gateway: ApiGateway, path: str) -> bytes:
+    response = await _rest_client(gateway).request(
+        "GET", f"{gateway._api_client.configuration.host}{path}"
+    )
+    return await response.read()
+
+
+@pytest.mark.asyncio
+async def test_gateways_share_one_connection_pool(server_url):
+    first = ApiGateway(NovaConfig(host=server_url))
+    second = ApiGateway(NovaConfig(host=server_url))
+
+    assert await _get(first, "/a") == b'{"path": "/api/v2/a"}'
+    assert await _get(second, "/b") == b'{"path": "/api/v2/b"}'
+    session = _rest_client(first)._rest_client.pool_manager
+    assert session is not None
+    assert _rest_client(second)._rest_client.pool_manager is session
+
+    await first.close()
+    assert not session.closed
+    await second.close()
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_transport_settings_are_applied(server_url):
+    transport = HttpTransportConfig(pool_size=3, keepalive_timeout=5.0, dns_cache_ttl=0)
+    gateway = ApiGateway(NovaConfig(host=server_url, transport=transport))
+    default_gateway = ApiGateway(NovaConfig(host=server_url))
+
+    await _get(gateway, "/")
+    await _get(default_gateway, "/")
+    session = _rest_client(gateway)._rest_client.pool_manager
+
+    assert session is not _rest_client(default_gateway)._rest_client.pool_manager
+    assert session.connector.limit == 3
+    assert session.connector.use_dns_cache is False
+    await gateway.close()
+    await default_gateway.close()
+
+
+def test_gateway_can_be_created_without_running_loop():
+    gateway = ApiGateway(NovaConfig(host="http://localhost"))
+
+    assert isinstance(gateway._api_client.rest_client, SharedRESTClient)
+    assert isinstance(gateway._api_client.configuration, api.Configuration)
@@ -0,0 +1,30 @@
+from nova.helper_scripts.benchmark_simulated_cell import build_cell, run_benchmark
+
+
+def test_build_cell_has_robots_and_io_devices():
+    cell = build_cell(3, 2)
+
+    assert len(cell.get_motion_groups()) == 3
+    assert [controller.id for controller in cell.get_controllers()] == ["controller", "io0", "io1"]
+
+
+async def test_python_benchmark_reports_measurements():
+    result = await run_benchmark(num_robots=2, num_ios=2, cycles=1)
+
+    # 2 robots x 2 motions x 10 samples
+    assert result.states == 40
+    assert result.io_operations == 12
+    assert result.simulated_seconds >= 1.9
+    assert result.states_per_second > 0
+    assert result.loop_lag_max_seconds >= result.loop_lag_mean_seconds >= 0
+    assert result.memory_peak_bytes is not None and result.memory_peak_bytes > 0
+    assert "robots=2" in result.summary()
+
+
+async def test_benchmark_with_kinematics_without_memory_tracing():
+    result = await run_benchmark(
+        num_robots=1, num_ios=0, cycles=1, kinematics=True, trace_memory=False
+    )
+
+    assert result.states > 0
+    assert result.memory_peak_bytes is None
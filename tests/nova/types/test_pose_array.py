@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from nova import api
+from nova.types import Pose, PoseArray
+
+POSES = [
+    Pose((1, 2, 3, 0.1, 0.2, 0.3)),
+    Pose((-4, 5, 0, 0, 0, np.pi / 2)),
+    Pose((0, 0, 7, 1.0, -0.5, 0.25)),
+]
+
+
+def _assert_poses_close(actual: list[Pose], expected: list[Pose]):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected, strict=True):
+        assert np.allclose(np.asarray(a), np.asarray(e), atol=1e-9)
+
+
+def test_pose_and_api_model_roundtrip():
+    poses = PoseArray.from_poses(POSES)
+
+    assert poses.positions.shape == (3, 3)
+    assert poses.to_poses() == POSES
+    assert poses[1] == POSES[1]
+    assert len(poses[1:]) == 2
+
+    api_poses = poses.to_api_models()
+    assert [pose.model_dump() for pose in api_poses] == [
+        pose.to_api_model().model_dump() for pose in POSES
+    ]
+    assert PoseArray.from_api_models(api_poses).to_poses() == POSES
+
+
+def test_empty():
+    poses = PoseArray.from_poses([])
+
+    assert len(poses) == 0
+    assert poses.to_api_models() == []
+    assert PoseArray.from_api_models(
+        [api.models.Pose(position=None, orientation=None)]
+    ).to_poses() == [Pose(None)]
+
+
+def test_rejects_mismatching_shapes():
+    with pytest.raises(ValueError):
+        PoseArray(positions=[[0, 0, 0]], orientations=[[0, 0, 0], [0, 0, 0]])
+    with pytest.raises(ValueError):
+        PoseArray(positions=[0, 0, 0], orientations=[0, 0, 0])
+
+
+def test_composition_and_inversion_match_pose():
+    poses = PoseArray.from_poses(POSES)
+    others = list(reversed(POSES))
+
+    _assert_poses_close(
+        (poses @ PoseArray.from_poses(others)).to_poses(),
+        [a @ b for a, b in zip(POSES, others, strict=True)],
+    )
+    _assert_poses_close((poses @ POSES[0]).to_poses(), [pose @ POSES[0] for pose in POSES])
+    _assert_poses_close((POSES[0] @ poses).to_poses(), [POSES[0] @ pose for pose in POSES])
+    _assert_poses_close((~poses).to_poses(), [~pose for pose in POSES])
+    assert np.allclose(poses.matrices, [pose.matrix for pose in POSES])
+    _assert_poses_close(PoseArray.from_matrices(poses.matrices).to_poses(), POSES)
+
+
+def test_euler_and_quaternion_conversion():
+    poses = PoseArray.from_poses(POSES)
+
+    euler = poses.as_euler("zyx", degrees=True)
+    from_euler = PoseArray.from_euler(poses.positions, euler, "zyx", degrees=True)
+    _assert_poses_close(from_euler.to_poses(), POSES)
+    _assert_poses_close(
+        [
+            Pose.from_euler(pose.position, angles, "zyx", degrees=True)
+            for pose, angles in zip(POSES, euler, strict=True)
+        ],
+        POSES,
+    )
+
+    quaternions = poses.as_quaternions()
+    assert np.allclose(quaternions, [pose.orientation_to_quaternion() for pose in POSES])
+    _assert_poses_close(PoseArray.from_quaternions(poses.positions, quaternions).to_poses(), POSES)
+
+
+def test_interpolate():
+    start = PoseArray.from_poses([Pose((0, 0, 0, 0, 0, 0))])
+    end = Pose((10, 0, 0, 0, 0, np.pi / 2))
+
+    path = start.interpolate(end, np.linspace(0, 1, 5))
+
+    assert len(path) == 5
+    assert np.allclose(path.positions[:, 0], [0, 2.5, 5, 7.5, 10])
+    assert np.allclose(path.orientations[:, 2], np.linspace(0, np.pi / 2, 5))
+    _assert_poses_close([path[0], path[-1]], [start[0], end])
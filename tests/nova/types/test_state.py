@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from nova import api
+from nova.actions import jnt
+from nova.cell.simulation import SimulatedRobot
+from nova.types import MotionState, MotionStateView, Pose, RobotState
+from nova.types.state import (
+    motion_group_state_to_motion_state,
+    motion_group_state_to_motion_state_view,
+)
+
+
+def _motion_group_state(location: float = 0.5, tcp: str | None = "flange"):
+    return api.models.MotionGroupState(
+        timestamp=datetime.now(timezone.utc),
+        sequence_number=1,
+        description_revision=0,
+        motion_group="0@controller",
+        controller="controller",
+        joint_position=api.models.Joints(root=[0.1, 0.2, 0.3, 0.4, 0.5, 0.6]),
+        joint_limit_reached=api.models.MotionGroupStateJointLimitReached(limit_reached=[False] * 6),
+        standstill=False,
+        tcp=tcp,
+        tcp_pose=api.models.Pose(
+            position=api.models.Vector3d([1, 2, 3]),
+            orientation=api.models.RotationVector([0, 0, 1]),
+        ),
+        execute=api.models.Execute(
+            joint_position=[0.1, 0.2, 0.3, 0.4, 0.5, 0.6],
+            details=api.models.TrajectoryDetails(
+                trajectory="trajectory",
+                location=api.models.Location(root=location),
+                state=api.models.TrajectoryRunning(time_to_end=1),
+            ),
+        ),
+    )
+
+
+def test_view_converts_lazily():
+    view = motion_group_state_to_motion_state_view(_motion_group_state())
+
+    assert view.motion_group_id == "0@controller"
+    assert view.path_parameter == 0.5
+    assert view.state.tcp == "flange"
+    assert view.state._pose is None
+
+    assert view.state.pose == Pose((1, 2, 3, 0, 0, 1))
+    assert view.state.pose is view.state.pose
+    assert view.state.joints == (0.1, 0.2, 0.3, 0.4, 0.5, 0.6)
+
+
+def test_view_matches_motion_state():
+    state = _motion_group_state()
+
+    assert motion_group_state_to_motion_state(state) == MotionState(
+        motion_group_id="0@controller",
+        path_parameter=0.5,
+        state=RobotState(
+            pose=Pose((1, 2, 3, 0, 0, 1)), tcp="flange", joints=(0.1, 0.2, 0.3, 0.4, 0.5, 0.6)
+        ),
+    )
+
+
+def test_view_rejects_states_without_tcp():
+    with pytest.raises(ValueError):
+        motion_group_state_to_motion_state_view(_motion_group_state(tcp=None))
+
+
+class _ApiStateRobot(SimulatedRobot):
+    async def _execute(self, joint_trajectory, tcp, actions, movement_controller, **kwargs):
+        for location in (0.0, 1.0):
+            yield MotionStateView(_motion_group_state(location))
+
+
+async def test_stream_execute_passes_raw_states_through():
+    robot = _ApiStateRobot()
+    trajectory = await robot.plan([jnt((0, 0, 0, 0, 0, 0))], tcp="flange")
+
+    states = [state async for state in robot.stream_execute(trajectory, "flange", [], raw=True)]
+    views = [state async for state in robot.stream_execute(trajectory, "flange", [])]
+
+    assert [type(state) for state in states] == [api.models.MotionGroupState] * 2
+    assert [view.path_parameter for view in views] == [0.0, 1.0]
+
+
+async def test_stream_execute_raw_requires_api_states():
+    robot = SimulatedRobot()
+    trajectory = await robot.plan([jnt((0, 0, 0, 0, 0, 0))], tcp="flange")
+
+    with pytest.raises(NotImplementedError):
+        async for _ in robot.stream_execute(trajectory, "flange", [], raw=True):
+            pass
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from nova import api
+from nova.types import TrajectoryArray
+from nova.types.trajectory import as_trajectory_array
+from nova.utils.joint_trajectory import combine_trajectories
+
+
+def _api_trajectory(joints, times, locations) -> api.models.JointTrajectory:
+    return api.models.JointTrajectory(
+        joint_positions=[api.models.Joints(list(j)) for j in joints],
+        times=list(times),
+        locations=[api.models.Location(location) for location in locations],
+    )
+
+
+def test_api_model_roundtrip():
+    trajectory = _api_trajectory([(0.0, 1.0), (0.5, 1.5), (1.0, 2.0)], [0.0, 0.1, 0.2], [0, 0.5, 1])
+
+    array = TrajectoryArray.from_api_model(trajectory)
+
+    assert array.joints.shape == (3, 2)
+    assert array.times.tolist() == [0.0, 0.1, 0.2]
+    assert array.locations.tolist() == [0.0, 0.5, 1.0]
+    assert array.end_joints == (1.0, 2.0)
+    assert array.duration == pytest.approx(0.2)
+    assert array.to_api_model().model_dump() == trajectory.model_dump()
+    assert as_trajectory_array(array) is array
+
+
+def test_empty_api_model():
+    array = TrajectoryArray.from_api_model(_api_trajectory([], [], []))
+
+    assert len(array) == 0
+    assert array.duration == 0.0
+    assert array.to_api_model().joint_positions == []
+
+
+def test_rejects_mismatching_shapes():
+    with pytest.raises(ValueError):
+        TrajectoryArray(times=[0.0, 1.0], locations=[0.0, 1.0], joints=[[0.0]])
+    with pytest.raises(ValueError):
+        TrajectoryArray(times=[0.0, 1.0], locations=[0.0], joints=[[0.0], [1.0]])
+
+
+def test_hold_ends_at_duration():
+    trajectory = TrajectoryArray.hold((0.1, 0.2, 0.3), duration=0.12)
+
+    assert trajectory.times.tolist() == [0.0, 0.05, 0.12]
+    assert trajectory.locations.tolist() == [0.0, 0.0, 0.0]
+    assert np.all(trajectory.joints == [0.1, 0.2, 0.3])
+
+
+def test_combine_trajectories_shifts_times_and_locations():
+    first = _api_trajectory([(0.0,), (1.0,)], [0.0, 1.0], [0.0, 1.0])
+    second = TrajectoryArray(
+        times=[0.0, 0.5, 1.0], locations=[0.0, 0.5, 1.0], joints=[[1], [2], [3]]
+    )
+    third = _api_trajectory([(3.0,), (4.0,)], [0.0, 2.0], [0.0, 1.0])
+
+    combined = combine_trajectories([first, second, third])
+
+    assert combined.times == [0.0, 1.0, 1.5, 2.0, 4.0]
+    assert [location.root for location in combined.locations] == [0.0, 1.0, 1.5, 2.0, 3.0]
+    assert [list(joints) for joints in combined.joint_positions] == [[0], [1], [2], [3], [4]]
+    # the inputs are left untouched
+    assert first.times == [0.0, 1.0]
+    assert len(second) == 3
+
+
+def test_take_selects_samples():
+    trajectory = TrajectoryArray(
+        times=[0.0, 0.1, 0.2, 0.3], locations=[0, 1, 2, 3], joints=[[0], [1], [2], [3]]
+    )
+
+    selected = trajectory.take([0, 2, 3])
+
+    assert selected.times.tolist() == [0.0, 0.2, 0.3]
+    assert selected.joints[:, 0].tolist() == [0.0, 2.0, 3.0]
@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+from nova import api
+from nova.types import Pose
+from nova.utils.kinematics import DHKinematics, matrices_to_poses, pose_to_matrix
+
+# UR5e, see https://www.universal-robots.com/articles/ur/application-installation/dh-parameters-for-calculations-of-kinematics-and-dynamics/
+UR5E_DH_PARAMETERS = [
+    api.models.DHParameter(a=0.0, d=162.5, alpha=np.pi / 2),
+    api.models.DHParameter(a=-425.0, d=0.0, alpha=0.0),
+    api.models.DHParameter(a=-392.2, d=0.0, alpha=0.0),
+    api.models.DHParameter(a=0.0, d=133.3, alpha=np.pi / 2),
+    api.models.DHParameter(a=0.0, d=99.7, alpha=-np.pi / 2),
+    api.models.DHParameter(a=0.0, d=99.6, alpha=0.0),
+]
+
+
+def _loop_flange_pose(dh_parameters, joints, mounting=None) -> np.ndarray:
+    """Reference implementation: one 4x4 matrix at a time."""
+    matrix = pose_to_matrix(mounting)
+    for parameter, joint in zip(dh_parameters, joints):
+        theta = (parameter.theta or 0.0) + joint * (
+            -1 if parameter.reverse_rotation_direction else 1
+        )
+        a, d, alpha = parameter.a or 0.0, parameter.d or 0.0, parameter.alpha or 0.0
+        matrix = matrix @ np.array(
+            [
+                [np.cos(theta), -np.sin(theta) * np.cos(alpha), np.sin(theta) * np.sin(alpha), a * np.cos(theta)],
+                [np.sin(theta), np.cos(theta) * np.cos(alpha), -np.cos(theta) * np.sin(alpha), a * np.sin(theta)],
+                [0, np.sin(alpha), np.cos(alpha), d],
+                [0, 0, 0, 1],
+            ]
+        )  # fmt: skip
+    return matrix
+
+
+def test_ur5e_home_position():
+    kinematics = DHKinematics(UR5E_DH_PARAMETERS)
+
+    pose = kinematics.flange_poses([0.0] * 6)[0]
+
+    np.testing.assert_allclose(pose[:3], [-817.2, -232.9, 62.8], atol=1e-9)
+
+
+def test_vectorized_matches_single_evaluation():
+    rng = np.random.default_rng(0)
+    joints = rng.uniform(-np.pi, np.pi, size=(50, 6))
+    mounting = Pose((100, -200, 300, 0.1, 0.2, 0.3))
+    kinematics = DHKinematics(UR5E_DH_PARAMETERS, mounting=mounting)
+
+    matrices = kinematics.flange_matrices(joints)
+
+    expected = np.stack(
+        [_loop_flange_pose(UR5E_DH_PARAMETERS, joint, mounting) for joint in joints]
+    )
+    np.testing.assert_allclose(matrices, expected, atol=1e-9)
+
+
+def test_offsets_and_tcp_are_applied():
+    dh_parameters = [api.models.DHParameter(a=100.0)]
+    kinematics = DHKinematics(
+        dh_parameters,
+        mounting=(0, 0, 1000, 0, 0, 0),
+        kinematic_chain_offset=(0, 0, 10, 0, 0, 0),
+        flange_offset=(0, 0, 0, 0, 0, np.pi / 2),
+    )
+
+    flange = kinematics.flange_poses([0.0])[0]
+    tcp = kinematics.tcp_poses([0.0], tcp_offset=Pose((10, 0, 0, 0, 0, 0)))[0]
+
+    np.testing.assert_allclose(flange, [100, 0, 1010, 0, 0, np.pi / 2], atol=1e-9)
+    np.testing.assert_allclose(tcp, [100, 10, 1010, 0, 0, np.pi / 2], atol=1e-9)
+
+
+def test_reverse_rotation_and_prismatic_joints():
+    kinematics = DHKinematics(
+        [
+            api.models.DHParameter(a=100.0, reverse_rotation_direction=True),
+            api.models.DHParameter(type=api.models.JointTypeEnum.PRISMATIC_JOINT),
+        ]
+    )
+
+    pose = kinematics.flange_poses([[np.pi / 2, 25.0]])[0]
+
+    np.testing.assert_allclose(pose, [0, -100, 25, 0, 0, -np.pi / 2], atol=1e-9)
+
+
+def test_link_matrices_shape_and_invalid_input():
+    kinematics = DHKinematics(UR5E_DH_PARAMETERS)
+
+    assert kinematics.link_matrices(np.zeros((4, 6))).shape == (4, 7, 4, 4)
+    with pytest.raises(ValueError):
+        kinematics.flange_matrices(np.zeros((4, 3)))
+
+
+def test_matrices_to_poses_roundtrip():
+    pose = Pose((1, 2, 3, 0.3, -0.2, 0.1))
+
+    np.testing.assert_allclose(
+        matrices_to_poses(pose_to_matrix(pose)[None])[0], pose.to_tuple(), atol=1e-12
+    )
+
+
+def test_inverse_kinematics_reaches_forward_kinematics():
+    rng = np.random.default_rng(1)
+    tcp_offset = Pose((0, 0, 150, 0, 0, 0))
+    kinematics = DHKinematics(UR5E_DH_PARAMETERS, mounting=Pose((0, 0, 500, 0, 0, 0)))
+    joints = rng.uniform(-2, 2, size=6)
+    target = kinematics.tcp_poses(joints, tcp_offset)[0]
+
+    solution = kinematics.inverse_kinematics(target, seed=joints + 0.1, tcp_offset=tcp_offset)
+
+    np.testing.assert_allclose(kinematics.tcp_poses(solution, tcp_offset)[0], target, atol=1e-5)
+
+
+def test_inverse_kinematics_raises_out_of_reach():
+    kinematics = DHKinematics(UR5E_DH_PARAMETERS)
+
+    with pytest.raises(ValueError):
+        kinematics.inverse_kinematics((5000, 0, 0, 0, 0, 0), seed=[0.0] * 6)
@@ -24,6 +24,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from nova import api
 from nova.viewers import Rerun, Viewer, ViewerManager, get_viewer_manager
 from nova.viewers.protocol import NovaRerunBridgeProtocol
 
@@ -858,6 +859,23 @@ class TestViewerUtilities:
         result = extract_collision_setups_from_actions([])
         assert result == {}
 
+    def test_extract_collision_scenes_deduplicates_shared_scenes(self):
+        """Actions sharing a collision scene should yield one entry."""
+        from nova.actions import lin
+        from nova.viewers.utils import extract_collision_setups_from_actions
+
+        scene = api.models.CollisionSetup(self_collision_detection=True)
+        other_scene = api.models.CollisionSetup(self_collision_detection=False)
+        actions = [
+            lin((0, 0, 0, 0, 0, 0), collision_setup=scene),
+            lin((1, 0, 0, 0, 0, 0), collision_setup=scene),
+            lin((2, 0, 0, 0, 0, 0), collision_setup=other_scene),
+        ]
+
+        result = extract_collision_setups_from_actions(actions)
+
+        assert list(result.values()) == [scene, other_scene]
+
     def test_global_viewer_manager_isolation(self):
         """Test that viewers are properly isolated between tests."""
         from nova.viewers.manager import _viewer_manager
@@ -50,8 +50,8 @@ def _(vec: Vector3d, key: int, val: float) -> Vector3d:
 @assoc.register
 def _(pose: Pose, key: int, val: float) -> Pose:
     tmp = list(pose.to_tuple())
-    tmp[key] = val
-    return Pose(tuple(tmp))
+    tmp[key] = float(val)
+    return Pose.from_trusted_tuple(tmp)
 
 
 # TODO: In the future we want to improve record manipulation. For example we could use frozen keyword like:
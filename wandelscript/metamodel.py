@@ -23,7 +23,7 @@ from nova.cell.robot_cell import (
     RobotCell,
     RobotMotionError,
 )
-from nova.cell.simulation import SimulatedRobotCell, UnknownPose
+from nova.cell.simulation import SimulatedRobotCell, UnknownPose, VirtualClock
 from nova.types import MotionSettings, Pose, Vector3d
 from wandelscript.exception import GenericRuntimeError, TextRange
 from wandelscript.operators import (
@@ -1717,7 +1717,7 @@ async def run_program(
     if isinstance(program, str):
         program = Program.from_code(program)
     if cell is None:
-        cell = SimulatedRobotCell()
+        cell = SimulatedRobotCell(clock=VirtualClock())
     stop_event = anyio.Event()
     context = ExecutionContext(
         cell,
@@ -1742,7 +1742,9 @@ def _run_program_debug(
 
 async def run_rule(rule: Rule, **kwargs):
     stop_event = anyio.Event()
-    context = ExecutionContext(robot_cell=SimulatedRobotCell(), stop_event=stop_event)
+    context = ExecutionContext(
+        robot_cell=SimulatedRobotCell(clock=VirtualClock()), stop_event=stop_event
+    )
     return await rule(context, **kwargs)
 
 
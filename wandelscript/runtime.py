@@ -18,7 +18,8 @@ from nova.actions.container import ActionLocation
 from nova.actions.io import CallAction, ReadAction, ReadJointsAction, ReadPoseAction, WriteAction
 from nova.actions.motions import Motion
 from nova.cell.robot_cell import AbstractRobot, Device, RobotCell
-from nova.types import MotionSettings, MotionState, Pose
+from nova.config import PLAN_AHEAD_SEGMENT_SIZE
+from nova.types import MotionSettings, MotionStateLike, Pose
 from wandelscript import exception as wsexception
 from wandelscript.datatypes import ElementType, Frame, as_builtin_type
 from wandelscript.exception import MotionError, NotPlannableError
@@ -126,7 +127,7 @@ class ExecutionContext:
     # Maps the motion group id to the list of recorded motion lists
     # Each motion list is a path the was planned separately
     # TODO: maybe we should make it public and helper methods to access the data
-    motion_group_recordings: list[list[MotionState]]
+    motion_group_recordings: list[list[MotionStateLike]]
 
     def __init__(  # pylint: disable=too-many-positional-arguments
         self,
@@ -137,6 +138,7 @@ class ExecutionContext:
         run_args: dict[str, ElementType] | None = None,
         foreign_functions: dict[str, ForeignFunction] | None = None,
         debug: bool = False,
+        plan_ahead_segment_size: int | None = None,
     ):
         self.motion_group_recordings = []
         self.robot_cell: RobotCell = robot_cell
@@ -167,6 +169,10 @@ class ExecutionContext:
         # this will be continuously updated by the metamodel when the program is executed
         self.location_in_code: wsexception.TextRange | None = None
         self.debug = debug
+        # Long motion blocks are executed segment by segment while the next segments are planned
+        self.plan_ahead_segment_size = (
+            PLAN_AHEAD_SEGMENT_SIZE if plan_ahead_segment_size is None else plan_ahead_segment_size
+        )
         # This holds references to the tasks created by asyncio.create_task() during program execution.
         # This is necessary because of https://docs.python.org/3/library/asyncio-task.html#asyncio.create_task only
         # creating weak references for the in the event loop
@@ -372,8 +378,8 @@ class ActionQueue:
         return not any(self._record.values())
 
     async def trigger_actions(
-        self, motion_iter: AsyncIterable[MotionState], actions: list[ActionLocation]
-    ) -> AsyncIterable[MotionState]:
+        self, motion_iter: AsyncIterable[MotionStateLike], actions: list[ActionLocation]
+    ) -> AsyncIterable[MotionStateLike]:
         actions = sorted(actions, key=lambda action: action.path_parameter)
         async for motion_state in motion_iter:
             if self._stop_event.is_set():
@@ -406,16 +412,23 @@ class ActionQueue:
                 motion_group = self._execution_context.get_motion_group(motion_group_id)
                 tcp = self._tcp.get(motion_group_id, None) or await motion_group.active_tcp_name()
 
-                # TODO: not only pass motions, do we need the CombinedActions anymore?
-                joint_trajectory = await motion_group.plan(
-                    actions=container.motions,
-                    tcp=tcp,
-                    start_joint_position=None,
-                    motion_group_setup=None,
-                )
-                motion_iter = motion_group.stream_execute(
-                    joint_trajectory=joint_trajectory, tcp=tcp, actions=container.motions
-                )
+                segment_size = self._execution_context.plan_ahead_segment_size
+                if segment_size > 0 and len(container.motions) > segment_size:
+                    # Start moving once the first segment is planned, the rest is planned meanwhile
+                    motion_iter = motion_group.stream_plan_and_execute(
+                        actions=container.motions, tcp=tcp, plan_ahead_segment_size=segment_size
+                    )
+                else:
+                    # TODO: not only pass motions, do we need the CombinedActions anymore?
+                    joint_trajectory = await motion_group.plan(
+                        actions=container.motions,
+                        tcp=tcp,
+                        start_joint_position=None,
+                        motion_group_setup=None,
+                    )
+                    motion_iter = motion_group.stream_execute(
+                        joint_trajectory=joint_trajectory, tcp=tcp, actions=container.motions
+                    )
                 planned_motions[motion_group_id] = self.trigger_actions(
                     motion_iter, container.actions.copy()
                 )
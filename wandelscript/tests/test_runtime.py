@@ -215,3 +215,25 @@ async def test_run():
     assert queue.last_pose(robot.id) == Pose((500, 0, 0, 0, 0, 0))
     assert queue._last_motions[robot.id] == motions[-1]
     assert len(queue._record) == 0
+
+
+@pytest.mark.asyncio
+async def test_run_plans_ahead_in_segments():
+    controller = SimulatedController()
+    robot = controller[0]
+    cell = RobotCell(controller=controller)
+    execution_context = ExecutionContext(cell, asyncio.Event(), plan_ahead_segment_size=2)
+    queue = ActionQueue(execution_context)
+    motions = [linear((100 * i, 0, 0, 0, 0, 0)) for i in range(1, 6)]
+    for motion in motions:
+        queue.push(motion, tool="Flange", motion_group_id=robot.id)
+
+    await queue._run()
+
+    assert robot.record_of_commands == [motions[:2], motions[2:4], motions[4:]]
+    assert (await robot.get_state("Flange")).pose == Pose((500, 0, 0, 0, 0, 0))
+    path_parameters = [
+        state.path_parameter for state in execution_context.motion_group_recordings[-1]
+    ]
+    assert path_parameters == sorted(path_parameters)
+    assert path_parameters[-1] == 5
@@ -1,3 +1,4 @@
+import numpy as np
 from geometricalgebra import cga3d
 
 from nova.types import Pose
@@ -34,5 +35,5 @@ def versor_to_pose(versor: cga3d.Vector) -> Pose:
     >>> versor_to_pose(v).to_tuple()
     (0.0, 0.0, 5.0, 0.0, 0.0, 1.0)
     """
-    pos_rot = versor.to_pos_and_rot_vector()
-    return Pose(tuple(pos_rot))
+    pos_rot = np.asarray(versor.to_pos_and_rot_vector(), dtype=float)
+    return Pose.from_trusted_tuple(pos_rot.tolist())